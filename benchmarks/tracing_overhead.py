@@ -0,0 +1,100 @@
+"""
+Overhead of the tracing layer.
+
+    python -m benchmarks.tracing_overhead [--repeat 5] [--trace trace.json]
+
+Runs every optimizer on the default problem with tracing disabled and enabled,
+measures the cost of a disabled span/traced call in isolation and estimates the share
+of the disabled instrumentation in the total run time.
+"""
+from core import optimizers
+from utils import ProblemSpec, ProblemFactory, InputWidgetConstants, tracer, traced
+import argparse
+import statistics
+import time
+import timeit
+from typing import Tuple
+import numpy as np
+
+
+def _time_run(optimizer, spec: ProblemSpec, repeat: int) -> float:
+    """Median wall time of solving the spec"""
+    times = []
+    for _ in range(repeat):
+        problem = ProblemFactory.build(spec)
+        start = time.perf_counter()
+        optimizer.optimize(problem)
+        times.append(time.perf_counter() - start)
+    return statistics.median(times)
+
+
+def _disabled_call_costs() -> Tuple[float, float]:
+    """
+    Extra seconds per instrumented call while tracing is disabled.
+    Returns:
+        Tuple: (inline `tracer.enabled` check of objective and iteration marks, @traced wrapper / tracer.span)
+    """
+    def plain(x):
+        return x
+
+    def inline(x):
+        start = time.perf_counter_ns() if tracer.enabled else None
+        try:
+            return x
+        finally:
+            if start is not None:
+                tracer.record("bench", "bench", start, time.perf_counter_ns())
+
+    def with_span(x):
+        with tracer.span("bench"):
+            return x
+
+    wrapped = traced("bench")(plain)
+    n = 1_000_000
+
+    def cost(func) -> float:
+        return min(timeit.repeat(lambda: func(1), number=n, repeat=5)) / n
+
+    base = cost(plain)
+    return max(cost(inline) - base, 0.0), max(cost(wrapped) - base, cost(with_span) - base, 0.0)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Tracing overhead benchmark")
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--trace", default=None, help="write a Chrome trace of the last method's traced run")
+    args = parser.parse_args()
+
+    spec = ProblemSpec(
+        func_str=InputWidgetConstants.DEFAULT_FUNC,
+        x_0=np.array([float(v) for v in InputWidgetConstants.DEFAULT_X0_STR.split(",")]),
+        epsilon=InputWidgetConstants.DEFAULT_EPS,
+        method_name="",
+        max_iter=InputWidgetConstants.DEFAULT_MAX_ITER
+    )
+    inline_cost, wrapper_cost = _disabled_call_costs()
+    print(f"disabled instrumentation cost: {inline_cost * 1e9:.1f} ns per objective call, "
+          f"{wrapper_cost * 1e9:.1f} ns per other span\n")
+    print(f"{'method':<28}{'off, s':>10}{'on, s':>10}{'spans':>10}{'est. off overhead':>20}")
+
+    summaries = {}
+    for name, optimizer in optimizers.items():
+        off = _time_run(optimizer, spec, args.repeat)
+        with tracer.recording():
+            on = _time_run(optimizer, spec, 1)
+        n_spans = len(tracer.spans)
+        # objective calls and iteration marks use inline checks, the rest wrappers/spans
+        n_inline = sum(1 for span in tracer.spans if span.category in ("objective", "iteration"))
+        overhead = (n_inline * inline_cost + (n_spans - n_inline) * wrapper_cost) / off
+        print(f"{name:<28}{off:>10.4f}{on:>10.4f}{n_spans:>10}{overhead:>19.3%}")
+        summaries[name] = tracer.format_summary()
+
+    for name, summary in summaries.items():
+        print(f"\n{name}\n{summary}")
+    if args.trace:
+        tracer.export_chrome_trace(args.trace)
+        print(f"\nChrome trace written to {args.trace}")
+
+
+if __name__ == "__main__":
+    main()
\ No newline at end of file
@@ -1,11 +1,41 @@
-from utils import IOptimizer
+from utils import IOptimizer, ILeastSquaresOptimizer, IStochasticOptimizer
 
 from .newton_method import NewtonMethod
+from .trust_region import TrustRegionNewton
 from .steepest_descent import SteepestDescent
+from .block_coordinate_descent import BlockCoordinateDescent
+from .powell_method import PowellMethod
+from .nelder_mead import NelderMead
+from .method_comparison import MethodComparison
+from .parameter_sweep import ParameterSweep
+from .auto_optimizer import AutoOptimizer
 
 from .line_searchers import FibonacciMethod
+from .least_squares import GaussNewton, LevenbergMarquardt
+from .stochastic import SGD, Adam
 
 optimizers: dict[str, IOptimizer] = {
     "Steepest Descent method": SteepestDescent(FibonacciMethod()),
-    "Newton method": NewtonMethod()
+    "Steepest Descent (Nesterov)": SteepestDescent(FibonacciMethod(), momentum="nesterov"),
+    "Steepest Descent (preconditioned Nesterov)": SteepestDescent(
+        FibonacciMethod(), momentum="nesterov", preconditioned=True
+    ),
+    "Newton method": NewtonMethod(),
+    "Trust-region Newton method": TrustRegionNewton(),
+    "Block coordinate descent": BlockCoordinateDescent(FibonacciMethod()),
+    "Powell method": PowellMethod(FibonacciMethod()),
+    "Nelder-Mead method": NelderMead(),
+    "Auto": AutoOptimizer()
+}
+
+least_squares_optimizers: dict[str, ILeastSquaresOptimizer] = {
+    "Gauss-Newton method": GaussNewton(),
+    "Levenberg-Marquardt method": LevenbergMarquardt()
+}
+
+stochastic_optimizers: dict[str, IStochasticOptimizer] = {
+    "SGD": SGD(),
+    "SGD with momentum": SGD(momentum=0.9),
+    "Adam": Adam(),
+    "SVRG": SGD(svrg=True)
 }
\ No newline at end of file
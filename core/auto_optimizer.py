@@ -0,0 +1,315 @@
+from utils import (
+    IOptimizer, SolutionStatus,
+    OptimizationProblem, OptimizationResult, ProblemProfile, ProblemFactory
+)
+from .steepest_descent import SteepestDescent
+from .trust_region import TrustRegionNewton
+from .powell_method import PowellMethod
+from .nelder_mead import NelderMead
+from .line_searchers import FibonacciMethod
+from dataclasses import replace
+from typing import Callable, List, Optional, Tuple
+import math
+import time
+import numpy as np
+
+
+class AutoOptimizer(IOptimizer):
+    """
+    Chooses the method for a problem by probing it first:
+    evaluation costs of f, ∇f and H, a conditioning estimate from gradient differences
+    and the smoothness of f along the gradient. The run proceeds in stages; a stage that
+    stalls or fails hands the current point over to the next method of the chain.
+    The choice and every switch are reported in OptimizationResult.message.
+    """
+    FIRST_ORDER = "Steepest Descent (Nesterov)"
+    SECOND_ORDER = "Trust-region Newton method"
+    POWELL = "Powell method"
+    NELDER_MEAD = "Nelder-Mead method"
+
+    def __init__(self, stage_iterations: int = 200, stall_factor: float = 10.0,
+                 nelder_mead_max_dim: int = 10) -> None:
+        """
+        Initialize AutoOptimizer.
+        Args:
+            stage_iterations (int):
+                Iterations after which the progress of the current method is checked.
+            stall_factor (float):
+                Minimal decrease of the gradient norm during a stage; less counts as a stall.
+            nelder_mead_max_dim (int):
+                Largest dimension for which Nelder-Mead is preferred over Powell's method.
+        """
+        self.stage_iterations = stage_iterations
+        self.stall_factor = stall_factor
+        self.nelder_mead_max_dim = nelder_mead_max_dim
+
+    def optimize(self, problem: OptimizationProblem) -> OptimizationResult:
+        """
+        Finds a local minimum of a multivariate objective function with the method expected
+        to be fastest for it. Checkpointing is not supported: stages are separate runs.
+        Args:
+            problem (OptimizationProblem):
+                Optimization problem definition containing the objective function,
+                its gradient and hessian, initial point, precision and stopping criteria.
+        Returns:
+            OptimizationResult:
+                Result of the last stage with the trajectory, gradient norms (one per iteration,
+                NaN where a derivative-free stage measured none) and iteration count of the whole run,
+                and a message describing the chosen methods.
+        """
+        if problem is None:
+            return OptimizationResult(
+                status=SolutionStatus.ERROR.value
+        )
+        # compile the vectorized objective once: probe measures it and the stages reuse it
+        problem = replace(problem, batch_obj_func=ProblemFactory.batch_objective(problem))
+        profile = self.probe(problem)
+        method_name, reason = self.choose(profile, problem.epsilon)
+        notes = [f"Chose {method_name}: {reason}"]
+
+        x = problem.x_0
+        trajectory = [] if problem.store_trajectory else None
+        grad_norms: List[float] = []
+        iter_count = 0
+        tried = [method_name]
+
+        while True:
+            optimizer = self._create(method_name, profile)
+            budget = min(self.stage_iterations, problem.max_iter - iter_count)
+            stage = replace(
+                problem,
+                x_0=x,
+                # optimizers stop once their count exceeds max_iter: the stage runs at most `budget` iterations
+                max_iter=budget - 1,
+                checkpointer=None,
+                callback=self._shifted_callback(problem.callback, iter_count)
+            )
+            result = optimizer.optimize(stage)
+            iter_count += result.iterations or 0
+            if result.trajectory is not None and trajectory is not None:
+                # the first point of a stage is the last point of the previous one
+                trajectory.extend(result.trajectory[1:] if trajectory else result.trajectory)
+            # one norm per iteration; derivative-free stages measure no gradient, their entries are NaN
+            stage_norms = result.grad_norms if result.grad_norms is not None \
+                else [math.nan] * ((result.iterations or 0) + 1)
+            if grad_norms:
+                if math.isnan(grad_norms[-1]):
+                    grad_norms[-1] = stage_norms[0]
+                stage_norms = stage_norms[1:]
+            grad_norms.extend(stage_norms)
+            if result.x_min is not None and np.all(np.isfinite(result.x_min)):
+                x = result.x_min
+
+            if result.status == SolutionStatus.OPTIMAL.value or iter_count >= problem.max_iter:
+                break
+            if result.status == SolutionStatus.MAX_ITERATIONS.value:
+                stalled, why = self._stalled(result)
+            else:
+                # the method gave up (stagnation, non-finite values): as good as a stall
+                stalled, why = True, f"ended with status {result.status}"
+            if stalled:
+                next_name = self._fallback(method_name, profile, tried)
+                if next_name is None:
+                    notes.append(f"{method_name} stalled ({why}), no other method left")
+                    break
+                notes.append(f"switched to {next_name} after {iter_count} iterations: {method_name} stalled ({why})")
+                method_name = next_name
+                tried.append(method_name)
+
+        return replace(
+            result,
+            iterations=iter_count,
+            trajectory=trajectory,
+            grad_norms=None if all(math.isnan(norm) for norm in grad_norms) else grad_norms,
+            message="; ".join(notes)
+        )
+
+    @staticmethod
+    def probe(problem: OptimizationProblem, seed: int = 0) -> ProblemProfile:
+        """
+        Measure the problem at x_0 with a handful of evaluations.
+        Args:
+            problem (OptimizationProblem): Problem to examine.
+            seed (int): Seed of the random probe directions.
+        Returns:
+            ProblemProfile: Evaluation costs, conditioning estimate and smoothness.
+        """
+        x = np.array(problem.x_0, dtype=float)
+        n = len(x)
+        obj_func, grad_func = problem.obj_func, problem.grad_func
+
+        # cost of f: repeat cheap functions until the timer resolution does not matter
+        calls, start = 0, time.perf_counter()
+        f_0 = obj_func(x)
+        calls += 1
+        while calls < 20 and time.perf_counter() - start < 1e-3:
+            obj_func(x)
+            calls += 1
+        func_time = (time.perf_counter() - start) / calls
+
+        start = time.perf_counter()
+        grad = grad_func(x)
+        grad_time = time.perf_counter() - start
+
+        # a numerical Hessian costs 4n² evaluations of f; measure it only when that is cheap
+        hess_time = 4 * n * n * func_time
+        if hess_time < 0.05:
+            start = time.perf_counter()
+            problem.hess_func(x)
+            hess_time = time.perf_counter() - start
+
+        if not (np.isfinite(f_0) and np.all(np.isfinite(grad))):
+            return ProblemProfile(n, func_time, grad_time, hess_time, math.inf, False, False)
+
+        # extreme curvatures: a few Lanczos steps with Hessian-vector products
+        # from gradient differences (∇f(x + h v) - ∇f(x)) / h
+        h = 1e-4 * (1 + np.linalg.norm(x) / np.sqrt(n))
+        ritz = AutoOptimizer._lanczos_ritz_values(
+            lambda v: (grad_func(x + h * v) - grad) / h,
+            np.random.default_rng(seed).standard_normal(n),
+            steps=min(n, 4 if n > 1000 else 8)
+        )
+        magnitudes = np.abs(ritz)
+        scale = float(np.max(magnitudes))
+        grad_norm = np.linalg.norm(grad)
+        if scale <= 1e-8 * (1 + grad_norm):
+            # no measurable curvature: f is locally linear
+            condition, indefinite = 1.0, False
+        else:
+            condition = scale / max(float(np.min(magnitudes)), scale * 1e-12)
+            indefinite = bool(np.min(ritz) < -1e-6 * scale)
+
+        # second differences along the gradient shrink 4x per halved step for smooth f
+        if grad_norm > 0:
+            d = grad / grad_norm
+        else:
+            d = np.zeros(n)
+            d[0] = 1.0
+        step = 1e-2 * (1 + np.linalg.norm(x) / np.sqrt(n))
+
+        def second_difference(t: float) -> float:
+            return obj_func(x + t * d) - 2 * f_0 + obj_func(x - t * d)
+
+        coarse, fine = second_difference(step), second_difference(step / 2)
+        if abs(coarse) <= 1e-10 * (1 + abs(f_0)):
+            # f is (locally) linear along d
+            smooth = True
+        else:
+            smooth = bool(np.isfinite(coarse) and np.isfinite(fine) and fine != 0
+                          and 3.0 <= coarse / fine <= 5.0)
+
+        batch_speedup = None
+        if problem.batch_obj_func is not None:
+            columns = np.repeat(x[:, np.newaxis], 8, axis=1)
+            start = time.perf_counter()
+            problem.batch_obj_func(columns)
+            batch_speedup = 8 * func_time / max(time.perf_counter() - start, 1e-9)
+
+        return ProblemProfile(n, func_time, grad_time, hess_time, condition, indefinite, smooth, batch_speedup)
+
+    @staticmethod
+    def _lanczos_ritz_values(hess_vec: Callable[[np.ndarray], np.ndarray], start: np.ndarray,
+                             steps: int) -> np.ndarray:
+        """
+        Ritz values of the Hessian from `steps` Lanczos iterations (with full reorthogonalization).
+        The extreme ones approach the extreme eigenvalues after a few steps.
+        """
+        basis = [start / np.linalg.norm(start)]
+        alphas, betas = [], []
+        for j in range(steps):
+            w = hess_vec(basis[j])
+            alphas.append(float(basis[j] @ w))
+            for q in basis:
+                w = w - (q @ w) * q
+            beta = float(np.linalg.norm(w))
+            if j == steps - 1 or beta <= 1e-10 * max(abs(alphas[-1]), 1.0):
+                break
+            betas.append(beta)
+            basis.append(w / beta)
+        T = np.diag(alphas) + np.diag(betas[:len(alphas) - 1], 1) + np.diag(betas[:len(alphas) - 1], -1)
+        return np.linalg.eigvalsh(T)
+
+    def choose(self, profile: ProblemProfile, epsilon: float) -> Tuple[str, str]:
+        """
+        Pick the method with the lowest estimated total time.
+        Args:
+            profile (ProblemProfile): Measurements of the problem.
+            epsilon (float): Required precision.
+        Returns:
+            Tuple: (method name, explanation)
+        """
+        n = profile.n
+        if not profile.smooth:
+            method = self.NELDER_MEAD if n <= self.nelder_mead_max_dim else self.POWELL
+            return method, f"f is not smooth along the gradient at x₀ (n = {n}), derivative-free search"
+
+        digits = max(math.log(1 / max(epsilon, 1e-300)), 1.0)
+        # Nesterov: ~sqrt(κ)·log(1/ε) iterations, each a gradient and a Fibonacci line search
+        line_search_evals = math.log(1 / max(epsilon, 1e-300)) / math.log((1 + math.sqrt(5)) / 2)
+        first_order = (math.sqrt(min(profile.condition, 1e12)) * digits + 10) * (
+            profile.grad_time + line_search_evals * profile.func_time
+        )
+        # trust-region Newton: a few dozen iterations; Steihaug-CG above 100 variables
+        # needs ~sqrt(κ) Hessian-vector products (one gradient each) instead of the Hessian
+        if n <= 100:
+            per_step = profile.hess_time + profile.grad_time
+        else:
+            per_step = (min(n, 2 * math.sqrt(min(profile.condition, 1e12))) + 2) * profile.grad_time
+        second_order = 25 * per_step
+
+        costs = f"estimated {first_order:.3g} s first-order vs {second_order:.3g} s second-order"
+        if profile.indefinite and second_order <= 10 * first_order:
+            return self.SECOND_ORDER, f"negative curvature at x₀, trust region handles it ({costs})"
+        if second_order < first_order:
+            return self.SECOND_ORDER, f"κ ≈ {profile.condition:.2g}, n = {n} ({costs})"
+        return self.FIRST_ORDER, f"κ ≈ {profile.condition:.2g}, n = {n} ({costs})"
+
+    def _create(self, method_name: str, profile: ProblemProfile) -> IOptimizer:
+        if method_name == self.FIRST_ORDER:
+            # batched line search pays off when 8 points in one call cost less than ~3 single calls
+            batched = profile.batch_speedup is not None and profile.batch_speedup > 8 / 3.1
+            return SteepestDescent(
+                FibonacciMethod(),
+                momentum="nesterov",
+                preconditioned=profile.condition > 100,
+                batch_points=8 if batched else 0
+            )
+        if method_name == self.SECOND_ORDER:
+            return TrustRegionNewton()
+        if method_name == self.POWELL:
+            return PowellMethod(FibonacciMethod())
+        return NelderMead()
+
+    def _fallback(self, method_name: str, profile: ProblemProfile, tried: List[str]) -> Optional[str]:
+        """Next method after a stall: gradient methods escalate, then derivative-free ones take over"""
+        derivative_free = (self.NELDER_MEAD if profile.n <= self.nelder_mead_max_dim else self.POWELL)
+        chains = {
+            self.FIRST_ORDER: [self.SECOND_ORDER, derivative_free],
+            self.SECOND_ORDER: [self.FIRST_ORDER, derivative_free],
+            self.NELDER_MEAD: [self.POWELL],
+            self.POWELL: [self.NELDER_MEAD],
+        }
+        for candidate in chains[method_name]:
+            if candidate not in tried:
+                return candidate
+        return None
+
+    def _stalled(self, result: OptimizationResult) -> Tuple[bool, str]:
+        """A stage stalls if the gradient norm (or for derivative-free methods, f) barely decreased"""
+        if result.grad_norms is not None and len(result.grad_norms) > 1:
+            ratio = result.grad_norms[0] / max(result.grad_norms[-1], 1e-300)
+            return ratio < self.stall_factor, f"‖∇f‖ decreased only {ratio:.3g}x"
+        if result.trajectory is not None and len(result.trajectory) > 1:
+            moved = float(np.linalg.norm(np.asarray(result.trajectory[-1]) - np.asarray(result.trajectory[0])))
+            return moved <= result.final_epsilon, f"moved only {moved:.3g}"
+        return False, ""
+
+    @staticmethod
+    def _shifted_callback(callback: Optional[Callable], offset: int) -> Optional[Callable]:
+        """Report iterations of later stages as a continuation of the earlier ones"""
+        if callback is None or offset == 0:
+            return callback
+
+        def shifted(state) -> None:
+            callback(replace(state, iteration=state.iteration + offset))
+        return shifted
\ No newline at end of file
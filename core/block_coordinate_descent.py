@@ -0,0 +1,245 @@
+from utils import (
+    IOptimizer, ILineSearch, SolutionStatus, ObjectiveTerms,
+    OptimizationProblem, OptimizationResult, OptimizerState, IterationHooks, ProblemFactory
+)
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, List, Optional, Sequence
+import math
+import numpy as np
+
+
+class BlockCoordinateDescent(IOptimizer):
+    """
+    Block coordinate descent for objectives that are sums of terms reading few variables.
+    Each block takes a steepest descent step in its own variables with a line search,
+    evaluating only the terms that read the block. Blocks that share no term do not interact:
+    they form one color of the block graph and are updated concurrently.
+    """
+    def __init__(self, line_searcher: ILineSearch, blocks: Optional[Sequence[Sequence[int]]] = None,
+                 max_block_size: int = 10, max_workers: Optional[int] = 1, h: float = 1e-8) -> None:
+        """
+        Initialize BlockCoordinateDescent.
+        Args:
+            line_searcher (ILineSearch):
+                Line search strategy used for the step size of every block.
+            blocks (Optional[Sequence[Sequence[int]]]):
+                Variable indices of every block. Detected from the expression by default:
+                variables that appear in a common term are grouped together. Variables outside
+                all blocks keep their initial values.
+            max_block_size (int):
+                Detected groups larger than this are cut into consecutive pieces.
+            max_workers (Optional[int]):
+                Threads updating the blocks of one color, None for the ThreadPoolExecutor default.
+                Pays off only when the terms release the GIL (large NumPy expressions).
+            h (float):
+                Finite difference step of the block gradients.
+        """
+        if max_block_size < 1:
+            raise ValueError("Block size must be a positive number of variables")
+        self.line_searcher = line_searcher
+        self.blocks = blocks
+        self.max_block_size = max_block_size
+        self.max_workers = max_workers
+        self.h = h
+
+    def _detect_blocks(self, indices: List[Optional[np.ndarray]], n: int) -> List[np.ndarray]:
+        """Connected components of the 'appear in a common term' graph, cut to max_block_size"""
+        if any(idx is None for idx in indices):
+            # a term reads the whole vector: every variable interacts with every other
+            return [np.arange(i, min(i + self.max_block_size, n)) for i in range(0, n, self.max_block_size)]
+        parent = list(range(n))
+
+        def find(i: int) -> int:
+            while parent[i] != i:
+                parent[i] = parent[parent[i]]
+                i = parent[i]
+            return i
+
+        used = np.zeros(n, dtype=bool)
+        for idx in indices:
+            used[idx] = True
+            root = find(int(idx[0]))
+            for i in idx[1:]:
+                parent[find(int(i))] = root
+        components = {}
+        for i in np.flatnonzero(used):
+            components.setdefault(find(int(i)), []).append(int(i))
+        blocks = []
+        for members in sorted(components.values()):
+            for start in range(0, len(members), self.max_block_size):
+                blocks.append(np.array(members[start:start + self.max_block_size]))
+        return blocks
+
+    @staticmethod
+    def _color_blocks(blocks: List[np.ndarray], block_terms: List[List[int]]) -> List[List[int]]:
+        """Greedy coloring: blocks of one color share no term, so their updates are independent"""
+        term_blocks = {}
+        for b, terms in enumerate(block_terms):
+            for k in terms:
+                term_blocks.setdefault(k, []).append(b)
+        colors = []
+        block_color = [-1] * len(blocks)
+        for b, terms in enumerate(block_terms):
+            taken = {block_color[other] for k in terms for other in term_blocks[k] if other != b}
+            color = next(c for c in range(len(colors) + 1) if c not in taken)
+            if color == len(colors):
+                colors.append([])
+            colors[color].append(b)
+            block_color[b] = color
+        return colors
+
+    @staticmethod
+    def _partial_objective(terms_sum: Callable[[np.ndarray], float]) -> Callable[[np.ndarray], float]:
+        """Sum of the terms reading a block; differs from f by the terms the block does not affect"""
+        def partial(x: np.ndarray) -> float:
+            try:
+                with np.errstate(all="ignore"):
+                    val = float(terms_sum(x))
+            except (ValueError, ZeroDivisionError, OverflowError, TypeError):
+                return float("inf")
+            return val if math.isfinite(val) else float("inf")
+        return partial
+
+    def optimize(self, problem: OptimizationProblem) -> OptimizationResult:
+        """
+        Finds a local minimum of a multivariate objective function.
+        Args:
+            problem (OptimizationProblem):
+                Optimization problem definition containing the objective function,
+                its terms, initial point, precision and stopping criteria.
+        Returns:
+            OptimizationResult:
+                Result of the optimization process, including the approximated minimizer,
+                function value and convergence information. The gradient norm of an iteration
+                combines the block gradients at the points where the blocks were updated.
+        """
+        if problem is None:
+            return OptimizationResult(
+                status=SolutionStatus.ERROR.value
+        )
+        obj_func = problem.obj_func
+        eps = problem.epsilon
+        max_iter = problem.max_iter
+        store_trajectory = problem.store_trajectory
+        n = len(problem.x_0)
+        # without an analyzed expression the whole objective is the only term
+        terms = (ProblemFactory.objective_terms(problem)
+                 or ObjectiveTerms(indices=[None], combine=lambda selected: obj_func))
+
+        if self.blocks is not None:
+            blocks = [np.unique(np.asarray(block, dtype=int)) for block in self.blocks]
+            if any(len(block) == 0 or block[0] < 0 or block[-1] >= n for block in blocks):
+                raise ValueError(f"Blocks must be non-empty lists of indices in [0, {n})")
+        else:
+            blocks = self._detect_blocks(terms.indices, n)
+        block_terms = [
+            [k for k, idx in enumerate(terms.indices) if idx is None or np.intersect1d(idx, block).size]
+            for block in blocks
+        ]
+        partials = [self._partial_objective(terms.combine(ks)) for ks in block_terms]
+        colors = self._color_blocks(blocks, block_terms)
+        # a block below this gradient norm is skipped; all blocks below it mean ‖∇f‖ <= eps
+        block_eps = eps / math.sqrt(max(len(blocks), 1))
+
+        state = IterationHooks.resume(problem, type(self).__name__)
+        if state is not None:
+            # continue exactly where the stored run stopped
+            x = state.x
+            grad = state.grad
+            trajectory = state.trajectory
+            grad_norms = state.grad_norms
+            iter_count = state.iteration
+        else:
+            x = problem.x_0.copy()
+            grad = np.zeros_like(x)
+            for b in range(len(blocks)):
+                grad[blocks[b]] = self._block_gradient(partials[b], x, blocks[b])
+            trajectory = [x.copy()] if store_trajectory else []
+            iter_count = 0
+            grad_norms = [float(np.linalg.norm(grad))]
+        grad_norm = grad_norms[-1]
+
+        def update_block(b: int) -> None:
+            idx, partial = blocks[b], partials[b]
+            # x is shared: blocks of one color read and write disjoint coordinates
+            g = self._block_gradient(partial, x, idx)
+            grad[idx] = g
+            if np.linalg.norm(g) <= block_eps:
+                return
+            x_block = x[idx].copy()
+
+            def phi(lmbda: float) -> float:
+                x[idx] = x_block - lmbda * g
+                return partial(x)
+
+            lmbda = self.line_searcher.search(
+                phi=phi,
+                interval=(0.0, 1.0),
+                epsilon=eps
+            )
+            x[idx] = x_block - lmbda * g
+
+        parallel = self.max_workers != 1 and any(len(color) > 1 for color in colors)
+        executor = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="block") if parallel else None
+        try:
+            while grad_norm > eps:
+                if iter_count > max_iter:
+                    return IterationHooks.finish(problem, OptimizationResult(
+                        x_min=x,
+                        value=obj_func(x),
+                        iterations=iter_count,
+                        final_epsilon=grad_norm,
+                        trajectory=trajectory if store_trajectory else None,
+                        status=SolutionStatus.MAX_ITERATIONS.value,
+                        grad_norms=grad_norms
+                    ))
+                for color in colors:
+                    if executor is not None and len(color) > 1:
+                        # list() re-raises the first exception of a block
+                        list(executor.map(update_block, color))
+                    else:
+                        for b in color:
+                            update_block(b)
+
+                grad_norm = float(np.linalg.norm(grad))
+                if store_trajectory:
+                    trajectory.append(x.copy())
+                grad_norms.append(grad_norm)
+                iter_count += 1
+
+                IterationHooks.notify(problem, OptimizerState(
+                    method_name=type(self).__name__,
+                    iteration=iter_count,
+                    x=x,
+                    grad=grad,
+                    trajectory=trajectory,
+                    grad_norms=grad_norms
+                ))
+        finally:
+            if executor is not None:
+                executor.shutdown()
+
+        return IterationHooks.finish(problem, OptimizationResult(
+            x_min=x,
+            value=obj_func(x),
+            iterations=iter_count,
+            final_epsilon=grad_norm,
+            trajectory=trajectory if store_trajectory else None,
+            status=SolutionStatus.OPTIMAL.value,
+            grad_norms=grad_norms
+        ))
+
+    def _block_gradient(self, partial: Callable[[np.ndarray], float], x: np.ndarray,
+                        idx: np.ndarray) -> np.ndarray:
+        """Central differences of the block's terms in the block's coordinates only (x is restored)"""
+        step = ProblemFactory._difference_step(self.h, x.dtype, 3)
+        g = np.zeros(len(idx), dtype=x.dtype)
+        for j, i in enumerate(idx):
+            x_i = x[i]
+            x[i] = x_i + step
+            f_plus = partial(x)
+            x[i] = x_i - step
+            f_minus = partial(x)
+            x[i] = x_i
+            g[j] = (f_plus - f_minus) / (2 * step)
+        return g
\ No newline at end of file
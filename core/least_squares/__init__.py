@@ -0,0 +1,2 @@
+from .gauss_newton import GaussNewton
+from .levenberg_marquardt import LevenbergMarquardt
\ No newline at end of file
@@ -0,0 +1,127 @@
+from utils import (
+    ILeastSquaresOptimizer, SolutionStatus,
+    LeastSquaresProblem, OptimizationResult, OptimizerState, IterationHooks, tracer
+)
+from .normal_equations import ChunkedNormalEquations
+import numpy as np
+
+
+class GaussNewton(ILeastSquaresOptimizer):
+    """
+    Gauss-Newton method for nonlinear least squares.
+    Approximates the Hessian of S(x) = Σ r_i(x)² by 2JᵀJ, so only the Jacobian is needed.
+    """
+    # relative step below the forward-difference Jacobian accuracy (√machine eps)
+    _STAGNATION = np.sqrt(np.finfo(float).eps)
+
+    def __init__(self, max_halvings: int = 30) -> None:
+        """
+        Initialize GaussNewton.
+        Args:
+            max_halvings (int): Maximum number of step halvings when a full step increases S(x).
+        """
+        self.max_halvings = max_halvings
+
+    def optimize(self, problem: LeastSquaresProblem) -> OptimizationResult:
+        """
+        Finds a local minimum of the sum of squared residuals.
+        Args:
+            problem (LeastSquaresProblem):
+                Least-squares problem definition containing the residual function, dataset,
+                initial point, precision and stopping criteria.
+        Returns:
+            OptimizationResult:
+                Result of the optimization process, including the approximated minimizer,
+                sum of squares and convergence information.
+        """
+        if problem is None:
+            return OptimizationResult(
+                status=SolutionStatus.ERROR.value
+        )
+        equations = ChunkedNormalEquations(problem)
+        eps = problem.epsilon
+        max_iter = problem.max_iter
+        store_trajectory = problem.store_trajectory
+
+        state = IterationHooks.resume(problem, type(self).__name__)
+        if state is not None:
+            # continue exactly where the stored run stopped (the normal equations are recomputed at x)
+            x = state.x
+            trajectory = state.trajectory
+            grad_norms = state.grad_norms
+            iter_count = state.iteration
+        else:
+            x = problem.x_0.copy()
+            trajectory = [x.copy()] if store_trajectory else []
+            grad_norms = []
+            iter_count = 0
+        cost, JtJ, Jtr = equations.evaluate(x)
+        grad_norm = np.linalg.norm(2 * Jtr)
+        if state is None:
+            grad_norms.append(float(grad_norm))
+
+        while grad_norm > eps:
+            if iter_count > max_iter:
+                return IterationHooks.finish(problem, OptimizationResult(
+                    x_min=x,
+                    value=cost,
+                    iterations=iter_count,
+                    final_epsilon=grad_norm,
+                    trajectory=trajectory if store_trajectory else None,
+                    status=SolutionStatus.MAX_ITERATIONS.value,
+                    grad_norms=grad_norms
+                ))
+            # Gauss-Newton step: JᵀJ · Δx = -Jᵀr
+            with tracer.span("gauss_newton.linear_solve", "linear_solve"):
+                delta_x = np.linalg.lstsq(JtJ, -Jtr, rcond=None)[0]
+            if np.linalg.norm(delta_x) <= self._STAGNATION * (np.linalg.norm(x) + eps):
+                # step stagnated: gradient is at the level of the Jacobian approximation noise
+                break
+
+            # damp the step until the sum of squares decreases
+            step = 1.0
+            for _ in range(self.max_halvings):
+                new_cost = equations.cost(x + step * delta_x)
+                if new_cost < cost:
+                    break
+                step /= 2
+            else:
+                return IterationHooks.finish(problem, OptimizationResult(
+                    x_min=x,
+                    value=cost,
+                    iterations=iter_count,
+                    final_epsilon=grad_norm,
+                    trajectory=trajectory if store_trajectory else None,
+                    status=SolutionStatus.NOT_CONVERGED.value,
+                    grad_norms=grad_norms
+                ))
+            # update x
+            x = x + step * delta_x
+            cost, JtJ, Jtr = equations.evaluate(x)
+            grad_norm = np.linalg.norm(2 * Jtr)
+
+            if store_trajectory:
+                trajectory.append(x.copy())
+            grad_norms.append(float(grad_norm))
+            iter_count += 1
+
+            IterationHooks.notify(problem, OptimizerState(
+                method_name=type(self).__name__,
+                iteration=iter_count,
+                x=x,
+                grad=2 * Jtr,
+                trajectory=trajectory,
+                grad_norms=grad_norms
+            ))
+
+        return IterationHooks.finish(problem, OptimizationResult(
+            x_min=x,
+            value=cost,
+            iterations=iter_count,
+            final_epsilon=grad_norm,
+            trajectory=trajectory if store_trajectory else None,
+            # a stagnated step ends the loop early: converged only if the gradient is small enough
+            status=(SolutionStatus.OPTIMAL.value if grad_norm <= eps
+                    else SolutionStatus.NOT_CONVERGED.value),
+            grad_norms=grad_norms
+        ))
\ No newline at end of file
@@ -0,0 +1,143 @@
+from utils import (
+    ILeastSquaresOptimizer, SolutionStatus,
+    LeastSquaresProblem, OptimizationResult, OptimizerState, IterationHooks, tracer
+)
+from .normal_equations import ChunkedNormalEquations
+import numpy as np
+
+
+class LevenbergMarquardt(ILeastSquaresOptimizer):
+    """
+    Levenberg-Marquardt method for nonlinear least squares.
+    Interpolates between Gauss-Newton and scaled gradient descent with damping μ,
+    adapted from the ratio of actual to predicted reduction of S(x).
+    """
+    # relative step below the forward-difference Jacobian accuracy (√machine eps)
+    _STAGNATION = np.sqrt(np.finfo(float).eps)
+
+    def __init__(self, mu_0: float = 1e-3, max_mu: float = 1e16) -> None:
+        """
+        Initialize LevenbergMarquardt.
+        Args:
+            mu_0 (float): Initial damping relative to the largest diagonal entry of JᵀJ.
+            max_mu (float): Damping at which the method gives up (no descent step exists numerically).
+        """
+        self.mu_0 = mu_0
+        self.max_mu = max_mu
+
+    def optimize(self, problem: LeastSquaresProblem) -> OptimizationResult:
+        """
+        Finds a local minimum of the sum of squared residuals.
+        Args:
+            problem (LeastSquaresProblem):
+                Least-squares problem definition containing the residual function, dataset,
+                initial point, precision and stopping criteria.
+        Returns:
+            OptimizationResult:
+                Result of the optimization process, including the approximated minimizer,
+                sum of squares and convergence information.
+        """
+        if problem is None:
+            return OptimizationResult(
+                status=SolutionStatus.ERROR.value
+        )
+        equations = ChunkedNormalEquations(problem)
+        eps = problem.epsilon
+        max_iter = problem.max_iter
+        store_trajectory = problem.store_trajectory
+
+        state = IterationHooks.resume(problem, type(self).__name__)
+        if state is not None:
+            # continue exactly where the stored run stopped (the normal equations are recomputed at x)
+            x = state.x
+            trajectory = state.trajectory
+            grad_norms = state.grad_norms
+            iter_count = state.iteration
+            cost, JtJ, Jtr = equations.evaluate(x)
+            mu = float(state.extras["mu"])
+        else:
+            x = problem.x_0.copy()
+            trajectory = [x.copy()] if store_trajectory else []
+            iter_count = 0
+            cost, JtJ, Jtr = equations.evaluate(x)
+            mu = self.mu_0 * max(float(np.max(np.diag(JtJ))), 1.0)
+            grad_norms = [float(np.linalg.norm(2 * Jtr))]
+        grad_norm = np.linalg.norm(2 * Jtr)
+        # an iteration ends with an accepted step, which resets nu
+        nu = 2.0
+        last_accepted = True
+
+        while grad_norm > eps:
+            if iter_count > max_iter:
+                return IterationHooks.finish(problem, OptimizationResult(
+                    x_min=x,
+                    value=cost,
+                    iterations=iter_count,
+                    final_epsilon=grad_norm,
+                    trajectory=trajectory if store_trajectory else None,
+                    status=SolutionStatus.MAX_ITERATIONS.value,
+                    grad_norms=grad_norms
+                ))
+            if mu > self.max_mu:
+                return IterationHooks.finish(problem, OptimizationResult(
+                    x_min=x,
+                    value=cost,
+                    iterations=iter_count,
+                    final_epsilon=grad_norm,
+                    trajectory=trajectory if store_trajectory else None,
+                    status=SolutionStatus.NOT_CONVERGED.value,
+                    grad_norms=grad_norms
+                ))
+            # damped step: (JᵀJ + μ·diag(JᵀJ)) · Δx = -Jᵀr
+            scale = np.maximum(np.diag(JtJ), np.finfo(float).eps)
+            with tracer.span("levenberg_marquardt.linear_solve", "linear_solve"):
+                delta_x = np.linalg.solve(JtJ + mu * np.diag(scale), -Jtr)
+            if last_accepted and np.linalg.norm(delta_x) <= self._STAGNATION * (np.linalg.norm(x) + eps):
+                # step stagnated: gradient is at the level of the Jacobian approximation noise
+                break
+
+            new_cost = equations.cost(x + delta_x)
+            # predicted reduction of the linear model: -2Δxᵀ Jᵀr - Δxᵀ JᵀJ Δx
+            predicted = -(2 * delta_x @ Jtr + delta_x @ JtJ @ delta_x)
+            rho = (cost - new_cost) / predicted if predicted > 0 else -1.0
+
+            if rho > 0:
+                # accept the step, move towards Gauss-Newton
+                x = x + delta_x
+                cost, JtJ, Jtr = equations.evaluate(x)
+                grad_norm = np.linalg.norm(2 * Jtr)
+                mu *= max(1 / 3, 1 - (2 * rho - 1) ** 3)
+                nu = 2.0
+                last_accepted = True
+
+                if store_trajectory:
+                    trajectory.append(x.copy())
+                grad_norms.append(float(grad_norm))
+                iter_count += 1
+
+                IterationHooks.notify(problem, OptimizerState(
+                    method_name=type(self).__name__,
+                    iteration=iter_count,
+                    x=x,
+                    grad=2 * Jtr,
+                    trajectory=trajectory,
+                    grad_norms=grad_norms,
+                    extras={"mu": np.array(mu)}
+                ))
+            else:
+                # reject the step, move towards gradient descent
+                mu *= nu
+                nu *= 2
+                last_accepted = False
+
+        return IterationHooks.finish(problem, OptimizationResult(
+            x_min=x,
+            value=cost,
+            iterations=iter_count,
+            final_epsilon=grad_norm,
+            trajectory=trajectory if store_trajectory else None,
+            # a stagnated step ends the loop early: converged only if the gradient is small enough
+            status=(SolutionStatus.OPTIMAL.value if grad_norm <= eps
+                    else SolutionStatus.NOT_CONVERGED.value),
+            grad_norms=grad_norms
+        ))
\ No newline at end of file
@@ -0,0 +1,61 @@
+from utils import LeastSquaresProblem, traced
+from typing import Tuple
+import numpy as np
+
+
+class ChunkedNormalEquations:
+    """
+    Accumulates the sum of squares S(x) = Σ r_i(x)², the Gauss-Newton matrix JᵀJ and Jᵀr
+    chunk by chunk, so that the dataset and the Jacobian never have to fit in memory at once.
+    """
+    def __init__(self, problem: LeastSquaresProblem) -> None:
+        """
+        Initialize ChunkedNormalEquations.
+        Args:
+            problem (LeastSquaresProblem): Least-squares problem with residuals and dataset.
+        """
+        self.residual_func = problem.residual_func
+        self.data = problem.data
+        self.chunk_size = max(1, problem.chunk_size)
+
+    def _chunks(self):
+        """Yield consecutive row blocks of the dataset (views into the memory map)"""
+        for start in range(0, len(self.data), self.chunk_size):
+            yield np.asarray(self.data[start:start + self.chunk_size])
+
+    def cost(self, x: np.ndarray) -> float:
+        """Sum of squared residuals S(x)"""
+        total = 0.0
+        for chunk in self._chunks():
+            r = self.residual_func(x, chunk)
+            total += float(r @ r)
+        return total
+
+    @traced("least_squares.normal_equations", "derivative")
+    def evaluate(self, x: np.ndarray) -> Tuple[float, np.ndarray, np.ndarray]:
+        """
+        Compute S(x), JᵀJ and Jᵀr in one pass over the data.
+        The Jacobian of each chunk is approximated by forward differences,
+        i.e. n + 1 vectorized residual evaluations per chunk.
+        Args:
+            x (np.ndarray): Current parameters.
+        Returns:
+            Tuple: (S(x), JᵀJ of shape (n, n), Jᵀr of shape (n,))
+        """
+        n = len(x)
+        steps = np.sqrt(np.finfo(float).eps) * np.maximum(1.0, np.abs(x))
+        total = 0.0
+        JtJ = np.zeros((n, n))
+        Jtr = np.zeros(n)
+
+        for chunk in self._chunks():
+            r = self.residual_func(x, chunk)
+            J = np.empty((len(r), n))
+            for j in range(n):
+                x_step = x.copy()
+                x_step[j] += steps[j]
+                J[:, j] = (self.residual_func(x_step, chunk) - r) / steps[j]
+            total += float(r @ r)
+            JtJ += J.T @ J
+            Jtr += J.T @ r
+        return total, JtJ, Jtr
\ No newline at end of file
@@ -1,11 +1,44 @@
 from utils import (
-    ILineSearch, OptimizationResult, SolutionStatus
+    ILineSearch, OptimizationResult, SolutionStatus, traced
 )
 from typing import Callable, Tuple, List
+from bisect import bisect_left
+import math
+import threading
+import numpy as np
+
+
+# Fibonacci numbers and ratios F[k-1] / F[k] shared by all searches.
+# A schedule only depends on N, the first index with F[N] >= L / epsilon, so every (L, epsilon)
+# pair reuses the same precomputed table; it grows (rarely) under a lock.
+_FIB: List[int] = [1, 1]
+_RATIOS: List[float] = [0.0, 1.0]
+_FIB_LOCK = threading.Lock()
+
+
+def _fibonacci_schedule(L: float, epsilon: float) -> int:
+    """
+    Number of Fibonacci steps N for interval length L and precision epsilon,
+    extending the shared tables when needed.
+    """
+    target = L / epsilon
+    if _FIB[-1] < target:
+        with _FIB_LOCK:
+            while _FIB[-1] < target:
+                # ratio first: a reader that sees F[N] can always use ratio N
+                following = _FIB[-1] + _FIB[-2]
+                _RATIOS.append(_FIB[-1] / following)
+                _FIB.append(following)
+    return bisect_left(_FIB, target, lo=1)
+
+
+# covers L / epsilon up to 1e18, so searches normally never take the lock
+_fibonacci_schedule(1.0, 1e-18)
 
 
 class FibonacciMethod(ILineSearch):
     """Implementation of fibonacci method for single-variable optimization"""
+    @traced("fibonacci.search", "line_search")
     def search(self, phi: Callable[[float], float],
         interval: tuple[float, float], epsilon: float) -> float:
         """
@@ -20,12 +53,13 @@ class FibonacciMethod(ILineSearch):
         """
         a, b = interval
         L = b - a
-        FIB, N = self._calculate_N_fibonacci(L, epsilon)
+        N = _fibonacci_schedule(L, epsilon)
+        ratios = _RATIOS
 
         iterations = 0
 
-        x1 = b - FIB[N - 1] / FIB[N] * L
-        x2 = a + FIB[N - 1] / FIB[N] * L
+        x1 = b - ratios[N] * L
+        x2 = a + ratios[N] * L
         f1 = phi(x1)
         f2 = phi(x2)
 
@@ -35,14 +69,14 @@ class FibonacciMethod(ILineSearch):
                 x2 = x1
                 f2 = f1
                 L = b - a
-                x1 = b - FIB[N - 2] / FIB[N - 1] * L
+                x1 = b - ratios[N - 1] * L
                 f1 = phi(x1)
             else:
                 a = x1
                 x1 = x2
                 f1 = f2
                 L = b - a
-                x2 = a + FIB[N - 2] / FIB[N - 1] * L
+                x2 = a + ratios[N - 1] * L
                 f2 = phi(x2)
 
             N -= 1
@@ -51,19 +85,37 @@ class FibonacciMethod(ILineSearch):
         # N == 3
         x_min = (x1 + x2) / 2
         return x_min
-    
-    def _calculate_N_fibonacci(self, L: float, epsilon: float = 0.001) -> Tuple[List[int], int]:
+
+    @traced("fibonacci.search_batch", "line_search")
+    def search_batch(self, phi_batch: Callable[[np.ndarray], np.ndarray],
+                     interval: tuple[float, float], epsilon: float, points: int = 8) -> float:
         """
-        Calculate first N fibonacci numbers.
+        Multi-point search: every round evaluates φ at `points` equally spaced interior λ
+        in one call and keeps the two cells around the best one, shrinking the interval
+        by (points + 1) / 2 per round instead of the golden ratio of sequential search.
         Args:
-            L (float): the length of the interval (a, b)
-            epsilon (float): desired method pricision.
+            phi_batch (Callable[[np.ndarray], np.ndarray]): φ evaluated at a vector of λ values.
+            interval (tuple[float, float]): Initial uncertainty interval (a, b).
+            epsilon (float): Required final interval length.
+            points (int): Number of λ values per round, at least 2.
         Returns:
-            Tuple: (List of the first N Fibonacci numbers,
-                    Number of Fibonacci nambers)
+            float: Approximate minimizer λ of φ(λ).
+        Raises:
+            ValueError: If points < 2 (one interior point does not shrink the interval).
         """
-        fib = [1, 1]
-        while fib[-1] < L / epsilon:
-            fib.append(fib[-1] + fib[-2])
-        N = len(fib) - 1
-        return fib, N
\ No newline at end of file
+        if points < 2:
+            raise ValueError("Multi-point search needs at least 2 points per round")
+        a, b = interval
+        # stop at the final interval of the sequential search, so λ has the same precision
+        N = _fibonacci_schedule(b - a, epsilon)
+        # rounds needed to shrink the interval by F[N] / F[3], like N - 3 sequential steps;
+        # counted rather than tested on b - a, which stops shrinking at the float spacing
+        shrink = _FIB[N] / _FIB[min(N, 3)]
+        rounds = math.ceil(math.log(shrink) / math.log((points + 1) / 2)) if shrink > 1 else 0
+        for _ in range(rounds):
+            grid = np.linspace(a, b, points + 2)
+            j = int(np.argmin(phi_batch(grid[1:-1]))) + 1
+            if grid[j + 1] - grid[j - 1] >= b - a:
+                break
+            a, b = grid[j - 1], grid[j + 1]
+        return (a + b) / 2
\ No newline at end of file
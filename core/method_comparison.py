@@ -0,0 +1,95 @@
+from utils import (
+    IOptimizer, ProblemSpec, ProblemFactory, ComparisonEntry, SharedArrayPool
+)
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import replace
+from typing import Dict, List, Optional, Iterable
+import time
+
+
+def _run_method(method_name: str, optimizer: IOptimizer, spec: ProblemSpec,
+                result_names: Optional[List[str]] = None) -> ComparisonEntry:
+    """
+    Compile the spec and run a single optimizer on it (executed in a worker process).
+    Args:
+        method_name (str): Name of the optimizer, used to label the entry.
+        optimizer (IOptimizer): Optimizer instance to run.
+        spec (ProblemSpec): Serializable problem description.
+        result_names (Optional[List[str]]): Reserved shared memory segments for the result arrays,
+            None to return them pickled.
+    Returns:
+        ComparisonEntry: Optimization result with wall time and evaluation counts.
+    """
+    problem = ProblemFactory.build(replace(spec, method_name=method_name))
+    problem, counts = ProblemFactory.with_counters(problem)
+
+    start = time.perf_counter()
+    result = optimizer.optimize(problem)
+    wall_time = time.perf_counter() - start
+    if result_names is not None:
+        result = SharedArrayPool.export_result(result, result_names)
+
+    return ComparisonEntry(
+        method_name=method_name,
+        result=result,
+        wall_time=wall_time,
+        counts=counts
+    )
+
+
+class MethodComparison:
+    """
+    Runs several optimizers on the same problem concurrently in worker processes.
+    By default x_0 and the result arrays (x_min, trajectory, gradient norms) travel through
+    shared memory, so only small descriptors are pickled.
+    """
+    def __init__(self, optimizers: Dict[str, IOptimizer], max_workers: Optional[int] = None,
+                 shared_memory: bool = True) -> None:
+        """
+        Initialize MethodComparison.
+        Args:
+            optimizers (Dict[str, IOptimizer]): Available optimizers by name.
+            max_workers (Optional[int]): Size of the process pool, defaults to one worker per method.
+            shared_memory (bool): Exchange arrays through shared memory segments instead of pickling.
+        """
+        self.optimizers = optimizers
+        self.max_workers = max_workers
+        self.shared_memory = shared_memory
+
+    def compare(self, spec: ProblemSpec,
+                method_names: Optional[Iterable[str]] = None) -> List[ComparisonEntry]:
+        """
+        Solve the same problem with every selected optimizer.
+        Args:
+            spec (ProblemSpec): Serializable problem description (method_name is ignored).
+            method_names (Optional[Iterable[str]]): Subset of optimizers to run, all by default.
+        Returns:
+            List[ComparisonEntry]: One entry per method, in the order the methods were given.
+        """
+        names = list(method_names) if method_names is not None else list(self.optimizers)
+        unknown = [name for name in names if name not in self.optimizers]
+        if unknown:
+            raise ValueError(f"Optimizer(s) not found: {', '.join(unknown)}")
+        if not names:
+            return []
+
+        workers = self.max_workers or len(names)
+        if not self.shared_memory:
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                futures = [
+                    executor.submit(_run_method, name, self.optimizers[name], spec)
+                    for name in names
+                ]
+                return [future.result() for future in futures]
+
+        # segments a crashed worker leaves behind are unlinked when the pool closes
+        with SharedArrayPool() as pool:
+            shared_spec = replace(spec, x_0=pool.put(spec.x_0))
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                futures = [
+                    executor.submit(_run_method, name, self.optimizers[name], shared_spec,
+                                    pool.reserve(len(SharedArrayPool.RESULT_FIELDS)))
+                    for name in names
+                ]
+                entries = [future.result() for future in futures]
+            return [replace(entry, result=SharedArrayPool.import_result(entry.result)) for entry in entries]
\ No newline at end of file
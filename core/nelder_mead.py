@@ -0,0 +1,131 @@
+from utils import (
+    IOptimizer, SolutionStatus,
+    OptimizationProblem, OptimizationResult, OptimizerState, IterationHooks
+)
+import numpy as np
+
+
+class NelderMead(IOptimizer):
+    """
+    Nelder-Mead simplex method with adaptive parameters (Gao & Han, 2012).
+    Derivative-free: an iteration costs one or two objective calls (n + 1 when the simplex shrinks).
+    """
+    def __init__(self, initial_step: float = 0.05, zero_step: float = 0.00025) -> None:
+        """
+        Initialize NelderMead.
+        Args:
+            initial_step (float): Relative size of the initial simplex along non-zero coordinates of x_0.
+            zero_step (float): Absolute size of the initial simplex along zero coordinates of x_0.
+        """
+        self.initial_step = initial_step
+        self.zero_step = zero_step
+
+    def optimize(self, problem: OptimizationProblem) -> OptimizationResult:
+        """
+        Finds a local minimum of a multivariate objective function without derivatives.
+        Args:
+            problem (OptimizationProblem):
+                Optimization problem definition containing the objective function,
+                initial point, precision and stopping criteria.
+        Returns:
+            OptimizationResult:
+                Result of the optimization process, including the approximated minimizer,
+                function value and convergence information. final_epsilon is the simplex
+                diameter, since no gradient is evaluated.
+        """
+        if problem is None:
+            return OptimizationResult(
+                status=SolutionStatus.ERROR.value
+        )
+        obj_func = problem.obj_func
+        eps = problem.epsilon
+        max_iter = problem.max_iter
+        store_trajectory = problem.store_trajectory
+
+        n = len(problem.x_0)
+        # adaptive coefficients: reflection, expansion, contraction, shrink
+        alpha, beta = 1.0, 1.0 + 2.0 / n
+        # (shrink is kept at the classic 0.5 for n = 1, where 1 - 1/n would collapse the simplex)
+        gamma, delta = 0.75 - 1.0 / (2 * n), max(1.0 - 1.0 / n, 0.5)
+
+        state = IterationHooks.resume(problem, type(self).__name__)
+        if state is not None:
+            # continue exactly where the stored run stopped
+            simplex = state.extras["simplex"]
+            values = state.extras["values"]
+            trajectory = state.trajectory
+            iter_count = state.iteration
+        else:
+            x_0 = problem.x_0.copy()
+            simplex = np.repeat(x_0[np.newaxis, :], n + 1, axis=0)
+            for i in range(n):
+                simplex[i + 1, i] = (x_0[i] * (1 + self.initial_step)
+                                     if x_0[i] != 0 else self.zero_step)
+            values = np.array([obj_func(vertex) for vertex in simplex])
+            trajectory = [x_0.copy()] if store_trajectory else []
+            iter_count = 0
+
+        while True:
+            order = np.argsort(values, kind="stable")
+            simplex, values = simplex[order], values[order]
+            diameter = float(np.max(np.abs(simplex[1:] - simplex[0])))
+            if diameter <= eps and values[-1] - values[0] <= eps:
+                status = SolutionStatus.OPTIMAL.value
+                break
+            if iter_count > max_iter:
+                status = SolutionStatus.MAX_ITERATIONS.value
+                break
+
+            centroid = simplex[:-1].mean(axis=0)
+            worst = simplex[-1]
+
+            x_r = centroid + alpha * (centroid - worst)
+            f_r = obj_func(x_r)
+            if f_r < values[0]:
+                x_e = centroid + beta * (x_r - centroid)
+                f_e = obj_func(x_e)
+                if f_e < f_r:
+                    simplex[-1], values[-1] = x_e, f_e
+                else:
+                    simplex[-1], values[-1] = x_r, f_r
+            elif f_r < values[-2]:
+                simplex[-1], values[-1] = x_r, f_r
+            else:
+                if f_r < values[-1]:
+                    # outside contraction
+                    x_c = centroid + gamma * (x_r - centroid)
+                    f_c = obj_func(x_c)
+                    accepted = f_c <= f_r
+                else:
+                    # inside contraction
+                    x_c = centroid + gamma * (worst - centroid)
+                    f_c = obj_func(x_c)
+                    accepted = f_c < values[-1]
+                if accepted:
+                    simplex[-1], values[-1] = x_c, f_c
+                else:
+                    # shrink towards the best vertex
+                    simplex[1:] = simplex[0] + delta * (simplex[1:] - simplex[0])
+                    values[1:] = [obj_func(vertex) for vertex in simplex[1:]]
+
+            iter_count += 1
+            best = simplex[int(np.argmin(values))]
+            if store_trajectory:
+                trajectory.append(best.copy())
+
+            IterationHooks.notify(problem, OptimizerState(
+                method_name=type(self).__name__,
+                iteration=iter_count,
+                x=best,
+                trajectory=trajectory,
+                extras={"simplex": simplex, "values": values}
+            ))
+
+        return IterationHooks.finish(problem, OptimizationResult(
+            x_min=simplex[0].copy(),
+            value=float(values[0]),
+            iterations=iter_count,
+            final_epsilon=diameter,
+            trajectory=trajectory if store_trajectory else None,
+            status=status
+        ))
\ No newline at end of file
@@ -1,6 +1,6 @@
 from utils import (
     IOptimizer, SolutionStatus,
-    OptimizationProblem, OptimizationResult
+    OptimizationProblem, OptimizationResult, OptimizerState, IterationHooks, tracer
 )
 import numpy as np
 
@@ -31,50 +31,78 @@ class NewtonMethod(IOptimizer):
         hess_func = problem.hess_func
         eps = problem.epsilon
         max_iter = problem.max_iter
+        store_trajectory = problem.store_trajectory
 
-        x = problem.x_0.copy()
-        grad = grad_func(x)
-        grad_norm = np.linalg.norm(grad)
-
-        trajectory = [x.copy()]
-        iter_count = 0
+        state = IterationHooks.resume(problem, type(self).__name__)
+        if state is not None:
+            # continue exactly where the stored run stopped
+            x = state.x
+            grad = state.grad
+            trajectory = state.trajectory
+            grad_norms = state.grad_norms
+            iter_count = state.iteration
+            grad_norm = np.linalg.norm(grad)
+        else:
+            x = problem.x_0.copy()
+            grad = grad_func(x)
+            # without trajectory only O(n) arrays are kept: x, grad and temporaries of one step
+            trajectory = [x.copy()] if store_trajectory else []
+            iter_count = 0
+            grad_norm = np.linalg.norm(grad)
+            grad_norms = [float(grad_norm)]
 
         while grad_norm > eps:
             if iter_count > max_iter:
-                return OptimizationResult(
+                return IterationHooks.finish(problem, OptimizationResult(
                     x_min=x,
                     value=obj_func(x),
                     iterations=iter_count,
-                    final_epsilon=np.linalg.norm(grad_func(x)),
-                    trajectory=trajectory,
-                    status=SolutionStatus.MAX_ITERATIONS.value
-                )
+                    final_epsilon=grad_norm,
+                    trajectory=trajectory if store_trajectory else None,
+                    status=SolutionStatus.MAX_ITERATIONS.value,
+                    grad_norms=grad_norms
+                ))
             try:
                 hess = hess_func(x)
                 # update x
-                delta_x = np.linalg.solve(hess, -grad) # -H^(-1) * grad_F
+                with tracer.span("newton.linear_solve", "linear_solve"):
+                    delta_x = np.linalg.solve(hess, -grad) # -H^(-1) * grad_F
                 x = x + delta_x
                 grad = grad_func(x)
                 grad_norm = np.linalg.norm(grad)
-
-                iter_count += 1
-                trajectory.append(x.copy())
-                
             except Exception as e:
-                print(f"[ERROR] {e}")
+                # not finished: the checkpoint of the last completed iteration is kept
                 return OptimizationResult(
                     x_min=x,
                     value=obj_func(x),
                     iterations=iter_count,
                     final_epsilon=np.linalg.norm(grad),
-                    trajectory=trajectory,
-                    status=SolutionStatus.ERROR.value
+                    trajectory=trajectory if store_trajectory else None,
+                    status=SolutionStatus.ERROR.value,
+                    grad_norms=grad_norms,
+                    message=str(e) or type(e).__name__
                 )
-        return OptimizationResult(
+
+            iter_count += 1
+            if store_trajectory:
+                trajectory.append(x.copy())
+            grad_norms.append(float(grad_norm))
+
+            # outside of the try block: cancellation from the callback must propagate
+            IterationHooks.notify(problem, OptimizerState(
+                method_name=type(self).__name__,
+                iteration=iter_count,
+                x=x,
+                grad=grad,
+                trajectory=trajectory,
+                grad_norms=grad_norms
+            ))
+        return IterationHooks.finish(problem, OptimizationResult(
             x_min=x,
             value=obj_func(x),
             iterations=iter_count,
-            final_epsilon=np.linalg.norm(grad_func(x)),
-            trajectory=trajectory,
-            status=SolutionStatus.OPTIMAL.value
-        )
\ No newline at end of file
+            final_epsilon=grad_norm,
+            trajectory=trajectory if store_trajectory else None,
+            status=SolutionStatus.OPTIMAL.value,
+            grad_norms=grad_norms
+        ))
\ No newline at end of file
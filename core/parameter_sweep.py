@@ -0,0 +1,160 @@
+from utils import IOptimizer, ProblemSpec, ProblemFactory, SweepEntry, SolutionStatus
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import replace
+from itertools import product
+from typing import Dict, List, Optional, Sequence, Tuple
+import numpy as np
+import time
+
+
+def _run_branch(optimizer: IOptimizer, spec: ProblemSpec, points: List[Dict[str, float]],
+                branch: int, warm_start: bool) -> List[SweepEntry]:
+    """
+    Solve consecutive grid points of one branch, each started from the previous solution (executed in a worker process).
+    Args:
+        optimizer (IOptimizer): Optimizer instance to run.
+        spec (ProblemSpec): Serializable problem description; its params are replaced by the grid points.
+        points (List[Dict[str, float]]): Parameter values in continuation order.
+        branch (int): Index of the branch, used to label the entries.
+        warm_start (bool): Start from the previous solution instead of x_0.
+    Returns:
+        List[SweepEntry]: One entry per point, in the given order.
+    """
+    entries = []
+    x_start = None
+    for params in points:
+        # the expression is compiled once per process, building a point only binds new parameter values
+        problem = ProblemFactory.build(replace(spec, params=params,
+                                               x_0=spec.x_0 if x_start is None else x_start))
+        start = time.perf_counter()
+        result = optimizer.optimize(problem)
+        entries.append(SweepEntry(
+            params=params,
+            result=result,
+            wall_time=time.perf_counter() - start,
+            warm_started=x_start is not None,
+            branch=branch
+        ))
+        # a failed solve is a bad start point for its neighbour
+        usable = (result.status != SolutionStatus.ERROR.value and result.x_min is not None
+                  and np.all(np.isfinite(result.x_min)))
+        x_start = np.asarray(result.x_min, dtype=spec.dtype) if warm_start and usable else None
+    return entries
+
+
+class ParameterSweep:
+    """
+    Solves a parametric objective for every point of a parameter grid by continuation:
+    the grid is walked so that consecutive points differ in one parameter by one step,
+    and each solve starts from the solution of the previous point.
+    Independent branches of the walk run in parallel worker processes.
+    """
+    def __init__(self, optimizers: Dict[str, IOptimizer], max_workers: Optional[int] = None) -> None:
+        """
+        Initialize ParameterSweep.
+        Args:
+            optimizers (Dict[str, IOptimizer]): Available optimizers by name.
+            max_workers (Optional[int]): Size of the process pool, defaults to one worker per branch.
+        """
+        self.optimizers = optimizers
+        self.max_workers = max_workers
+
+    @staticmethod
+    def continuation_order(shape: Sequence[int]) -> List[Tuple[int, ...]]:
+        """
+        Grid indices in snake (boustrophedon) order: every inner axis reverses direction after each
+        step of the outer ones, so consecutive points are neighbours on the grid.
+        Args:
+            shape (Sequence[int]): Number of values of every parameter.
+        Returns:
+            List[Tuple[int, ...]]: All grid indices, outermost parameter first.
+        """
+        order = [()]
+        for size in shape:
+            walked = []
+            for i, prefix in enumerate(order):
+                values = range(size) if i % 2 == 0 else range(size - 1, -1, -1)
+                walked.extend(prefix + (j,) for j in values)
+            order = walked
+        return order
+
+    def sweep(self, spec: ProblemSpec, grid: Dict[str, Sequence[float]], branches: Optional[int] = None,
+              warm_start: bool = True) -> List[SweepEntry]:
+        """
+        Solve the problem for every combination of parameter values.
+        Args:
+            spec (ProblemSpec): Problem with named parameters in func_str; x_0 starts every branch.
+            grid (Dict[str, Sequence[float]]): Values of every parameter, e.g. {"a": np.linspace(1, 1000, 50)}.
+                Values are best given in increasing or decreasing order, so that neighbours are close.
+            branches (Optional[int]): Number of contiguous pieces of the walk solved in parallel.
+                Defaults to one branch per value of the first parameter, or a single branch for one parameter.
+            warm_start (bool): Start every solve of a branch from the previous solution.
+        Returns:
+            List[SweepEntry]: One entry per grid point, in the order of itertools.product over the grid.
+        Raises:
+            ValueError: If the optimizer is unknown or the grid does not match the parameters of func_str.
+        """
+        optimizer = self.optimizers.get(spec.method_name)
+        if optimizer is None:
+            raise ValueError(f"Optimizer '{spec.method_name}' not found")
+        names = list(grid)
+        missing = [name for name in ProblemFactory.parameter_names(spec.func_str)
+                   if name not in names and name not in spec.params]
+        if missing:
+            raise ValueError(f"No values given for parameter(s): {', '.join(missing)}")
+        values = [list(map(float, grid[name])) for name in names]
+        shape = [len(v) for v in values]
+        if not names or 0 in shape:
+            return []
+
+        walk = self.continuation_order(shape)
+        if branches is None:
+            branches = shape[0] if len(shape) > 1 else 1
+        branches = max(1, min(branches, len(walk)))
+        pieces = [list(piece) for piece in np.array_split(np.arange(len(walk)), branches)]
+
+        def point(index: Tuple[int, ...]) -> Dict[str, float]:
+            params = dict(spec.params)
+            params.update({name: values[k][i] for k, (name, i) in enumerate(zip(names, index))})
+            return params
+
+        workers = self.max_workers or branches
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            futures = [
+                executor.submit(_run_branch, optimizer, spec, [point(walk[i]) for i in piece], b, warm_start)
+                for b, piece in enumerate(pieces)
+            ]
+            walked_entries = [entry for future in futures for entry in future.result()]
+
+        # back from continuation order to product order
+        positions = {index: k for k, index in enumerate(product(*[range(size) for size in shape]))}
+        entries = [None] * len(walk)
+        for index, entry in zip(walk, walked_entries):
+            entries[positions[index]] = entry
+        return entries
+
+    @staticmethod
+    def table(entries: List[SweepEntry]) -> Tuple[List[str], np.ndarray]:
+        """
+        Minimizers versus parameters.
+        Args:
+            entries (List[SweepEntry]): Result of sweep.
+        Returns:
+            Tuple: (column names: parameters, x*[i], f(x*), iterations; array with one row per entry)
+        """
+        if not entries:
+            return [], np.empty((0, 0))
+        names = list(entries[0].params)
+        n = max((len(e.result.x_min) for e in entries if e.result.x_min is not None), default=0)
+        columns = names + [f"x*[{i}]" for i in range(n)] + ["f(x*)", "iterations"]
+        rows = np.full((len(entries), len(columns)), np.nan)
+        for row, entry in zip(rows, entries):
+            res = entry.result
+            row[:len(names)] = [entry.params[name] for name in names]
+            if res.x_min is not None:
+                row[len(names):len(names) + n] = res.x_min
+            if res.value is not None:
+                row[-2] = res.value
+            if res.iterations is not None:
+                row[-1] = res.iterations
+        return columns, rows
\ No newline at end of file
@@ -0,0 +1,144 @@
+from utils import (
+    IOptimizer, ILineSearch, SolutionStatus,
+    OptimizationProblem, OptimizationResult, OptimizerState, IterationHooks
+)
+import numpy as np
+
+
+class PowellMethod(IOptimizer):
+    """
+    Powell's conjugate direction method.
+    Derivative-free: minimizes along a set of directions with a line search and replaces
+    the direction of largest decrease by the overall displacement of the iteration.
+    """
+    def __init__(self, line_searcher: ILineSearch, initial_step: float = 1.0) -> None:
+        """
+        Initialize PowellMethod.
+        Args:
+            line_searcher (ILineSearch):
+                Line search strategy used to minimize along each direction.
+            initial_step (float):
+                Half-width of the first search interval along every direction. Later intervals
+                adapt to twice the last step taken along the direction.
+        """
+        self.line_searcher = line_searcher
+        self.initial_step = initial_step
+
+    def optimize(self, problem: OptimizationProblem) -> OptimizationResult:
+        """
+        Finds a local minimum of a multivariate objective function without derivatives.
+        Args:
+            problem (OptimizationProblem):
+                Optimization problem definition containing the objective function,
+                initial point, precision and stopping criteria.
+        Returns:
+            OptimizationResult:
+                Result of the optimization process, including the approximated minimizer,
+                function value and convergence information. final_epsilon is the length of
+                the last iteration's displacement, since no gradient is evaluated.
+        """
+        if problem is None:
+            return OptimizationResult(
+                status=SolutionStatus.ERROR.value
+        )
+        obj_func = problem.obj_func
+        eps = problem.epsilon
+        max_iter = problem.max_iter
+        store_trajectory = problem.store_trajectory
+
+        n = len(problem.x_0)
+        state = IterationHooks.resume(problem, type(self).__name__)
+        if state is not None:
+            # continue exactly where the stored run stopped
+            x = state.x
+            fx = float(state.extras["fx"])
+            directions = state.extras["directions"]
+            steps = state.extras["steps"]
+            trajectory = state.trajectory
+            iter_count = state.iteration
+        else:
+            x = problem.x_0.copy()
+            fx = obj_func(x)
+            directions = np.eye(n, dtype=x.dtype)
+            steps = np.full(n, self.initial_step)
+            trajectory = [x.copy()] if store_trajectory else []
+            iter_count = 0
+        displacement = np.inf
+
+        while True:
+            if iter_count > max_iter:
+                status = SolutionStatus.MAX_ITERATIONS.value
+                break
+            x_start, f_start = x, fx
+            largest_drop, largest_idx = 0.0, 0
+
+            for i in range(n):
+                x, fx, drop = self._minimize_along(obj_func, x, fx, directions[i], steps, i, eps)
+                if drop > largest_drop:
+                    largest_drop, largest_idx = drop, i
+
+            shift = x - x_start
+            displacement = float(np.linalg.norm(shift))
+            iter_count += 1
+            if store_trajectory:
+                trajectory.append(x.copy())
+
+            if displacement <= eps:
+                status = SolutionStatus.OPTIMAL.value
+                break
+
+            # replace the direction of largest decrease by the displacement,
+            # unless extrapolation shows it would not help (Powell's criterion)
+            f_extrapolated = obj_func(x + shift)
+            if f_extrapolated < f_start and (
+                2 * (f_start - 2 * fx + f_extrapolated) * (f_start - fx - largest_drop) ** 2
+                < largest_drop * (f_start - f_extrapolated) ** 2
+            ):
+                new_direction = shift / displacement
+                directions[largest_idx:-1] = directions[largest_idx + 1:].copy()
+                directions[-1] = new_direction
+                steps[largest_idx:-1] = steps[largest_idx + 1:].copy()
+                steps[-1] = max(2 * displacement, 10 * eps)
+                x, fx, _ = self._minimize_along(obj_func, x, fx, new_direction, steps, n - 1, eps)
+
+            IterationHooks.notify(problem, OptimizerState(
+                method_name=type(self).__name__,
+                iteration=iter_count,
+                x=x,
+                trajectory=trajectory,
+                extras={"fx": np.array(fx), "directions": directions, "steps": steps}
+            ))
+
+        return IterationHooks.finish(problem, OptimizationResult(
+            x_min=x,
+            value=float(fx),
+            iterations=iter_count,
+            final_epsilon=displacement,
+            trajectory=trajectory if store_trajectory else None,
+            status=status
+        ))
+
+    def _minimize_along(self, obj_func, x: np.ndarray, fx: float, direction: np.ndarray,
+                        steps: np.ndarray, idx: int, eps: float):
+        """
+        Line search along a unit direction on [-step, step]; the step of the direction adapts.
+        Returns:
+            Tuple: (new point, its value, decrease of the objective)
+        """
+        half_width = steps[idx]
+
+        def phi(lmbda: float) -> float:
+            return obj_func(x + lmbda * direction)
+
+        lmbda = self.line_searcher.search(
+            phi=phi,
+            interval=(-half_width, half_width),
+            epsilon=eps
+        )
+        x_new = x + lmbda * direction
+        f_new = obj_func(x_new)
+        # next interval: twice the step just taken, so it can grow when the minimizer is far
+        steps[idx] = max(2 * abs(lmbda), 10 * eps)
+        if f_new < fx:
+            return x_new, f_new, fx - f_new
+        return x, fx, 0.0
\ No newline at end of file
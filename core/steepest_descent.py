@@ -1,33 +1,58 @@
 from utils import (
     IOptimizer, ILineSearch, SolutionStatus,
-    OptimizationProblem, OptimizationResult
+    OptimizationProblem, OptimizationResult, OptimizerState, IterationHooks, ProblemFactory
 )
+from typing import Callable, Optional, Tuple
 import numpy as np
 
 
 class SteepestDescent(IOptimizer):
     """
     Steepest descent optimization method.
+    Optionally accelerated with heavy-ball or Nesterov momentum (with adaptive restarts)
+    and preconditioned with a diagonal (Jacobi) scaling estimated from gradient differences.
+    A step never increases f at the point it starts from; Nesterov momentum also restarts
+    whenever a step increases f at the current iterate.
     """
-    def __init__(self, line_searcher: ILineSearch) -> None:
+    MOMENTUM_TYPES = (None, "heavy_ball", "nesterov")
+
+    def __init__(self, line_searcher: ILineSearch, momentum: Optional[str] = None,
+                 beta: float = 0.5, preconditioned: bool = False, batch_points: int = 0) -> None:
         """
         Initialize SteepestDescent.
         Args:
             line_searcher (ILineSearch):
                 Line search strategy used to compute the step size lambda.
+            momentum (Optional[str]):
+                None for plain steepest descent, "heavy_ball" or "nesterov".
+            beta (float):
+                Heavy-ball momentum coefficient (Nesterov uses the t_k = (1 + sqrt(1 + 4t²)) / 2 schedule).
+            preconditioned (bool):
+                Scale the gradient by the inverse of a diagonal Hessian estimate |Δg_i / Δx_i|.
+            batch_points (int):
+                If positive (at least 2), the line search evaluates this many λ per round in one batched
+                call: vectorized when the objective allows it, concurrently otherwise. 0 disables batching.
         """
+        if momentum not in self.MOMENTUM_TYPES:
+            raise ValueError(f"Unknown momentum '{momentum}', expected one of {self.MOMENTUM_TYPES}")
+        if batch_points != 0 and batch_points < 2:
+            raise ValueError("A batched line search needs at least 2 points per round")
         self.line_searcher = line_searcher
+        self.momentum = momentum
+        self.beta = beta
+        self.preconditioned = preconditioned
+        self.batch_points = batch_points
 
     def optimize(self, problem: OptimizationProblem) -> OptimizationResult:
         """
         Finds a local minimum of a multivariate objective function.
         Args:
             problem (OptimizationProblem):
-                Optimization problem definition containing the objective function, 
+                Optimization problem definition containing the objective function,
                 its gradient, initial point, precision and stopping criteria.
         Returns:
             OptimizationResult:
-                Result of the optimization process, including the approximated minimizer, 
+                Result of the optimization process, including the approximated minimizer,
                 function value and convergence information.
         """
         if problem is None:
@@ -38,46 +63,183 @@ class SteepestDescent(IOptimizer):
         grad_func = problem.grad_func
         eps = problem.epsilon
         max_iter = problem.max_iter
+        store_trajectory = problem.store_trajectory
+        use_momentum = self.momentum is not None
+        if self.batch_points:
+            batch_obj_func = ProblemFactory.batch_objective(problem) or ProblemFactory.concurrent_batch(obj_func)
 
-        x = problem.x_0.copy()
-        grad = grad_func(x)
-        grad_norm = np.linalg.norm(grad)
-
-        trajectory = [x.copy()]
-        iter_count = 0
+        # x: current iterate, point: where the gradient is evaluated
+        # (the Nesterov look-ahead point, otherwise x itself)
+        state = IterationHooks.resume(problem, type(self).__name__)
+        if state is not None:
+            # continue exactly where the stored run stopped
+            x = state.x
+            grad = state.grad
+            trajectory = state.trajectory
+            grad_norms = state.grad_norms
+            iter_count = state.iteration
+            point = state.extras.get("point", x)
+            velocity = state.extras.get("velocity")
+            t = float(state.extras.get("t", 1.0))
+            diag = state.extras.get("diag")
+            grad_norm = np.linalg.norm(grad)
+        else:
+            x = problem.x_0.copy()
+            point = x
+            grad = grad_func(x)
+            # without trajectory only O(n) arrays are kept: x, grad and temporaries of one step
+            trajectory = [x.copy()] if store_trajectory else []
+            iter_count = 0
+            velocity = np.zeros_like(x) if use_momentum else None
+            t = 1.0
+            diag = np.ones_like(x) if self.preconditioned else None
+            grad_norm = np.linalg.norm(grad)
+            grad_norms = [float(grad_norm)]
+        f_0 = obj_func(problem.x_0)
+        # f at the current iterate and at the point the step starts from
+        f_x = obj_func(x)
+        f_point = f_x if point is x else obj_func(point)
 
         while grad_norm > eps:
             if iter_count > max_iter:
-                return OptimizationResult(
-                    x_min=x,
-                    value=obj_func(x),
+                return IterationHooks.finish(problem, OptimizationResult(
+                    x_min=point,
+                    value=obj_func(point),
                     iterations=iter_count,
-                    final_epsilon=np.linalg.norm(grad_func(x)),
-                    trajectory=trajectory,
-                    status=SolutionStatus.MAX_ITERATIONS.value
-                )
+                    final_epsilon=grad_norm,
+                    trajectory=trajectory if store_trajectory else None,
+                    status=SolutionStatus.MAX_ITERATIONS.value,
+                    grad_norms=grad_norms
+                ))
+            direction = -grad / diag if self.preconditioned else -grad
+            if self.momentum == "heavy_ball":
+                accelerated = direction + self.beta * velocity
+                # restart: momentum overshoots when the combined direction is not a descent one
+                if np.dot(grad, accelerated) < 0:
+                    direction = accelerated
+
             # find optimal lambda
-            def phi(lmbda: float) -> float:
-                return obj_func(x - lmbda * grad)
-            
-            lmbda = self.line_searcher.search(
-                phi=phi,
-                interval=(0.0, 1.0),
-                epsilon=eps
-            )
+            if self.batch_points:
+                def phi_batch(lmbdas: np.ndarray) -> np.ndarray:
+                    return batch_obj_func(point[:, np.newaxis] + direction[:, np.newaxis] * lmbdas)
+
+                def search(interval: Tuple[float, float]) -> float:
+                    return self.line_searcher.search_batch(
+                        phi_batch=phi_batch,
+                        interval=interval,
+                        epsilon=eps,
+                        points=self.batch_points
+                    )
+            else:
+                def phi(lmbda: float) -> float:
+                    return obj_func(point + lmbda * direction)
+
+                def search(interval: Tuple[float, float]) -> float:
+                    return self.line_searcher.search(
+                        phi=phi,
+                        interval=interval,
+                        epsilon=eps
+                    )
             # update x
-            x = x - lmbda * grad
-            grad = grad_func(x)
+            x_new, f_new = self._safeguarded_step(obj_func, search, point, direction, f_point)
+
+            if self.momentum == "nesterov":
+                if f_new > f_x and not np.array_equal(point, x):
+                    # function restart: the step from the look-ahead point increased f;
+                    # drop it and continue with a plain gradient step from x
+                    t = 1.0
+                    velocity = np.zeros_like(x)
+                    x_new, f_new = x, f_x
+                # gradient restart: the step went against the look-ahead gradient
+                elif np.dot(grad, x_new - x) > 0:
+                    t = 1.0
+                    velocity = np.zeros_like(x)
+                else:
+                    velocity = x_new - x
+                t_new = (1 + np.sqrt(1 + 4 * t * t)) / 2
+                new_point = x_new + ((t - 1) / t_new) * velocity
+                t = t_new
+            else:
+                if use_momentum:
+                    velocity = x_new - x
+                new_point = x_new
+            x, f_x = x_new, f_new
+            f_point = f_x if new_point is x else obj_func(new_point)
+
+            new_grad = grad_func(new_point)
+            if self.preconditioned:
+                diag = self._update_diagonal(diag, new_point, new_point - point, new_grad - grad)
+            point, grad = new_point, new_grad
             grad_norm = np.linalg.norm(grad)
 
-            trajectory.append(x.copy())
+            if store_trajectory:
+                trajectory.append(point.copy())
+            grad_norms.append(float(grad_norm))
             iter_count += 1
 
-        return OptimizationResult(
-            x_min=x,
-            value=obj_func(x),
+            extras = {}
+            if self.momentum == "nesterov":
+                extras.update(point=point, t=np.array(t))
+            if use_momentum:
+                extras["velocity"] = velocity
+            if self.preconditioned:
+                extras["diag"] = diag
+            IterationHooks.notify(problem, OptimizerState(
+                method_name=type(self).__name__,
+                iteration=iter_count,
+                x=x,
+                grad=grad,
+                trajectory=trajectory,
+                grad_norms=grad_norms,
+                extras=extras
+            ))
+
+        value = obj_func(point)
+        status, message = SolutionStatus.OPTIMAL.value, None
+        if not np.isfinite(value):
+            status, message = SolutionStatus.ERROR.value, "f is not finite at the final point"
+        elif value - f_0 > 100 * (1 + abs(f_0)):
+            # diverged: far out the numerical gradient underflows and passes the stopping test
+            status, message = SolutionStatus.NOT_CONVERGED.value, f"f grew from {f_0:.6g} to {value:.6g}"
+        return IterationHooks.finish(problem, OptimizationResult(
+            x_min=point,
+            value=value,
             iterations=iter_count,
-            final_epsilon=np.linalg.norm(grad_func(x)),
-            trajectory=trajectory,
-            status=SolutionStatus.OPTIMAL.value
-        )
\ No newline at end of file
+            final_epsilon=grad_norm,
+            trajectory=trajectory if store_trajectory else None,
+            status=status,
+            grad_norms=grad_norms,
+            message=message
+        ))
+
+    @staticmethod
+    def _safeguarded_step(obj_func: Callable[[np.ndarray], float],
+                          search: Callable[[Tuple[float, float]], float], point: np.ndarray,
+                          direction: np.ndarray, f_point: float,
+                          max_searches: int = 30) -> Tuple[np.ndarray, float]:
+        """
+        Line search step that does not increase f: with a coarse tolerance the λ found on [0, 1]
+        along a steep direction can lie far past the minimum. Then φ(λ) > φ(0), so the search
+        is repeated on [0, λ] (at least halving λ). No decrease at all keeps the point.
+        """
+        lmbda = search((0.0, 1.0))
+        for _ in range(max_searches):
+            x_new = point + lmbda * direction
+            f_new = obj_func(x_new)
+            if f_new <= f_point:
+                return x_new, f_new
+            lmbda = min(search((0.0, lmbda)), lmbda / 2)
+        return point, f_point
+
+    @staticmethod
+    def _update_diagonal(diag: np.ndarray, x: np.ndarray, step: np.ndarray, grad_change: np.ndarray,
+                         lower: float = 1e-8, upper: float = 1e8) -> np.ndarray:
+        """
+        Secant estimate of the Hessian diagonal: d_i = |Δg_i / Δx_i| for coordinates that moved
+        noticeably (tiny steps only measure finite-difference noise), previous estimate for the others,
+        clipped to [lower, upper].
+        """
+        moved = np.abs(step) > np.sqrt(np.finfo(x.dtype).eps) * (1 + np.abs(x))
+        diag = diag.copy()
+        diag[moved] = np.clip(np.abs(grad_change[moved] / step[moved]), lower, upper)
+        return diag
\ No newline at end of file
@@ -0,0 +1,3 @@
+from .sgd import SGD
+from .adam import Adam
+from .mini_batches import MiniBatchStream
\ No newline at end of file
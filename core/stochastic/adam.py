@@ -0,0 +1,38 @@
+from .stochastic_optimizer import StochasticOptimizer
+from typing import Dict
+import numpy as np
+
+
+class Adam(StochasticOptimizer):
+    """
+    Adam: per-coordinate step sizes from bias-corrected running moments of the gradient.
+    """
+    def __init__(self, learning_rate: float = 1e-3, beta1: float = 0.9, beta2: float = 0.999,
+                 eps: float = 1e-8, decay: float = 0.0, svrg: bool = False) -> None:
+        """
+        Initialize Adam.
+        Args:
+            learning_rate (float): Step size of the first epoch.
+            beta1 (float): Decay rate of the first moment (mean) estimate.
+            beta2 (float): Decay rate of the second moment (uncentered variance) estimate.
+            eps (float): Added to the denominator for numerical stability.
+            decay (float): Step size of epoch k is learning_rate / (1 + decay * k).
+            svrg (bool): Use SVRG variance-reduced gradients.
+        """
+        super().__init__(learning_rate, decay, svrg)
+        self.beta1 = beta1
+        self.beta2 = beta2
+        self.eps = eps
+
+    def _init_memory(self, x: np.ndarray) -> Dict[str, np.ndarray]:
+        return {"m": np.zeros(len(x)), "v": np.zeros(len(x)), "t": np.array(0)}
+
+    def _step(self, x: np.ndarray, grad: np.ndarray, learning_rate: float,
+              memory: Dict[str, np.ndarray]) -> np.ndarray:
+        t = int(memory["t"]) + 1
+        m = self.beta1 * memory["m"] + (1 - self.beta1) * grad
+        v = self.beta2 * memory["v"] + (1 - self.beta2) * grad * grad
+        memory.update(m=m, v=v, t=np.array(t))
+        m_hat = m / (1 - self.beta1 ** t)
+        v_hat = v / (1 - self.beta2 ** t)
+        return x - learning_rate * m_hat / (np.sqrt(v_hat) + self.eps)
\ No newline at end of file
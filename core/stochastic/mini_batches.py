@@ -0,0 +1,61 @@
+from utils import FiniteSumProblem, traced
+from typing import Iterator
+import numpy as np
+
+
+class MiniBatchStream:
+    """
+    Streams a (possibly memory-mapped) dataset in contiguous chunks.
+    An epoch visits the chunks in random order and draws mini-batches from a random permutation
+    of each chunk, so every row is used exactly once per epoch while the disk is read sequentially.
+    """
+    def __init__(self, problem: FiniteSumProblem) -> None:
+        """
+        Initialize MiniBatchStream.
+        Args:
+            problem (FiniteSumProblem): Finite-sum problem with per-row losses and dataset.
+        """
+        self.loss_func = problem.loss_func
+        self.batch_grad_func = problem.batch_grad_func
+        self.data = problem.data
+        self.batch_size = max(1, problem.batch_size)
+        # whole batches per chunk, so only the last chunk can end with a short batch
+        self.chunk_size = max(self.batch_size, problem.chunk_size // self.batch_size * self.batch_size)
+
+    @property
+    def n_rows(self) -> int:
+        return len(self.data)
+
+    def _chunks(self) -> Iterator[np.ndarray]:
+        """Yield consecutive row blocks of the dataset (views into the memory map)"""
+        for start in range(0, self.n_rows, self.chunk_size):
+            yield np.asarray(self.data[start:start + self.chunk_size])
+
+    def epoch(self, rng: np.random.Generator) -> Iterator[np.ndarray]:
+        """
+        Yield the mini-batches of one epoch.
+        Args:
+            rng (np.random.Generator): Source of the chunk order and the row permutations.
+        """
+        starts = np.arange(0, self.n_rows, self.chunk_size)
+        rng.shuffle(starts)
+        for start in starts:
+            chunk = np.asarray(self.data[start:start + self.chunk_size])
+            order = rng.permutation(len(chunk))
+            for offset in range(0, len(chunk), self.batch_size):
+                yield chunk[order[offset:offset + self.batch_size]]
+
+    def loss(self, x: np.ndarray) -> float:
+        """Mean loss over the whole dataset (one sequential pass)"""
+        total = 0.0
+        for chunk in self._chunks():
+            total += float(np.sum(self.loss_func(x, chunk)))
+        return total / self.n_rows
+
+    @traced("finite_sum.full_gradient", "derivative")
+    def gradient(self, x: np.ndarray) -> np.ndarray:
+        """Gradient of the mean loss over the whole dataset (one sequential pass)"""
+        total = np.zeros(len(x))
+        for chunk in self._chunks():
+            total += self.batch_grad_func(x, chunk) * len(chunk)
+        return total / self.n_rows
\ No newline at end of file
@@ -0,0 +1,36 @@
+from .stochastic_optimizer import StochasticOptimizer
+from typing import Dict
+import numpy as np
+
+
+class SGD(StochasticOptimizer):
+    """
+    Mini-batch stochastic gradient descent, optionally with (Nesterov) momentum.
+    """
+    def __init__(self, learning_rate: float = 0.01, momentum: float = 0.0, nesterov: bool = False,
+                 decay: float = 0.0, svrg: bool = False) -> None:
+        """
+        Initialize SGD.
+        Args:
+            learning_rate (float): Step size of the first epoch.
+            momentum (float): Velocity coefficient μ of v ← μv - ηg, 0 for plain SGD.
+            nesterov (bool): Apply the momentum look-ahead x ← x + μv - ηg.
+            decay (float): Step size of epoch k is learning_rate / (1 + decay * k).
+            svrg (bool): Use SVRG variance-reduced gradients.
+        """
+        super().__init__(learning_rate, decay, svrg)
+        self.momentum = momentum
+        self.nesterov = nesterov
+
+    def _init_memory(self, x: np.ndarray) -> Dict[str, np.ndarray]:
+        return {"velocity": np.zeros(len(x))} if self.momentum else {}
+
+    def _step(self, x: np.ndarray, grad: np.ndarray, learning_rate: float,
+              memory: Dict[str, np.ndarray]) -> np.ndarray:
+        if not self.momentum:
+            return x - learning_rate * grad
+        velocity = self.momentum * memory["velocity"] - learning_rate * grad
+        memory["velocity"] = velocity
+        if self.nesterov:
+            return x + self.momentum * velocity - learning_rate * grad
+        return x + velocity
\ No newline at end of file
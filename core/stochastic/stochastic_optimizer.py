@@ -0,0 +1,133 @@
+from utils import (
+    IStochasticOptimizer, SolutionStatus,
+    FiniteSumProblem, OptimizationResult, OptimizerState, IterationHooks
+)
+from .mini_batches import MiniBatchStream
+from abc import abstractmethod
+from typing import Dict
+import numpy as np
+
+
+class StochasticOptimizer(IStochasticOptimizer):
+    """
+    Epoch loop shared by the mini-batch methods: shuffled streaming of the data,
+    optional SVRG variance reduction, stopping test, checkpoints and progress callbacks.
+    An iteration of the result is one epoch (one pass over the data).
+    """
+    def __init__(self, learning_rate: float, decay: float = 0.0, svrg: bool = False) -> None:
+        """
+        Initialize StochasticOptimizer.
+        Args:
+            learning_rate (float): Step size of the first epoch.
+            decay (float): Step size of epoch k is learning_rate / (1 + decay * k).
+            svrg (bool): Correct every mini-batch gradient with the full gradient of a snapshot
+                taken at the start of each epoch (SVRG): ∇l_B(x) - ∇l_B(x̃) + ∇L(x̃).
+        """
+        self.learning_rate = learning_rate
+        self.decay = decay
+        self.svrg = svrg
+
+    @abstractmethod
+    def _init_memory(self, x: np.ndarray) -> Dict[str, np.ndarray]:
+        """Method state kept between steps (velocity, moments), stored in checkpoints"""
+        pass
+
+    @abstractmethod
+    def _step(self, x: np.ndarray, grad: np.ndarray, learning_rate: float,
+              memory: Dict[str, np.ndarray]) -> np.ndarray:
+        """Update of the parameters from one mini-batch gradient; updates `memory` in place"""
+        pass
+
+    def optimize(self, problem: FiniteSumProblem) -> OptimizationResult:
+        """
+        Finds a minimum of the mean loss over the dataset.
+        Args:
+            problem (FiniteSumProblem):
+                Finite-sum problem definition containing the per-row loss, its batch gradient,
+                dataset, initial point, precision and stopping criteria.
+        Returns:
+            OptimizationResult:
+                Result with the parameters and mean loss after the last epoch. Trajectory and gradient
+                norms are recorded per epoch; the gradient norm is the exact full gradient of the
+                snapshot with SVRG, otherwise the mean of the mini-batch gradients of the epoch.
+        """
+        if problem is None:
+            return OptimizationResult(
+                status=SolutionStatus.ERROR.value
+        )
+        stream = MiniBatchStream(problem)
+        batch_grad_func = problem.batch_grad_func
+        eps = problem.epsilon
+        store_trajectory = problem.store_trajectory
+        rng = np.random.default_rng(problem.seed)
+
+        state = IterationHooks.resume(problem, type(self).__name__)
+        if state is not None:
+            # continue exactly where the stored run stopped, including the shuffling sequence
+            x = state.x
+            trajectory = state.trajectory
+            grad_norms = state.grad_norms
+            epoch = state.iteration
+            memory = state.extras
+            rng.bit_generator.state = state.rng_state
+            grad_norm = grad_norms[-1] if grad_norms else np.inf
+        else:
+            x = problem.x_0.copy()
+            trajectory = [x.copy()] if store_trajectory else []
+            grad_norms = []
+            epoch = 0
+            memory = self._init_memory(x)
+            grad_norm = np.inf
+
+        status = SolutionStatus.MAX_ITERATIONS.value
+        while epoch < problem.max_epochs:
+            if self.svrg:
+                snapshot = x.copy()
+                full_grad = stream.gradient(snapshot)
+                grad_norm = float(np.linalg.norm(full_grad))
+                grad_norms.append(grad_norm)
+                if grad_norm <= eps:
+                    status = SolutionStatus.OPTIMAL.value
+                    break
+
+            learning_rate = self.learning_rate / (1 + self.decay * epoch)
+            grad_sum = np.zeros(len(x))
+            for batch in stream.epoch(rng):
+                grad = batch_grad_func(x, batch)
+                grad_sum += grad * len(batch)
+                if self.svrg:
+                    grad = grad - batch_grad_func(snapshot, batch) + full_grad
+                x = self._step(x, grad, learning_rate, memory)
+            epoch += 1
+
+            if not np.all(np.isfinite(x)):
+                status = SolutionStatus.ERROR.value
+                break
+            if not self.svrg:
+                grad_norm = float(np.linalg.norm(grad_sum / stream.n_rows))
+                grad_norms.append(grad_norm)
+            if store_trajectory:
+                trajectory.append(x.copy())
+
+            IterationHooks.notify(problem, OptimizerState(
+                method_name=type(self).__name__,
+                iteration=epoch,
+                x=x,
+                trajectory=trajectory,
+                grad_norms=grad_norms,
+                extras=memory,
+                rng_state=rng.bit_generator.state
+            ))
+            if not self.svrg and grad_norm <= eps:
+                status = SolutionStatus.OPTIMAL.value
+                break
+
+        return IterationHooks.finish(problem, OptimizationResult(
+            x_min=x,
+            value=stream.loss(x) if status != SolutionStatus.ERROR.value else None,
+            iterations=epoch,
+            final_epsilon=grad_norm,
+            trajectory=trajectory if store_trajectory else None,
+            status=status,
+            grad_norms=grad_norms
+        ))
\ No newline at end of file
@@ -0,0 +1,258 @@
+from utils import (
+    IOptimizer, SolutionStatus,
+    OptimizationProblem, OptimizationResult, OptimizerState, IterationHooks, tracer
+)
+from typing import Callable, Tuple
+import numpy as np
+
+
+class TrustRegionNewton(IOptimizer):
+    """
+    Trust-region Newton method.
+    Minimizes the quadratic model m(p) = f + gᵀp + ½pᵀHp within ||p|| <= Δ and adapts Δ from the
+    ratio ρ of actual to predicted reduction. Rejected steps only shrink Δ and re-solve the model
+    with the same Hessian, so every Hessian evaluation ends with a decrease of f.
+    The subproblem is solved by the dogleg method (dense Hessian) for small n and by Steihaug
+    truncated conjugate gradients (Hessian-free, O(n) memory) for large n.
+    """
+    SUBPROBLEMS = ("auto", "dogleg", "steihaug")
+
+    def __init__(self, subproblem: str = "auto", initial_radius: float = 1.0, max_radius: float = 1e3,
+                 eta: float = 0.15, dogleg_max_dim: int = 100) -> None:
+        """
+        Initialize TrustRegionNewton.
+        Args:
+            subproblem (str):
+                "dogleg", "steihaug" or "auto" (dogleg up to `dogleg_max_dim` variables).
+            initial_radius (float):
+                Initial trust-region radius Δ.
+            max_radius (float):
+                Upper bound of Δ.
+            eta (float):
+                Minimal ratio ρ of actual to predicted reduction for accepting a step.
+            dogleg_max_dim (int):
+                Largest dimension for which the dense Hessian is built in "auto" mode.
+        """
+        if subproblem not in self.SUBPROBLEMS:
+            raise ValueError(f"Unknown subproblem solver '{subproblem}', expected one of {self.SUBPROBLEMS}")
+        self.subproblem = subproblem
+        self.initial_radius = initial_radius
+        self.max_radius = max_radius
+        self.eta = eta
+        self.dogleg_max_dim = dogleg_max_dim
+
+    def optimize(self, problem: OptimizationProblem) -> OptimizationResult:
+        """
+        Finds a local minimum of a multivariate objective function.
+        Args:
+            problem (OptimizationProblem):
+                Optimization problem definition containing the objective function,
+                its gradient and hessian, initial point, precision and stopping criteria.
+        Returns:
+            OptimizationResult:
+                Result of the optimization process, including the approximated minimizer,
+                function value and convergence information. Status is NOT_CONVERGED if the
+                radius collapsed without reaching the required gradient norm.
+        """
+        if problem is None:
+            return OptimizationResult(
+                status=SolutionStatus.ERROR.value
+        )
+        obj_func = problem.obj_func
+        grad_func = problem.grad_func
+        hess_func = problem.hess_func
+        eps = problem.epsilon
+        max_iter = problem.max_iter
+        store_trajectory = problem.store_trajectory
+
+        n = len(problem.x_0)
+        use_dogleg = self.subproblem == "dogleg" or (self.subproblem == "auto" and n <= self.dogleg_max_dim)
+
+        state = IterationHooks.resume(problem, type(self).__name__)
+        if state is not None:
+            # continue exactly where the stored run stopped
+            x = state.x
+            grad = state.grad
+            trajectory = state.trajectory
+            grad_norms = state.grad_norms
+            iter_count = state.iteration
+            radius = float(state.extras["radius"])
+        else:
+            x = problem.x_0.copy()
+            grad = grad_func(x)
+            trajectory = [x.copy()] if store_trajectory else []
+            iter_count = 0
+            radius = self.initial_radius
+            grad_norms = [float(np.linalg.norm(grad))]
+        fx = obj_func(x)
+        grad_norm = np.linalg.norm(grad)
+        status = SolutionStatus.OPTIMAL.value
+
+        while grad_norm > eps:
+            if iter_count > max_iter:
+                status = SolutionStatus.MAX_ITERATIONS.value
+                break
+
+            if use_dogleg:
+                hess = hess_func(x)
+                hess_vec = hess.__matmul__
+            else:
+                hess = None
+                hess_vec = self._hessian_vector_product(grad_func, x, grad)
+
+            # shrink the radius until the model step decreases f
+            accepted = False
+            while not accepted:
+                # steps below the resolution of x cannot change f any more
+                if radius <= np.finfo(float).eps * (1 + np.linalg.norm(x)):
+                    break
+                with tracer.span("trust_region.subproblem", "linear_solve"):
+                    if use_dogleg:
+                        step, predicted = self._dogleg(grad, hess, radius)
+                    else:
+                        step, predicted = self._steihaug_cg(grad, hess_vec, radius)
+                step_norm = np.linalg.norm(step)
+                x_new = (x + step).astype(x.dtype, copy=False)
+                f_new = obj_func(x_new)
+                rho = (fx - f_new) / predicted if predicted > 0 else -1.0
+
+                if rho < 0.25:
+                    radius = 0.25 * step_norm
+                elif rho > 0.75 and step_norm >= 0.99 * radius:
+                    radius = min(2 * radius, self.max_radius)
+                accepted = rho > self.eta
+
+            if not accepted:
+                status = SolutionStatus.NOT_CONVERGED.value
+                break
+
+            x, fx = x_new, f_new
+            grad = grad_func(x)
+            grad_norm = np.linalg.norm(grad)
+
+            iter_count += 1
+            if store_trajectory:
+                trajectory.append(x.copy())
+            grad_norms.append(float(grad_norm))
+
+            IterationHooks.notify(problem, OptimizerState(
+                method_name=type(self).__name__,
+                iteration=iter_count,
+                x=x,
+                grad=grad,
+                trajectory=trajectory,
+                grad_norms=grad_norms,
+                extras={"radius": np.array(radius)}
+            ))
+
+        return IterationHooks.finish(problem, OptimizationResult(
+            x_min=x,
+            value=float(fx),
+            iterations=iter_count,
+            final_epsilon=grad_norm,
+            trajectory=trajectory if store_trajectory else None,
+            status=status,
+            grad_norms=grad_norms
+        ))
+
+    @staticmethod
+    def _dogleg(grad: np.ndarray, hess: np.ndarray, radius: float) -> Tuple[np.ndarray, float]:
+        """
+        Dogleg step: the Newton step if it fits, otherwise the path from the Cauchy point towards it
+        cut at the boundary. Without a positive-definite Hessian only the Cauchy point is used.
+        Returns:
+            Tuple: (step, predicted reduction of the model)
+        """
+        def predicted(step: np.ndarray) -> float:
+            return -(grad @ step + 0.5 * step @ hess @ step)
+
+        try:
+            # Cholesky succeeds only for positive-definite Hessians
+            np.linalg.cholesky(hess)
+            newton_step = np.linalg.solve(hess, -grad)
+        except np.linalg.LinAlgError:
+            newton_step = None
+        if newton_step is not None and np.linalg.norm(newton_step) <= radius:
+            return newton_step, predicted(newton_step)
+
+        grad_norm = np.linalg.norm(grad)
+        curvature = grad @ hess @ grad
+        if curvature <= 0:
+            # model is unbounded along -g: go to the boundary
+            step = -radius / grad_norm * grad
+            return step, predicted(step)
+        cauchy = -(grad_norm ** 2 / curvature) * grad
+        cauchy_norm = np.linalg.norm(cauchy)
+        if cauchy_norm >= radius:
+            step = radius / cauchy_norm * cauchy
+            return step, predicted(step)
+        if newton_step is None:
+            return cauchy, predicted(cauchy)
+
+        # ||cauchy + tau * (newton - cauchy)|| = radius, tau in [0, 1]
+        tau = TrustRegionNewton._boundary_root(cauchy, newton_step - cauchy, radius)
+        step = cauchy + tau * (newton_step - cauchy)
+        return step, predicted(step)
+
+    @staticmethod
+    def _steihaug_cg(grad: np.ndarray, hess_vec: Callable[[np.ndarray], np.ndarray],
+                     radius: float) -> Tuple[np.ndarray, float]:
+        """
+        Steihaug truncated conjugate gradients on H p = -g, stopped at the boundary,
+        at negative curvature or at the relative residual min(0.5, sqrt(||g||)).
+        The model value is updated along the iterations, so no extra Hessian product is needed.
+        Returns:
+            Tuple: (step, predicted reduction of the model)
+        """
+        step = np.zeros_like(grad, dtype=float)
+        residual = np.array(grad, dtype=float)
+        direction = -residual
+        # m(step) - f = gᵀstep + ½ stepᵀH step
+        model = 0.0
+        rr = residual @ residual
+        tolerance = min(0.5, np.sqrt(np.sqrt(rr))) * np.sqrt(rr)
+
+        for _ in range(2 * len(grad)):
+            hd = hess_vec(direction)
+            curvature = direction @ hd
+            if curvature <= 0:
+                tau = TrustRegionNewton._boundary_root(step, direction, radius)
+                return step + tau * direction, -(model + tau * (residual @ direction) + 0.5 * tau ** 2 * curvature)
+            alpha = rr / curvature
+            if np.linalg.norm(step + alpha * direction) >= radius:
+                tau = TrustRegionNewton._boundary_root(step, direction, radius)
+                return step + tau * direction, -(model + tau * (residual @ direction) + 0.5 * tau ** 2 * curvature)
+            model += alpha * (residual @ direction) + 0.5 * alpha ** 2 * curvature
+            step = step + alpha * direction
+            residual = residual + alpha * hd
+            rr_new = residual @ residual
+            if np.sqrt(rr_new) < tolerance:
+                break
+            direction = -residual + (rr_new / rr) * direction
+            rr = rr_new
+        return step, -model
+
+    @staticmethod
+    def _boundary_root(start: np.ndarray, direction: np.ndarray, radius: float) -> float:
+        """Positive tau with ||start + tau * direction|| = radius"""
+        a = direction @ direction
+        b = 2 * (start @ direction)
+        c = start @ start - radius ** 2
+        return (-b + np.sqrt(b * b - 4 * a * c)) / (2 * a)
+
+    @staticmethod
+    def _hessian_vector_product(grad_func: Callable[[np.ndarray], np.ndarray], x: np.ndarray,
+                                grad: np.ndarray) -> Callable[[np.ndarray], np.ndarray]:
+        """
+        H(x) v by forward differences of the gradient: (g(x + h v / ||v||) - g(x)) ||v|| / h.
+        h ~ 1e-4 balances truncation against the noise of numerical gradients.
+        """
+        h = 1e-4 * (1 + np.linalg.norm(x) / np.sqrt(len(x)))
+
+        def hess_vec(v: np.ndarray) -> np.ndarray:
+            v_norm = np.linalg.norm(v)
+            if v_norm == 0:
+                return np.zeros_like(v)
+            x_shifted = (x + (h / v_norm) * v).astype(x.dtype, copy=False)
+            return (grad_func(x_shifted) - grad) * (v_norm / h)
+        return hess_vec
\ No newline at end of file
@@ -1,22 +1,31 @@
+import os
+from datetime import datetime
 from PyQt6.QtWidgets import (
-    QMainWindow, QWidget, QVBoxLayout, QHBoxLayout, QLabel, QPushButton, QTabWidget, QMessageBox
+    QMainWindow, QWidget, QVBoxLayout, QHBoxLayout, QLabel, QPushButton, QTabWidget, QMessageBox,
+    QFileDialog
 )
 from PyQt6.QtGui import QFont
-from typing import Dict
+from typing import Dict, Optional
 from utils.interfaces import IOptimizer
+from core import MethodComparison
 
-from utils import AppConstants, StyleSheet
+from utils import AppConstants, StyleSheet, ProblemFactory, ResultRecorder, StoredRun
 from . import InputSection, ResultSection
 
 
 class MultidimOptApp(QMainWindow):
     """Main application window for multidimensional optimization app"""
     def __init__(self, input_section: InputSection, results_section: ResultSection,
-                 optimizers: Dict[str, IOptimizer]) -> None:
+                 optimizers: Dict[str, IOptimizer],
+                 comparison: Optional[MethodComparison] = None,
+                 record_dir: Optional[str] = None) -> None:
         super().__init__()
         self.input_section = input_section
         self.results_section = results_section
         self.optimizers = optimizers
+        self.comparison = comparison or MethodComparison(optimizers)
+        # every run of "Find Optimum" is streamed to a subdirectory of record_dir
+        self.record_dir = record_dir
         
         self._setup_window()
         self.init_ui()
@@ -87,6 +96,22 @@ class MultidimOptApp(QMainWindow):
             AppConstants.BUTTON_FONT_SIZE
         )
         self.btn_clear.clicked.connect(self.on_clear)
+
+        # open stored run
+        self.btn_open_run = self._create_button(
+            "Open Run",
+            AppConstants.BUTTON_HEIGHT,
+            AppConstants.BUTTON_FONT_SIZE
+        )
+        self.btn_open_run.clicked.connect(self.on_open_run)
+
+        # compare
+        self.btn_compare = self._create_button(
+            "Compare Methods", 
+            AppConstants.BUTTON_HEIGHT, 
+            AppConstants.BUTTON_FONT_SIZE
+        )
+        self.btn_compare.clicked.connect(self.on_compare)
         
         # optimize
         self.btn_optimize = self._create_button(
@@ -99,6 +124,8 @@ class MultidimOptApp(QMainWindow):
         
         layout.addStretch()
         layout.addWidget(self.btn_clear)
+        layout.addWidget(self.btn_open_run)
+        layout.addWidget(self.btn_compare)
         layout.addWidget(self.btn_optimize)
         return layout
     
@@ -117,17 +144,32 @@ class MultidimOptApp(QMainWindow):
     def on_optimize(self) -> None:
         """Handle optimize button click: Execute optimization -> Plot"""
         try:
-            problem, success, error_msg = self.input_section.get_data()
+            if self.record_dir:
+                spec, success, error_msg = self.input_section.get_spec()
+            else:
+                problem, success, error_msg = self.input_section.get_data()
             if not success:
                 self._show_error(error_msg)
                 return
 
             # optimization
-            optimizer = self.optimizers.get(problem.method_name)
+            method_name = spec.method_name if self.record_dir else problem.method_name
+            optimizer = self.optimizers.get(method_name)
             if not optimizer:
-                raise ValueError(f"Optimizer '{problem.method_name}' not found")
-            
-            opt_result = optimizer.optimize(problem)
+                raise ValueError(f"Optimizer '{method_name}' not found")
+
+            if self.record_dir:
+                run_name = f"{datetime.now():%Y%m%d-%H%M%S}-{method_name.replace(' ', '_')}"
+                run_path = os.path.join(self.record_dir, run_name)
+                # runs started within the same second get numbered directories
+                suffix = 1
+                while os.path.exists(run_path):
+                    suffix += 1
+                    run_path = os.path.join(self.record_dir, f"{run_name}-{suffix}")
+                recorder = ResultRecorder(run_path, spec)
+                opt_result = recorder.run(optimizer, ProblemFactory.build(spec))
+            else:
+                opt_result = optimizer.optimize(problem)
 
             # display result
             self.results_section.display_results(opt_result)
@@ -136,6 +178,34 @@ class MultidimOptApp(QMainWindow):
         except Exception as e:
             self._show_error(str(e))
 
+    def on_compare(self) -> None:
+        """Handle compare button click: Run all optimizers concurrently -> Table and overlaid plot"""
+        try:
+            spec, success, error_msg = self.input_section.get_spec()
+            if not success:
+                self._show_error(error_msg)
+                return
+
+            entries = self.comparison.compare(spec)
+
+            # display comparison
+            self.results_section.display_comparison(entries)
+            self.tabs.setCurrentIndex(1)
+
+        except Exception as e:
+            self._show_error(str(e))
+
+    def on_open_run(self) -> None:
+        """Handle open run button click: Replay a run stored by ResultRecorder"""
+        path = QFileDialog.getExistingDirectory(self, "Open Stored Run", self.record_dir or "")
+        if not path:
+            return
+        try:
+            self.results_section.display_stored(StoredRun(path))
+            self.tabs.setCurrentIndex(1)
+        except Exception as e:
+            self._show_error(f"Cannot open run: {str(e)}")
+
     def on_clear(self) -> None:
         """Handle clear button click"""
         self.results_section.clear()
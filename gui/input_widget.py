@@ -1,10 +1,12 @@
-import math
 import numpy as np
-from typing import Tuple, List, Callable
-from PyQt6.QtWidgets import QGroupBox, QVBoxLayout, QLineEdit, QComboBox, QFormLayout
+from typing import Tuple, List
+from PyQt6.QtWidgets import (
+    QGroupBox, QVBoxLayout, QHBoxLayout, QLineEdit, QComboBox, QFormLayout,
+    QPushButton, QCheckBox, QFileDialog
+)
 from PyQt6.QtCore import Qt
-from utils import InputWidgetConstants, OptimizationProblem, UIHelper
-import warnings
+from utils import (InputWidgetConstants, OptimizationProblem, ProblemSpec,
+                   ProblemFactory, UIHelper)
 
 
 class InputSection(QGroupBox):
@@ -41,10 +43,15 @@ class InputSection(QGroupBox):
         
         # x0
         self.x0_input = QLineEdit()
-        self.x0_input.setPlaceholderText("e.g. -1.2, 1.0")
+        self.x0_input.setPlaceholderText("e.g. -1.2, 1.0 or path to .npy file")
         self.x0_input.setText(InputWidgetConstants.DEFAULT_X0_STR)
+        x0_browse = QPushButton("Load .npy")
+        x0_browse.clicked.connect(self._browse_x0)
+        x0_layout = QHBoxLayout()
+        x0_layout.addWidget(self.x0_input)
+        x0_layout.addWidget(x0_browse)
         params_layout.addRow(UIHelper.create_label("Start Point (x₀):"),
-                             self.x0_input)
+                             x0_layout)
         
         # eps
         self.eps_input = UIHelper.create_double_spinbox(
@@ -59,12 +66,28 @@ class InputSection(QGroupBox):
             InputWidgetConstants.DEFAULT_MAX_ITER,
             max_width=120)
         params_layout.addRow(UIHelper.create_label("Max Iterations:"), self.max_iter_input)
+
+        # working precision
+        self.float32_checkbox = QCheckBox("Single precision (float32)")
+        params_layout.addRow(UIHelper.create_label("Precision Mode:"), self.float32_checkbox)
         
         main_layout.addWidget(params_group)
         main_layout.addStretch()
 
-    def _parse_vector(self, text: str) -> Tuple[np.ndarray, bool, str]:
-        """Parse comma-separated vector from text"""
+    def _browse_x0(self) -> None:
+        """Pick start point .npy file"""
+        path, _ = QFileDialog.getOpenFileName(self, "Load Start Point", "", "NumPy arrays (*.npy)")
+        if path:
+            self.x0_input.setText(path)
+
+    def _parse_vector(self, text: str, dtype: str = "float64") -> Tuple[np.ndarray, bool, str]:
+        """Parse comma-separated vector from text or memory-map it from a .npy file"""
+        text = text.strip()
+        if text.lower().endswith(".npy"):
+            try:
+                return ProblemFactory.load_vector(text, dtype), True, ""
+            except (OSError, ValueError) as e:
+                return None, False, f"Cannot load start point: {str(e)}"
         try:
             values = [float(x.strip()) for x in text.split(',')]
             if len(values) == 0:
@@ -73,102 +96,40 @@ class InputSection(QGroupBox):
         except ValueError:
             return None, False, "Invalid vector format. Use comma-separated numbers."
 
-    def _create_numerical_gradient(self, func: Callable, h: float = 1e-8) -> Callable:
-        """Create numerical gradient function by formula: (f(x + h) - f(x - h)) / 2*h"""
-        def gradient(x: np.ndarray) -> np.ndarray:
-            grad = np.zeros_like(x)
-            for i in range(len(x)):
-                x_plus = x.copy()
-                x_plus[i] += h
-                x_minus = x.copy()
-                x_minus[i] -= h
-                grad[i] = (func(x_plus) - func(x_minus)) / (2 * h)
-            return grad
-        return gradient
+    def get_spec(self) -> Tuple[ProblemSpec, bool, str]:
+        """Extract and validate input data as a serializable problem spec."""
+        # validation
+        func_str = self.func_input.text().strip()
+        if not func_str:
+            return None, False, "Function cannot be empty."
 
-    def _create_numerical_hessian(self, func: Callable, h: float = 1e-5) -> Callable:
-        """
-        Create numerical Hessian function by formula:
-        d2f/dxidxj = (f(x + h*ei + h*ej)
-                     - f(x + h*ei - h*ej)
-                     - f(x - h*ei + h*ej)
-                     + f(x - h*ei - h*ej) ) / (4*h^2)
-        """
-        def hessian(x: np.ndarray) -> np.ndarray:
-            n = len(x)
-            H = np.zeros((n, n))
-            for i in range(n):
-                for j in range(n):
-                    x_pp = x.copy()
-                    x_pp[i] += h
-                    x_pp[j] += h
-                    
-                    x_pm = x.copy()
-                    x_pm[i] += h
-                    x_pm[j] -= h
-                    
-                    x_mp = x.copy()
-                    x_mp[i] -= h
-                    x_mp[j] += h
-                    
-                    x_mm = x.copy()
-                    x_mm[i] -= h
-                    x_mm[j] -= h
-                    
-                    H[i, j] = (func(x_pp) - func(x_pm) - func(x_mp) + func(x_mm)) / (4 * h * h)
-            return H
-        return hessian
+        # parse x0
+        dtype = "float32" if self.float32_checkbox.isChecked() else "float64"
+        x0, success, error = self._parse_vector(self.x0_input.text(), dtype)
+        if not success:
+            return None, False, error
+
+        spec = ProblemSpec(
+            func_str=func_str,
+            x_0=x0,
+            epsilon=self.eps_input.value(),
+            method_name=self.opt_method_combo.currentText(),
+            max_iter=self.max_iter_input.value(),
+            dtype=dtype,
+            # trajectory of a high-dimensional run would need O(n * iterations) memory
+            store_trajectory=len(x0) <= InputWidgetConstants.MAX_TRAJECTORY_DIM
+        )
+        return spec, True, ""
 
     def get_data(self) -> Tuple[OptimizationProblem, bool, str]:
         """Extract and validate input data."""
         try:
-            # validation
-            func_str = self.func_input.text().strip()
-            if not func_str:
-                return None, False, "Function cannot be empty."
-            
-            # parse x0
-            x0, success, error = self._parse_vector(self.x0_input.text())
+            spec, success, error = self.get_spec()
             if not success:
                 return None, False, error
-            
-            # allow math funcs
-            safe_dict = {k: v for k, v in math.__dict__.items() if not k.startswith("__")}
-            safe_dict['np'] = np
-            
-            def objective_function(x: np.ndarray) -> float:
-                try:
-                    with warnings.catch_warnings():
-                        warnings.filterwarnings('ignore', category=RuntimeWarning)
-                        
-                        safe_dict["x"] = x
-                        val = eval(func_str, {"__builtins__": {}}, safe_dict)
-                        
-                        # invalid results?
-                        if val is None or isinstance(val, complex):
-                            return float("inf")
-                        if math.isnan(val) or math.isinf(val):
-                            return float("inf")
-                        
-                        return float(val)
-                except (ValueError, ZeroDivisionError, OverflowError):
-                    return float("inf")
-                except Exception as e:
-                    raise Exception(str(e))
-
-            # create gradient and hessian
-            grad_func = self._create_numerical_gradient(objective_function)
-            hess_func = self._create_numerical_hessian(objective_function)
 
-            problem = OptimizationProblem(
-                obj_func=objective_function,
-                grad_func=grad_func,
-                hess_func=hess_func,
-                epsilon=self.eps_input.value(),
-                method_name=self.opt_method_combo.currentText(),
-                x_0=x0,
-                max_iter=self.max_iter_input.value()
-            )
+            # compile objective, create gradient and hessian
+            problem = ProblemFactory.build(spec)
             return problem, True, ""
         except Exception as e:
             return None, False, f"Unexpected error: {str(e)}"
\ No newline at end of file
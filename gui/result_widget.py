@@ -1,13 +1,14 @@
 import numpy as np
-from typing import Callable
+from typing import Callable, List
 from PyQt6.QtWidgets import (
-    QGroupBox, QVBoxLayout, QFrame, QGridLayout, QSizePolicy, QHBoxLayout
+    QGroupBox, QVBoxLayout, QFrame, QGridLayout, QSizePolicy, QHBoxLayout,
+    QTableWidget, QTableWidgetItem, QHeaderView
 )
 from PyQt6.QtCore import Qt
 
 from matplotlib.backends.backend_qtagg import FigureCanvasQTAgg
 from matplotlib.figure import Figure
-from utils import (OptimizationResult, ResultWidgetConstants, 
+from utils import (OptimizationResult, ComparisonEntry, ResultWidgetConstants, StoredRun,
                    UIHelper, PlotColors, StatusMessages, StatusColor, SolutionStatus)
 
 
@@ -57,6 +58,21 @@ class ResultSection(QGroupBox):
         details_layout.addWidget(self.lbl_final_eps, 0, 1)
         layout.addLayout(details_layout)
 
+        # note of the optimizer, e.g. the method chosen by "Auto"
+        self.lbl_message = UIHelper.create_label("", style="color: #9E9E9E; font-style: italic;")
+        self.lbl_message.setWordWrap(True)
+        self.lbl_message.hide()
+        layout.addWidget(self.lbl_message)
+
+        # comparison table
+        self.comparison_table = QTableWidget(0, len(ResultWidgetConstants.COMPARISON_COLUMNS))
+        self.comparison_table.setHorizontalHeaderLabels(ResultWidgetConstants.COMPARISON_COLUMNS)
+        self.comparison_table.horizontalHeader().setSectionResizeMode(QHeaderView.ResizeMode.Stretch)
+        self.comparison_table.verticalHeader().setVisible(False)
+        self.comparison_table.setEditTriggers(QTableWidget.EditTrigger.NoEditTriggers)
+        self.comparison_table.hide()
+        layout.addWidget(self.comparison_table)
+
         # graph
         self.figure = Figure(figsize=(6, 4), dpi=100)
         self.figure.patch.set_facecolor(PlotColors.BACKGROUND) 
@@ -64,15 +80,16 @@ class ResultSection(QGroupBox):
         self.canvas.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Expanding)
         layout.addWidget(self.canvas)
 
-    def _format_vector(self, vec: np.ndarray) -> str:
-        """Format vector for display"""
-        if len(vec) <= 5:
+    def _format_vector(self, vec: np.ndarray, edge: int = 3) -> str:
+        """Format vector for display: long vectors as head, tail and dimension (only those entries are read)"""
+        n = len(vec)
+        if n <= 2 * edge:
             return "[" + ", ".join([f"{x:.5f}" for x in vec]) + "]"
-        else:
-            first_three = ", ".join([f"{x:.5f}" for x in vec[:3]])
-            return f"[{first_three}, ..., {vec[-1]:.5f}]"
+        head = ", ".join([f"{x:.5f}" for x in vec[:edge]])
+        tail = ", ".join([f"{x:.5f}" for x in vec[-edge:]])
+        return f"[{head}, ..., {tail}]  (n = {n:,})"
 
-    def display_results(self, opt_result: OptimizationResult) -> None:
+    def display_results(self, opt_result: OptimizationResult, plot: bool = True) -> None:
         """Display text results and plot convergence graph"""
         status = opt_result.status or SolutionStatus.UNKNOWN.value
         status_text = StatusMessages.get_message(status)
@@ -93,9 +110,19 @@ class ResultSection(QGroupBox):
         self.lbl_iters.setText(f"Iterations: {opt_result.iterations}")
         self.lbl_final_eps.setText(f"Precision: {opt_result.final_epsilon:.5f}")
         self.result_card.show()
+        self.lbl_iters.show()
+        self.lbl_final_eps.show()
+        self.lbl_message.setText(opt_result.message or "")
+        self.lbl_message.setVisible(bool(opt_result.message))
+        self.comparison_table.hide()
 
+        if not plot:
+            return
         if status == SolutionStatus.OPTIMAL.value and opt_result.trajectory is not None and len(opt_result.trajectory) > 1:
             self.plot_convergence(opt_result)
+        elif status == SolutionStatus.OPTIMAL.value and opt_result.grad_norms is not None and len(opt_result.grad_norms) > 1:
+            # high-dimensional run without trajectory
+            self.plot_gradient_norms(opt_result)
 
     def plot_convergence(self, opt_res: OptimizationResult) -> None:
         """Draw convergence plot showing distance to optimal point"""
@@ -144,6 +171,141 @@ class ResultSection(QGroupBox):
             self.figure.patch.set_facecolor(PlotColors.BACKGROUND)
             raise Exception(f"Plot error: {str(e)}")
 
+    def display_stored(self, run: StoredRun) -> None:
+        """Display a run replayed from disk; the trajectory is read lazily and decimated for the plot"""
+        result = run.to_result()
+        self.display_results(result, plot=False)
+        if run.n_points > 1 and run.x_min is not None:
+            self.plot_stored(run)
+        elif np.count_nonzero(np.isfinite(result.grad_norms)) > 1:
+            # recorded without its trajectory
+            self.plot_gradient_norms(result)
+        else:
+            self.figure.clear()
+            self.canvas.draw()
+
+    def plot_stored(self, run: StoredRun) -> None:
+        """Draw convergence plot of a stored run from at most MAX_PLOT_POINTS sampled iterates"""
+        try:
+            self.figure.clear()
+            ax = self.figure.add_subplot(111)
+
+            iterations, distances = run.distances(run.x_min, ResultWidgetConstants.MAX_PLOT_POINTS)
+            ax.plot(iterations, distances,
+                   color=PlotColors.TRAJECTORY,
+                   linewidth=2,
+                   marker='o' if len(distances) <= 100 else None,
+                   markersize=4,
+                   label='Distance to optimum')
+            ax.plot(iterations[0], distances[0], 'o',
+                   color=PlotColors.START_POINT,
+                   markersize=8,
+                   zorder=5,
+                   label='Start')
+            ax.plot(iterations[-1], distances[-1], 'o',
+                   color=PlotColors.END_POINT,
+                   markersize=8,
+                   zorder=5,
+                   label='End')
+
+            ax.set_xlabel('Iteration', fontsize=10)
+            ax.set_ylabel('Distance to optimal point', fontsize=10)
+            ax.set_title(f"Convergence Plot ({run.method_name})", fontsize=12, fontweight='bold')
+            ax.grid(True, linestyle=':', alpha=0.6)
+            ax.legend(fontsize='small')
+
+            self.figure.patch.set_facecolor("#FFFFFF")
+            self.canvas.draw()
+        except Exception as e:
+            self.figure.patch.set_facecolor(PlotColors.BACKGROUND)
+            raise Exception(f"Plot error: {str(e)}")
+
+    def plot_gradient_norms(self, opt_res: OptimizationResult) -> None:
+        """Draw convergence plot of the gradient norm (needs no stored trajectory)"""
+        try:
+            self.figure.clear()
+            ax = self.figure.add_subplot(111)
+
+            grad_norms = np.asarray(opt_res.grad_norms)
+            ax.semilogy(np.arange(len(grad_norms)), grad_norms,
+                        color=PlotColors.TRAJECTORY,
+                        linewidth=2,
+                        label='‖∇f(x)‖')
+
+            ax.set_xlabel('Iteration', fontsize=10)
+            ax.set_ylabel('Gradient norm', fontsize=10)
+            ax.set_title("Convergence Plot", fontsize=12, fontweight='bold')
+            ax.grid(True, linestyle=':', alpha=0.6)
+            ax.legend(fontsize='small')
+
+            self.figure.patch.set_facecolor("#FFFFFF")
+            self.canvas.draw()
+        except Exception as e:
+            self.figure.patch.set_facecolor(PlotColors.BACKGROUND)
+            raise Exception(f"Plot error: {str(e)}")
+
+    def display_comparison(self, entries: List[ComparisonEntry]) -> None:
+        """Display comparison table of several methods and overlaid convergence curves"""
+        self.status_label.setText(f"Comparison of {len(entries)} methods")
+        self.status_label.setStyleSheet("font-weight: bold; font-size: 14px; padding: 5px;")
+        self.result_card.hide()
+        self.lbl_iters.hide()
+        self.lbl_final_eps.hide()
+        self.lbl_message.hide()
+
+        self.comparison_table.setRowCount(len(entries))
+        for row, entry in enumerate(entries):
+            res = entry.result
+            status = res.status or SolutionStatus.UNKNOWN.value
+            cells = [
+                entry.method_name,
+                StatusMessages.get_message(status),
+                f"{entry.wall_time:.4f}",
+                str(entry.counts.func),
+                str(entry.counts.grad),
+                str(entry.counts.hess),
+                str(res.iterations) if res.iterations is not None else "-",
+                f"{res.final_epsilon:.3e}" if res.final_epsilon is not None else "-",
+                f"{res.value:.6g}" if res.value is not None else "-",
+            ]
+            for col, text in enumerate(cells):
+                self.comparison_table.setItem(row, col, QTableWidgetItem(text))
+        self.comparison_table.show()
+
+        self.plot_comparison(entries)
+
+    def plot_comparison(self, entries: List[ComparisonEntry]) -> None:
+        """Draw overlaid convergence curves (distance to each method's own final point)"""
+        try:
+            self.figure.clear()
+            ax = self.figure.add_subplot(111)
+
+            for i, entry in enumerate(entries):
+                res = entry.result
+                if res.trajectory is None or res.x_min is None or len(res.trajectory) < 2:
+                    continue
+                distances = np.array([np.linalg.norm(point - res.x_min) for point in res.trajectory])
+                iterations = np.arange(len(distances))
+                # log scale: the final point has zero distance to itself
+                mask = distances > 0
+                ax.plot(iterations[mask], distances[mask],
+                        color=PlotColors.COMPARISON[i % len(PlotColors.COMPARISON)],
+                        linewidth=2,
+                        label=entry.method_name)
+
+            ax.set_yscale('log')
+            ax.set_xlabel('Iteration', fontsize=10)
+            ax.set_ylabel('Distance to final point', fontsize=10)
+            ax.set_title("Convergence Comparison", fontsize=12, fontweight='bold')
+            ax.grid(True, linestyle=':', alpha=0.6)
+            ax.legend(fontsize='small')
+
+            self.figure.patch.set_facecolor("#FFFFFF")
+            self.canvas.draw()
+        except Exception as e:
+            self.figure.patch.set_facecolor(PlotColors.BACKGROUND)
+            raise Exception(f"Plot error: {str(e)}")
+
     def clear(self) -> None:
         """Clear all results"""
         self.status_label.setText("Ready")
@@ -153,5 +315,11 @@ class ResultSection(QGroupBox):
         self.lbl_fmin_val.setText("-")
         self.lbl_iters.setText("Iterations: -")
         self.lbl_final_eps.setText("Precision: -")
+        self.result_card.show()
+        self.lbl_iters.show()
+        self.lbl_final_eps.show()
+        self.lbl_message.hide()
+        self.comparison_table.setRowCount(0)
+        self.comparison_table.hide()
         self.figure.clear()
         self.canvas.draw()
\ No newline at end of file
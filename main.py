@@ -4,6 +4,7 @@ from core import optimizers
 
 from gui.app_window import MultidimOptApp
 from gui import InputSection, ResultSection
+from utils import AppConstants
 
 
 def main():
@@ -12,6 +13,7 @@ def main():
         input_section=InputSection(optimizers.keys()),
         results_section=ResultSection(),
         optimizers=optimizers,
+        record_dir=AppConstants.RECORD_DIR,
     )
     window.show()
     sys.exit(app.exec())
@@ -0,0 +1 @@
+from .async_service import AsyncOptimizationService, OptimizationJob
\ No newline at end of file
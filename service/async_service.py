@@ -0,0 +1,149 @@
+from utils import (
+    IOptimizer, ProblemSpec, ProblemFactory, OptimizationResult,
+    OptimizerState, IterationProgress, OptimizationCancelled
+)
+from concurrent.futures import Executor, ThreadPoolExecutor
+from dataclasses import replace
+from typing import AsyncIterator, Dict, Optional
+import asyncio
+import threading
+import numpy as np
+
+
+class OptimizationJob:
+    """Handle of a submitted optimization: awaitable result, progress stream and cancellation"""
+    def __init__(self, spec: ProblemSpec, progress_buffer: int) -> None:
+        self.spec = spec
+        self.task: Optional[asyncio.Task] = None
+        self._cancel_event = threading.Event()
+        self._progress: asyncio.Queue = asyncio.Queue(maxsize=max(1, progress_buffer))
+        self._done = object()
+
+    def __await__(self):
+        return self.result().__await__()
+
+    async def result(self) -> OptimizationResult:
+        """Wait for the optimization to finish and return its result"""
+        return await self.task
+
+    def cancel(self) -> None:
+        """Request cancellation, the optimizer stops after its current iteration"""
+        self._cancel_event.set()
+        if self.task is not None:
+            self.task.cancel()
+
+    async def progress(self) -> AsyncIterator[IterationProgress]:
+        """
+        Iterate over per-iteration progress until the run finishes.
+        If the consumer is slower than the optimizer, the oldest progress records are dropped.
+        """
+        while True:
+            item = await self._progress.get()
+            if item is self._done:
+                return
+            yield item
+
+    def _publish(self, item) -> None:
+        """Put a progress record, dropping the oldest one when the buffer is full (event loop thread)"""
+        if self._progress.full():
+            self._progress.get_nowait()
+        self._progress.put_nowait(item)
+
+    def _finish(self) -> None:
+        self._publish(self._done)
+
+
+class AsyncOptimizationService:
+    """
+    Asyncio facade over the synchronous optimizers.
+    Runs problem specs on an executor with bounded concurrency and backpressure on submission.
+    """
+    def __init__(self, optimizers: Dict[str, IOptimizer], max_concurrency: int = 4,
+                 max_pending: int = 64, progress_buffer: int = 256,
+                 executor: Optional[Executor] = None) -> None:
+        """
+        Initialize AsyncOptimizationService.
+        Args:
+            optimizers (Dict[str, IOptimizer]): Available optimizers by name.
+            max_concurrency (int): Maximum number of optimizations running at the same time.
+            max_pending (int): Maximum number of submitted but unfinished jobs,
+                `submit` waits for a free slot once it is reached.
+            progress_buffer (int): Number of progress records kept per job for slow consumers.
+            executor (Optional[Executor]): Executor running the optimizers. Must run jobs in
+                threads of this process for progress and cancellation to work (thread pool by default).
+        """
+        self.optimizers = optimizers
+        self.max_concurrency = max_concurrency
+        self.progress_buffer = progress_buffer
+        self._executor = executor or ThreadPoolExecutor(max_workers=max_concurrency)
+        self._owns_executor = executor is None
+        self._running = asyncio.Semaphore(max_concurrency)
+        self._pending = asyncio.Semaphore(max_pending)
+
+    async def submit(self, spec: ProblemSpec) -> OptimizationJob:
+        """
+        Submit a problem for optimization.
+        Waits while `max_pending` jobs are already in flight (backpressure).
+        Args:
+            spec (ProblemSpec): Serializable problem description.
+        Returns:
+            OptimizationJob: Handle to await the result, stream progress and cancel.
+        Raises:
+            ValueError: If the requested optimizer is unknown.
+        """
+        optimizer = self.optimizers.get(spec.method_name)
+        if optimizer is None:
+            raise ValueError(f"Optimizer '{spec.method_name}' not found")
+
+        await self._pending.acquire()
+        job = OptimizationJob(spec, self.progress_buffer)
+        job.task = asyncio.get_running_loop().create_task(self._execute(job, optimizer))
+        return job
+
+    async def optimize(self, spec: ProblemSpec) -> OptimizationResult:
+        """Submit a problem and wait for its result"""
+        job = await self.submit(spec)
+        return await job
+
+    async def _execute(self, job: OptimizationJob, optimizer: IOptimizer) -> OptimizationResult:
+        loop = asyncio.get_running_loop()
+        try:
+            async with self._running:
+                future = loop.run_in_executor(self._executor, self._run, job, optimizer, loop)
+                try:
+                    return await asyncio.shield(future)
+                except asyncio.CancelledError:
+                    # stop the worker thread cooperatively and wait until it has let go
+                    job._cancel_event.set()
+                    try:
+                        await future
+                    except OptimizationCancelled:
+                        pass
+                    raise
+        finally:
+            job._finish()
+            self._pending.release()
+
+    @staticmethod
+    def _run(job: OptimizationJob, optimizer: IOptimizer,
+             loop: asyncio.AbstractEventLoop) -> OptimizationResult:
+        """Compile and solve the problem (executor thread)"""
+        def callback(state: OptimizerState) -> None:
+            if job._cancel_event.is_set():
+                raise OptimizationCancelled(f"Optimization of '{job.spec.func_str}' was cancelled")
+            progress = IterationProgress(
+                iteration=state.iteration,
+                x=np.array(state.x, copy=True),
+                grad_norm=float(np.linalg.norm(state.grad)) if state.grad is not None else None
+            )
+            loop.call_soon_threadsafe(job._publish, progress)
+
+        if job._cancel_event.is_set():
+            raise OptimizationCancelled(f"Optimization of '{job.spec.func_str}' was cancelled")
+        problem = replace(ProblemFactory.build(job.spec), callback=callback)
+        return optimizer.optimize(problem)
+
+    def shutdown(self) -> None:
+        """Release the executor created by the service"""
+        if self._owns_executor:
+            self._executor.shutdown(wait=False, cancel_futures=True)
\ No newline at end of file
@@ -0,0 +1,302 @@
+"""
+Coordinator/worker pool over plain TCP (multiprocessing.connection, no external broker).
+
+Coordinator side:
+    coordinator = Coordinator(("0.0.0.0", 6000), authkey=b"secret")
+    coordinator.start()
+    results = coordinator.run_batch(specs)
+
+Worker side (any number of hosts):
+    python -m service.distributed --address coordinator-host:6000 --authkey secret
+"""
+from utils import ProblemSpec, ProblemFactory, OptimizationResult, SolutionStatus, IOptimizer
+from multiprocessing.connection import Listener, Client, Connection
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Set, Tuple
+import argparse
+import itertools
+import multiprocessing
+import threading
+
+
+def _failed_result() -> OptimizationResult:
+    return OptimizationResult(
+        x_min=None,
+        value=None,
+        iterations=None,
+        final_epsilon=None,
+        trajectory=None,
+        status=SolutionStatus.ERROR.value
+    )
+
+
+@dataclass
+class _Task:
+    task_id: int
+    spec: ProblemSpec
+    attempts: int = 0
+    assigned: Set[int] = field(default_factory=set)
+    result: Optional[OptimizationResult] = None
+    error: Optional[str] = None
+
+    @property
+    def done(self) -> bool:
+        return self.result is not None
+
+
+class Coordinator:
+    """
+    Ships problem specs to connected workers and collects results.
+    Workers pull one task at a time; once the queue is empty, idle workers speculatively
+    re-run tasks still in flight on slower workers (work stealing) and the first result wins.
+    Tasks of a worker whose connection is lost are requeued up to `max_retries` times.
+    """
+    def __init__(self, address: Tuple[str, int] = ("127.0.0.1", 0), authkey: bytes = b"multidim-opt",
+                 max_retries: int = 3, max_copies: int = 2) -> None:
+        """
+        Initialize Coordinator.
+        Args:
+            address (Tuple[str, int]): Host and port to listen on, port 0 picks a free port.
+            authkey (bytes): Shared secret that workers must present.
+            max_retries (int): How many times a task is requeued after losing its worker.
+            max_copies (int): Maximum number of workers running the same task at once.
+        """
+        self.authkey = authkey
+        self.max_retries = max_retries
+        self.max_copies = max_copies
+        self._listener = Listener(address, authkey=authkey)
+        self.address = self._listener.address
+
+        self._lock = threading.Condition()
+        self._tasks: Dict[int, _Task] = {}
+        self._pending: deque = deque()
+        self._ids = itertools.count()
+        self._worker_ids = itertools.count()
+        self._workers: Set[int] = set()
+        self._closed = False
+        self._accept_thread: Optional[threading.Thread] = None
+
+    @property
+    def n_workers(self) -> int:
+        with self._lock:
+            return len(self._workers)
+
+    def start(self) -> None:
+        """Start accepting worker connections in a background thread"""
+        self._accept_thread = threading.Thread(target=self._accept_loop, daemon=True)
+        self._accept_thread.start()
+
+    def wait_for_workers(self, count: int, timeout: Optional[float] = None) -> bool:
+        """Block until at least `count` workers are connected"""
+        with self._lock:
+            return self._lock.wait_for(lambda: len(self._workers) >= count, timeout)
+
+    def run_batch(self, specs: List[ProblemSpec], timeout: Optional[float] = None) -> List[OptimizationResult]:
+        """
+        Solve all specs on the worker pool.
+        Args:
+            specs (List[ProblemSpec]): Problems to solve.
+            timeout (Optional[float]): Maximum time to wait for the whole batch, in seconds.
+        Returns:
+            List[OptimizationResult]: Results in the order of `specs`. Tasks that failed on a worker
+            or exhausted their retries have status ERROR.
+        Raises:
+            TimeoutError: If the batch did not finish in time.
+        """
+        with self._lock:
+            tasks = [_Task(next(self._ids), spec) for spec in specs]
+            for task in tasks:
+                self._tasks[task.task_id] = task
+                self._pending.append(task)
+            self._lock.notify_all()
+
+            if not self._lock.wait_for(lambda: all(task.done for task in tasks), timeout):
+                raise TimeoutError(f"Batch of {len(specs)} problems did not finish in {timeout} s")
+            for task in tasks:
+                del self._tasks[task.task_id]
+        return [task.result for task in tasks]
+
+    def close(self) -> None:
+        """Stop all workers and the listener"""
+        with self._lock:
+            self._closed = True
+            self._lock.notify_all()
+        self._listener.close()
+
+    def _accept_loop(self) -> None:
+        while not self._closed:
+            try:
+                conn = self._listener.accept()
+            except (OSError, EOFError):
+                # closed listener or failed handshake
+                if self._closed:
+                    return
+                continue
+            threading.Thread(target=self._serve_worker, args=(conn,), daemon=True).start()
+
+    def _serve_worker(self, conn: Connection) -> None:
+        """Conversation with one worker: every message from it is a request for the next task"""
+        with self._lock:
+            worker_id = next(self._worker_ids)
+            self._workers.add(worker_id)
+            self._lock.notify_all()
+        in_flight: Set[int] = set()
+        try:
+            while True:
+                message = conn.recv()
+                if message[0] == "result":
+                    self._complete(message[1], worker_id, result=message[2])
+                    in_flight.discard(message[1])
+                elif message[0] == "error":
+                    self._complete(message[1], worker_id, error=message[2])
+                    in_flight.discard(message[1])
+
+                task = self._next_task(worker_id)
+                if task is None:
+                    conn.send(("stop",))
+                    return
+                in_flight.add(task.task_id)
+                conn.send(("task", task.task_id, task.spec))
+        except (EOFError, OSError):
+            # worker lost: give its tasks to somebody else
+            self._requeue(worker_id, in_flight)
+        finally:
+            with self._lock:
+                self._workers.discard(worker_id)
+                self._lock.notify_all()
+            conn.close()
+
+    def _next_task(self, worker_id: int) -> Optional[_Task]:
+        """Block until there is a task for the worker, None on shutdown"""
+        with self._lock:
+            while not self._closed:
+                while self._pending:
+                    task = self._pending.popleft()
+                    if not task.done:
+                        task.assigned.add(worker_id)
+                        return task
+                # queue is empty: steal the least replicated unfinished task
+                candidates = [
+                    task for task in self._tasks.values()
+                    if not task.done and worker_id not in task.assigned
+                    and 0 < len(task.assigned) < self.max_copies
+                ]
+                if candidates:
+                    task = min(candidates, key=lambda t: (len(t.assigned), t.task_id))
+                    task.assigned.add(worker_id)
+                    return task
+                self._lock.wait()
+            return None
+
+    def _complete(self, task_id: int, worker_id: int,
+                  result: Optional[OptimizationResult] = None, error: Optional[str] = None) -> None:
+        with self._lock:
+            task = self._tasks.get(task_id)
+            if task is None or task.done:
+                # result of a speculative copy that lost the race
+                return
+            task.assigned.discard(worker_id)
+            task.error = error
+            task.result = result if error is None else _failed_result()
+            self._lock.notify_all()
+
+    def _requeue(self, worker_id: int, task_ids: Set[int]) -> None:
+        with self._lock:
+            for task_id in task_ids:
+                task = self._tasks.get(task_id)
+                if task is None or task.done:
+                    continue
+                task.assigned.discard(worker_id)
+                if task.assigned:
+                    # another copy is still running
+                    continue
+                task.attempts += 1
+                if task.attempts > self.max_retries:
+                    task.error = f"Task {task_id} lost its worker {task.attempts} times"
+                    task.result = _failed_result()
+                else:
+                    self._pending.appendleft(task)
+            self._lock.notify_all()
+
+
+def run_worker(address: Tuple[str, int], authkey: bytes = b"multidim-opt",
+               optimizers: Optional[Dict[str, IOptimizer]] = None) -> None:
+    """
+    Connect to a coordinator and solve tasks until it says stop.
+    Args:
+        address (Tuple[str, int]): Coordinator host and port.
+        authkey (bytes): Shared secret of the coordinator.
+        optimizers (Optional[Dict[str, IOptimizer]]): Optimizers by name, `core.optimizers` by default.
+    """
+    if optimizers is None:
+        from core import optimizers
+    conn = Client(address, authkey=authkey)
+    try:
+        conn.send(("ready",))
+        while True:
+            message = conn.recv()
+            if message[0] == "stop":
+                return
+            _, task_id, spec = message
+            try:
+                optimizer = optimizers.get(spec.method_name)
+                if optimizer is None:
+                    raise ValueError(f"Optimizer '{spec.method_name}' not found")
+                result = optimizer.optimize(ProblemFactory.build(spec))
+                conn.send(("result", task_id, result))
+            except Exception as e:
+                conn.send(("error", task_id, str(e)))
+    except (EOFError, OSError):
+        # coordinator went away
+        return
+    finally:
+        conn.close()
+
+
+class LocalCluster:
+    """Coordinator with several worker processes on localhost"""
+    def __init__(self, n_workers: int = 2, **coordinator_kwargs) -> None:
+        self.n_workers = n_workers
+        self.coordinator = Coordinator(**coordinator_kwargs)
+        self.processes: List[multiprocessing.Process] = []
+
+    def __enter__(self) -> "LocalCluster":
+        self.coordinator.start()
+        for _ in range(self.n_workers):
+            self.add_worker()
+        self.coordinator.wait_for_workers(self.n_workers)
+        return self
+
+    def add_worker(self) -> multiprocessing.Process:
+        process = multiprocessing.Process(
+            target=run_worker,
+            args=(self.coordinator.address, self.coordinator.authkey),
+            daemon=True
+        )
+        process.start()
+        self.processes.append(process)
+        return process
+
+    def run_batch(self, specs: List[ProblemSpec], timeout: Optional[float] = None) -> List[OptimizationResult]:
+        return self.coordinator.run_batch(specs, timeout)
+
+    def __exit__(self, *exc) -> None:
+        self.coordinator.close()
+        for process in self.processes:
+            process.join(timeout=5)
+            if process.is_alive():
+                process.terminate()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Optimization worker")
+    parser.add_argument("--address", required=True, help="host:port of the coordinator")
+    parser.add_argument("--authkey", default="multidim-opt")
+    args = parser.parse_args()
+    host, _, port = args.address.partition(":")
+    run_worker((host, int(port)), args.authkey.encode())
+
+
+if __name__ == "__main__":
+    main()
\ No newline at end of file
@@ -0,0 +1,144 @@
+"""
+Minimal local HTTP/JSON front end for AsyncOptimizationService (standard library only).
+
+    python -m service.http_server --port 8080
+
+POST /optimize   {"func": "...", "x0": [...], "method": "...", "epsilon": 1e-6, "max_iter": 1000,
+                  "params": {"a": 100}}
+GET  /methods    list of available optimizers
+GET  /health
+"""
+from utils import ProblemSpec, OptimizationResult
+from .async_service import AsyncOptimizationService
+from typing import Tuple, Optional
+import argparse
+import asyncio
+import json
+import numpy as np
+
+
+def spec_from_json(payload: dict) -> ProblemSpec:
+    """Build ProblemSpec from a request body"""
+    try:
+        return ProblemSpec(
+            func_str=str(payload["func"]),
+            x_0=np.asarray(payload["x0"], dtype=float),
+            epsilon=float(payload.get("epsilon", 1e-6)),
+            method_name=str(payload["method"]),
+            max_iter=int(payload.get("max_iter", 1000)),
+            params={str(k): float(v) for k, v in payload.get("params", {}).items()}
+        )
+    except KeyError as e:
+        raise ValueError(f"Missing field {e}")
+
+
+def result_to_json(result: OptimizationResult) -> dict:
+    """Convert OptimizationResult to a JSON-serializable dict (trajectory is omitted)"""
+    return {
+        "status": result.status,
+        "x_min": None if result.x_min is None else np.asarray(result.x_min).tolist(),
+        "value": result.value,
+        "iterations": result.iterations,
+        "final_epsilon": None if result.final_epsilon is None else float(result.final_epsilon),
+        "message": result.message,
+    }
+
+
+class OptimizationHTTPServer:
+    """Tiny HTTP/1.1 server (one request per connection) exposing the async optimization service"""
+    def __init__(self, service: AsyncOptimizationService,
+                 host: str = "127.0.0.1", port: int = 8080) -> None:
+        self.service = service
+        self.host = host
+        self.port = port
+        self._server: Optional[asyncio.base_events.Server] = None
+
+    async def start(self) -> None:
+        self._server = await asyncio.start_server(self._handle, self.host, self.port)
+        # port 0 binds a free port
+        self.port = self._server.sockets[0].getsockname()[1]
+
+    async def serve_forever(self) -> None:
+        if self._server is None:
+            await self.start()
+        async with self._server:
+            await self._server.serve_forever()
+
+    async def stop(self) -> None:
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+
+    async def _handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        try:
+            method, path, body = await self._read_request(reader)
+            status, payload = await self._route(method, path, body)
+        except ValueError as e:
+            status, payload = 400, {"error": str(e)}
+        except Exception as e:
+            status, payload = 500, {"error": str(e)}
+        data = json.dumps(payload).encode()
+        writer.write(
+            f"HTTP/1.1 {status} {'OK' if status == 200 else 'Error'}\r\n"
+            f"Content-Type: application/json\r\n"
+            f"Content-Length: {len(data)}\r\n"
+            f"Connection: close\r\n\r\n".encode() + data
+        )
+        try:
+            await writer.drain()
+        finally:
+            writer.close()
+
+    @staticmethod
+    async def _read_request(reader: asyncio.StreamReader) -> Tuple[str, str, bytes]:
+        request_line = (await reader.readline()).decode().split()
+        if len(request_line) < 2:
+            raise ValueError("Malformed request line")
+        headers = {}
+        while True:
+            line = (await reader.readline()).decode().strip()
+            if not line:
+                break
+            key, _, value = line.partition(":")
+            headers[key.strip().lower()] = value.strip()
+        length = int(headers.get("content-length", 0))
+        body = await reader.readexactly(length) if length else b""
+        return request_line[0], request_line[1], body
+
+    async def _route(self, method: str, path: str, body: bytes) -> Tuple[int, dict]:
+        if method == "GET" and path == "/health":
+            return 200, {"status": "ok"}
+        if method == "GET" and path == "/methods":
+            return 200, {"methods": list(self.service.optimizers)}
+        if method == "POST" and path == "/optimize":
+            spec = spec_from_json(json.loads(body or b"{}"))
+            result = await self.service.optimize(spec)
+            return 200, result_to_json(result)
+        return 404, {"error": f"No route for {method} {path}"}
+
+
+def main() -> None:
+    from core import optimizers
+
+    parser = argparse.ArgumentParser(description="Local HTTP/JSON optimization service")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8080)
+    parser.add_argument("--concurrency", type=int, default=4)
+    parser.add_argument("--max-pending", type=int, default=64)
+    args = parser.parse_args()
+
+    async def run() -> None:
+        service = AsyncOptimizationService(optimizers, args.concurrency, args.max_pending)
+        server = OptimizationHTTPServer(service, args.host, args.port)
+        await server.start()
+        print(f"Serving on http://{server.host}:{server.port}")
+        try:
+            await server.serve_forever()
+        finally:
+            service.shutdown()
+
+    asyncio.run(run())
+
+
+if __name__ == "__main__":
+    main()
\ No newline at end of file
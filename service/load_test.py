@@ -0,0 +1,90 @@
+"""
+Load test for the local HTTP/JSON optimization service.
+
+    python -m service.http_server --port 8080 &
+    python -m service.load_test --url 127.0.0.1:8080 --requests 200 --concurrency 16
+"""
+from utils import InputWidgetConstants
+from typing import List, Tuple
+import argparse
+import asyncio
+import json
+import time
+import numpy as np
+
+
+async def post_json(host: str, port: int, path: str, payload: dict) -> Tuple[int, dict]:
+    """Send one POST request and return (status code, decoded body)"""
+    reader, writer = await asyncio.open_connection(host, port)
+    body = json.dumps(payload).encode()
+    writer.write(
+        f"POST {path} HTTP/1.1\r\nHost: {host}\r\n"
+        f"Content-Type: application/json\r\nContent-Length: {len(body)}\r\n\r\n".encode() + body
+    )
+    await writer.drain()
+    response = await reader.read()
+    writer.close()
+    head, _, data = response.partition(b"\r\n\r\n")
+    status = int(head.split()[1])
+    return status, json.loads(data)
+
+
+async def run_load(host: str, port: int, payload: dict,
+                   n_requests: int, concurrency: int) -> Tuple[List[float], int, float]:
+    """
+    Fire n_requests with at most `concurrency` in flight.
+    Returns:
+        Tuple: (latencies of successful requests in seconds, number of failures, total wall time)
+    """
+    latencies: List[float] = []
+    failures = 0
+    limit = asyncio.Semaphore(concurrency)
+
+    async def one() -> None:
+        nonlocal failures
+        async with limit:
+            start = time.perf_counter()
+            try:
+                status, _ = await post_json(host, port, "/optimize", payload)
+            except (OSError, ValueError):
+                status = -1
+            if status == 200:
+                latencies.append(time.perf_counter() - start)
+            else:
+                failures += 1
+
+    start = time.perf_counter()
+    await asyncio.gather(*(one() for _ in range(n_requests)))
+    return latencies, failures, time.perf_counter() - start
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Throughput and latency of the optimization service")
+    parser.add_argument("--url", default="127.0.0.1:8080", help="host:port of the service")
+    parser.add_argument("--requests", type=int, default=200)
+    parser.add_argument("--concurrency", type=int, default=16)
+    parser.add_argument("--method", default="Newton method")
+    parser.add_argument("--func", default=InputWidgetConstants.DEFAULT_FUNC)
+    parser.add_argument("--x0", default=InputWidgetConstants.DEFAULT_X0_STR)
+    args = parser.parse_args()
+
+    host, _, port = args.url.partition(":")
+    payload = {
+        "func": args.func,
+        "x0": [float(v) for v in args.x0.split(",")],
+        "method": args.method,
+        "epsilon": InputWidgetConstants.DEFAULT_EPS,
+        "max_iter": InputWidgetConstants.DEFAULT_MAX_ITER,
+    }
+    latencies, failures, wall = asyncio.run(
+        run_load(host, int(port), payload, args.requests, args.concurrency)
+    )
+    print(f"requests: {args.requests}, failures: {failures}, wall time: {wall:.3f} s")
+    print(f"throughput: {len(latencies) / wall:.1f} req/s")
+    if latencies:
+        p50, p90, p99 = np.percentile(np.array(latencies) * 1000, [50, 90, 99])
+        print(f"latency ms: p50={p50:.2f} p90={p90:.2f} p99={p99:.2f} max={max(latencies) * 1000:.2f}")
+
+
+if __name__ == "__main__":
+    main()
\ No newline at end of file
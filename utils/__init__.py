@@ -1,6 +1,14 @@
-from .interfaces import IOptimizer, ILineSearch
+from .interfaces import IOptimizer, ILineSearch, ILeastSquaresOptimizer, IStochasticOptimizer
 from .constants import (AppConstants, InputWidgetConstants, ResultWidgetConstants, 
                         PlotColors, StatusColor, SolutionStatus, StatusMessages)
-from .containers import OptimizationResult, OptimizationProblem
+from .containers import (OptimizationResult, OptimizationProblem, LeastSquaresProblem, FiniteSumProblem,
+                         ProblemSpec, EvaluationCounts, ComparisonEntry, OptimizerState, IterationProgress,
+                         ProblemProfile, SweepEntry, ObjectiveTerms)
+from .checkpoint import Checkpointer
+from .shared_memory import SharedArray, SharedArrayPool
+from .tracing import Tracer, tracer, traced
+from .iteration_hooks import IterationHooks, OptimizationCancelled
+from .problem_factory import ProblemFactory
+from .result_store import ResultRecorder, StoredRun
 from .ui_helper import UIHelper
 from .stylesheet import StyleSheet
\ No newline at end of file
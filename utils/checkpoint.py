@@ -0,0 +1,154 @@
+import os
+import json
+import numpy as np
+from typing import List, Optional, Tuple
+from .containers import OptimizerState
+
+
+class Checkpointer:
+    """
+    Periodically stores optimizer state to a compressed .npz file
+    and restores it to resume an interrupted run.
+    The trajectory is appended to a raw file next to the .npz,
+    so the cost of a save does not grow with the number of iterations.
+    """
+    _EXTRA_PREFIX = "extra__"
+
+    def __init__(self, path: str, every: int = 10) -> None:
+        """
+        Initialize Checkpointer.
+        Args:
+            path (str): Checkpoint file path (".npz" is appended if missing).
+            every (int): Save the state every `every` iterations.
+        """
+        if every < 1:
+            raise ValueError("Checkpoint interval must be a positive number of iterations")
+        self.path = path if path.endswith(".npz") else path + ".npz"
+        self.every = every
+        # trajectory points already in the trajectory file
+        self._saved_points = 0
+        self._trajectory_dtype = np.dtype(float).str
+
+    def is_due(self, iteration: int) -> bool:
+        """Whether the state of the given iteration should be saved"""
+        return iteration % self.every == 0
+
+    @property
+    def trajectory_path(self) -> str:
+        return self.path[:-len(".npz")] + ".trajectory"
+
+    def save(self, state: OptimizerState, fingerprint: str = "") -> None:
+        """
+        Atomically write the state, so a crash during saving never corrupts the previous checkpoint.
+        Only the trajectory points added since the previous save are appended to the raw trajectory file;
+        the .npz holds the resume state and how many points of that file belong to it.
+        Args:
+            state (OptimizerState): Optimizer state to store.
+            fingerprint (str): Identifies the problem (objective, x₀); checked on resume.
+        """
+        saved = self._saved_points
+        if len(state.trajectory) < saved:
+            # not a continuation of the stored trajectory: start the file over
+            saved = 0
+        if len(state.trajectory) > saved:
+            new_points = np.ascontiguousarray(state.trajectory[saved:])
+            # the points are on disk before the .npz that counts them replaces the previous one;
+            # bytes past the counted points (a save that crashed) are overwritten here
+            with open(self.trajectory_path, "r+b" if saved and os.path.exists(self.trajectory_path) else "wb") as f:
+                f.seek(saved * new_points[0].nbytes)
+                f.write(new_points.tobytes())
+                f.truncate()
+            self._trajectory_dtype = new_points.dtype.str
+        self._saved_points = len(state.trajectory)
+
+        arrays = {
+            "method_name": np.array(state.method_name),
+            "fingerprint": np.array(fingerprint),
+            "iteration": np.array(state.iteration),
+            "x": np.asarray(state.x),
+            "trajectory_points": np.array(self._saved_points),
+            "trajectory_dtype": np.array(self._trajectory_dtype),
+            "grad_norms": np.asarray(state.grad_norms, dtype=float),
+            "rng_state": np.array(json.dumps(state.rng_state) if state.rng_state is not None else ""),
+        }
+        if state.grad is not None:
+            arrays["grad"] = np.asarray(state.grad)
+        for key, value in state.extras.items():
+            arrays[self._EXTRA_PREFIX + key] = np.asarray(value)
+
+        tmp_path = self.path + ".tmp"
+        with open(tmp_path, "wb") as f:
+            np.savez_compressed(f, **arrays)
+        os.replace(tmp_path, self.path)
+
+    def _load_trajectory(self, data: np.lib.npyio.NpzFile, n: int) -> List[np.ndarray]:
+        """Trajectory of the stored state; later saves append after the points read here"""
+        if "trajectory" in data.files:
+            # checkpoint written before trajectories were stored separately
+            self._saved_points = 0
+            return [point.copy() for point in data["trajectory"]]
+        self._saved_points = int(data["trajectory_points"])
+        self._trajectory_dtype = str(data["trajectory_dtype"])
+        if self._saved_points == 0:
+            return []
+        flat = np.fromfile(self.trajectory_path, dtype=self._trajectory_dtype, count=self._saved_points * n)
+        return list(flat.reshape(self._saved_points, n))
+
+    def load(self) -> Optional[OptimizerState]:
+        """
+        Read the stored state.
+        Returns:
+            Optional[OptimizerState]: Stored state or None if there is no checkpoint yet.
+        """
+        state, _ = self._load()
+        return state
+
+    def _load(self) -> Tuple[Optional[OptimizerState], str]:
+        """Stored state and the fingerprint of its problem ("" if unknown)"""
+        if not os.path.exists(self.path):
+            return None, ""
+        with np.load(self.path, allow_pickle=False) as data:
+            rng_state = str(data["rng_state"])
+            state = OptimizerState(
+                method_name=str(data["method_name"]),
+                iteration=int(data["iteration"]),
+                x=data["x"].copy(),
+                grad=data["grad"].copy() if "grad" in data.files else None,
+                trajectory=self._load_trajectory(data, len(data["x"])),
+                grad_norms=data["grad_norms"].tolist() if "grad_norms" in data.files else [],
+                extras={
+                    key[len(self._EXTRA_PREFIX):]: data[key].copy()
+                    for key in data.files if key.startswith(self._EXTRA_PREFIX)
+                },
+                rng_state=json.loads(rng_state) if rng_state else None
+            )
+            return state, str(data["fingerprint"]) if "fingerprint" in data.files else ""
+
+    def resume(self, method_name: str, fingerprint: str = "") -> Optional[OptimizerState]:
+        """
+        Load the stored state for the given optimizer and problem.
+        Args:
+            method_name (str): Name of the optimizer class that is resuming.
+            fingerprint (str): Identifies the problem being solved, "" to skip the check.
+        Returns:
+            Optional[OptimizerState]: Stored state or None if the run starts from scratch.
+        Raises:
+            ValueError: If the checkpoint was written by a different optimizer or for a different problem.
+        """
+        state, stored_fingerprint = self._load()
+        if state is not None and state.method_name != method_name:
+            raise ValueError(
+                f"Checkpoint '{self.path}' was written by {state.method_name}, not {method_name}"
+            )
+        if state is not None and fingerprint and stored_fingerprint and stored_fingerprint != fingerprint:
+            raise ValueError(
+                f"Checkpoint '{self.path}' was written for a different problem (objective, dimension or x₀)"
+            )
+        return state
+
+    def clear(self) -> None:
+        """Remove the checkpoint and its trajectory file"""
+        for path in (self.path, self.trajectory_path):
+            if os.path.exists(path):
+                os.remove(path)
+        self._saved_points = 0
\ No newline at end of file
@@ -48,6 +48,8 @@ class AppConstants:
     BUTTON_FONT_SIZE = 12
     LAYOUT_SPACING = 15
     LAYOUT_MARGINS = 15
+    # "Find Optimum" runs are recorded here, one subdirectory per run
+    RECORD_DIR = "runs"
 
 # input widget
 class InputWidgetConstants:
@@ -55,6 +57,7 @@ class InputWidgetConstants:
     DEFAULT_X0_STR = "-1.2, 1.0"
     DEFAULT_EPS = 1e-6
     DEFAULT_MAX_ITER = 1000
+    MAX_TRAJECTORY_DIM = 10_000
 
 # result widget
 class ResultWidgetConstants:
@@ -62,6 +65,10 @@ class ResultWidgetConstants:
     HEADER_SIZE = 12
     VALUE_SIZE = 16
     COORD_SIZE = 14
+    COMPARISON_COLUMNS = ["Method", "Status", "Wall time, s", "f evals", "∇f evals",
+                          "∇²f evals", "Iterations", "Final ‖∇f‖", "f(x*)"]
+    # samples of a stored run drawn on the convergence plot
+    MAX_PLOT_POINTS = 2000
 
 # plot
 class PlotColors:
@@ -69,4 +76,5 @@ class PlotColors:
     START_POINT = '#FF9800'
     END_POINT = '#4CAF50'
     CONTOUR_LINES = '#888888'
+    COMPARISON = ['#0078D7', '#E91E63', '#4CAF50', '#FF9800', '#9C27B0', '#00BCD4', '#795548']
     BACKGROUND = "#0A0A0A60"
\ No newline at end of file
@@ -1,7 +1,11 @@
-from typing import Callable, Optional, List
-from dataclasses import dataclass
+from typing import Callable, Optional, List, Dict, Any, Union, TYPE_CHECKING
+from dataclasses import dataclass, field
 import numpy as np
 
+if TYPE_CHECKING:
+    from .checkpoint import Checkpointer
+    from .shared_memory import SharedArray
+
 @dataclass
 class OptimizationProblem:
     obj_func: Callable[[np.ndarray], float]
@@ -12,6 +16,63 @@ class OptimizationProblem:
     method_name: str
     x_0: np.ndarray 
     max_iter: int = 1000
+    checkpointer: Optional["Checkpointer"] = None
+    callback: Optional[Callable[["OptimizerState"], None]] = None
+    store_trajectory: bool = True
+    # f evaluated for every column of an (n, k) array; if None, ProblemFactory.batch_objective
+    # compiles it from func_str when an optimizer asks for it
+    batch_obj_func: Optional[Callable[[np.ndarray], np.ndarray]] = None
+    # top-level summands of f with the coordinates they read; if None, ProblemFactory.objective_terms
+    # splits func_str when an optimizer asks for them
+    terms: Optional["ObjectiveTerms"] = None
+    # source of obj_func, identifies the problem in checkpoints
+    func_str: Optional[str] = None
+    params: Dict[str, float] = field(default_factory=dict)
+    # set by ProblemFactory.with_counters
+    counts: Optional["EvaluationCounts"] = None
+
+@dataclass
+class ObjectiveTerms:
+    """Objective split into its top-level summands f(x) = Σ t_k(x) + const"""
+    # sorted coordinates read by each term, None for a term that uses the whole vector (x, x[1:], np.sum(x))
+    indices: List[Optional[np.ndarray]]
+    # compiles the sum of the selected terms into one function (raw value, invalid values are not mapped)
+    combine: Callable[[List[int]], Callable[[np.ndarray], float]]
+
+@dataclass
+class LeastSquaresProblem:
+    """Minimization of sum of squared residuals r(x, d) over a (possibly memory-mapped) dataset"""
+    residual_func: Callable[[np.ndarray, np.ndarray], np.ndarray]
+    data: np.ndarray
+
+    epsilon: float
+    method_name: str
+    x_0: np.ndarray
+    max_iter: int = 1000
+    chunk_size: int = 65536
+    checkpointer: Optional["Checkpointer"] = None
+    callback: Optional[Callable[["OptimizerState"], None]] = None
+    store_trajectory: bool = True
+
+@dataclass
+class FiniteSumProblem:
+    """Minimization of the mean per-row loss l(x, d) over a (possibly memory-mapped) dataset"""
+    loss_func: Callable[[np.ndarray, np.ndarray], np.ndarray]
+    # gradient of the mean loss of a batch of rows
+    batch_grad_func: Callable[[np.ndarray, np.ndarray], np.ndarray]
+    data: np.ndarray
+
+    epsilon: float
+    method_name: str
+    x_0: np.ndarray
+    max_epochs: int = 100
+    batch_size: int = 256
+    # rows read from the dataset at once; batches are drawn from a shuffled chunk
+    chunk_size: int = 65536
+    seed: int = 0
+    checkpointer: Optional["Checkpointer"] = None
+    callback: Optional[Callable[["OptimizerState"], None]] = None
+    store_trajectory: bool = True
 
 @dataclass
 class OptimizationResult:
@@ -20,4 +81,75 @@ class OptimizationResult:
     iterations: Optional[int]
     final_epsilon: Optional[float]
     trajectory: Optional[List[np.ndarray]]
-    status: str = 'optimal'
\ No newline at end of file
+    status: str = 'optimal'
+    grad_norms: Optional[List[float]] = None
+    # human-readable note, e.g. which method an automatic selection chose and why
+    message: Optional[str] = None
+
+@dataclass
+class ProblemSpec:
+    """Serializable problem description that can be shipped to worker processes"""
+    func_str: str
+    # a SharedArray descriptor lets workers on the same host map x_0 instead of unpickling a copy
+    x_0: Union[np.ndarray, "SharedArray"]
+    epsilon: float
+    method_name: str
+    max_iter: int = 1000
+    dtype: str = "float64"
+    store_trajectory: bool = True
+    # values of the named parameters of func_str, e.g. {"a": 100.0} for "a * (x[1] - x[0]**2)**2 + ..."
+    params: Dict[str, float] = field(default_factory=dict)
+
+@dataclass
+class EvaluationCounts:
+    func: int = 0
+    grad: int = 0
+    hess: int = 0
+
+@dataclass
+class ComparisonEntry:
+    method_name: str
+    result: OptimizationResult
+    wall_time: float
+    counts: EvaluationCounts = field(default_factory=EvaluationCounts)
+
+@dataclass
+class SweepEntry:
+    """Solution of one grid point of a parameter sweep"""
+    params: Dict[str, float]
+    result: OptimizationResult
+    wall_time: float
+    # started from the solution of the previous grid point of the branch instead of x_0
+    warm_started: bool = False
+    branch: int = 0
+
+@dataclass
+class OptimizerState:
+    """Snapshot of an optimizer loop, sufficient to continue the run exactly where it stopped"""
+    method_name: str
+    iteration: int
+    x: np.ndarray
+    grad: Optional[np.ndarray] = None
+    trajectory: List[np.ndarray] = field(default_factory=list)
+    grad_norms: List[float] = field(default_factory=list)
+    extras: Dict[str, np.ndarray] = field(default_factory=dict)
+    rng_state: Optional[Dict[str, Any]] = None
+
+@dataclass
+class IterationProgress:
+    """Lightweight per-iteration progress record that is safe to hand to another thread"""
+    iteration: int
+    x: np.ndarray
+    grad_norm: Optional[float] = None
+
+@dataclass
+class ProblemProfile:
+    """Measurements of a problem taken before choosing an optimizer"""
+    n: int
+    func_time: float
+    grad_time: float
+    hess_time: float
+    condition: float
+    indefinite: bool
+    smooth: bool
+    batch_speedup: Optional[float] = None
\ No newline at end of file
@@ -1,6 +1,7 @@
 from abc import ABC, abstractmethod
 from typing import Callable
-from .containers import OptimizationProblem, OptimizationResult
+import numpy as np
+from .containers import OptimizationProblem, OptimizationResult, LeastSquaresProblem, FiniteSumProblem
 
 class IOptimizer(ABC):
     """Interface for Multidimensional Optimization."""
@@ -32,4 +33,47 @@ class ILineSearch(ABC):
         Returns:
             float: Approximate value of λ that minimizes φ(λ).
         """
+        pass
+
+    def search_batch(self, phi_batch: Callable[[np.ndarray], np.ndarray],
+                     interval: tuple[float, float], epsilon: float, points: int = 8) -> float:
+        """
+        Same as `search`, but φ is evaluated at a vector of λ values per call, so a method can
+        test several points per round. Without a multi-point variant λ are passed one by one.
+        Args:
+            phi_batch (Callable[[np.ndarray], np.ndarray]): φ(λ) for every λ of the array.
+            interval (tuple[float, float]): Initial uncertainty interval (a, b) for λ.
+            epsilon (float): Desired precision of the line search.
+            points (int): Number of λ values per call.
+        Returns:
+            float: Approximate value of λ that minimizes φ(λ).
+        """
+        return self.search(lambda lmbda: float(phi_batch(np.array([lmbda]))[0]), interval, epsilon)
+
+class ILeastSquaresOptimizer(ABC):
+    """Interface for nonlinear least-squares solvers."""
+    @abstractmethod
+    def optimize(self, problem: LeastSquaresProblem) -> OptimizationResult:
+        """
+        Finds the minimum of the sum of squared residuals.
+        Args:
+            problem (LeastSquaresProblem): An object containing the residual function, dataset
+            and initial parameters.
+        Returns:
+            OptimizationResult: A result with the found vector x_min and other statistics.
+        """
+        pass
+
+class IStochasticOptimizer(ABC):
+    """Interface for mini-batch solvers of finite-sum problems."""
+    @abstractmethod
+    def optimize(self, problem: FiniteSumProblem) -> OptimizationResult:
+        """
+        Finds the minimum of the mean loss over a dataset using mini-batch gradients.
+        Args:
+            problem (FiniteSumProblem): An object containing the per-row loss, dataset
+            and initial parameters.
+        Returns:
+            OptimizationResult: A result with the found vector x_min and per-epoch statistics.
+        """
         pass
\ No newline at end of file
@@ -0,0 +1,72 @@
+import hashlib
+import numpy as np
+from typing import Optional
+from .containers import OptimizationProblem, OptimizationResult, OptimizerState
+from .tracing import tracer
+
+
+class OptimizationCancelled(Exception):
+    """Raised from an iteration callback to stop a running optimization"""
+    pass
+
+
+class IterationHooks:
+    """Per-iteration extension points shared by all optimizers (checkpointing, progress callbacks)"""
+    @staticmethod
+    def resume(problem: OptimizationProblem, method_name: str) -> Optional[OptimizerState]:
+        """
+        Load the stored state of an interrupted run, if the problem has a checkpointer.
+        Args:
+            problem (OptimizationProblem): Problem being solved.
+            method_name (str): Name of the optimizer class that is resuming.
+        Returns:
+            Optional[OptimizerState]: Stored state or None if the run starts from scratch.
+        """
+        tracer.start_iterations()
+        if problem.checkpointer is None:
+            return None
+        return problem.checkpointer.resume(method_name, IterationHooks._fingerprint(problem))
+
+    @staticmethod
+    def _fingerprint(problem: OptimizationProblem) -> str:
+        """Digest of the objective expression, its parameters and x₀, stored with every checkpoint"""
+        x_0 = np.ascontiguousarray(problem.x_0)
+        digest = hashlib.sha1()
+        digest.update(repr((getattr(problem, "func_str", None), sorted(getattr(problem, "params", {}).items()),
+                            x_0.shape, x_0.dtype.str)).encode())
+        digest.update(memoryview(x_0).cast("B"))
+        return digest.hexdigest()
+
+    @staticmethod
+    def notify(problem: OptimizationProblem, state: OptimizerState) -> None:
+        """
+        Called by optimizers after every completed iteration.
+        Saves a checkpoint when due and passes the state to the progress callback.
+        Args:
+            problem (OptimizationProblem): Problem being solved.
+            state (OptimizerState): State after the iteration (shares arrays with the optimizer).
+        Raises:
+            OptimizationCancelled: If the callback requests the run to stop.
+        """
+        if tracer.enabled:
+            tracer.end_iteration(f"{state.method_name}.iteration")
+        checkpointer = problem.checkpointer
+        if checkpointer is not None and checkpointer.is_due(state.iteration):
+            checkpointer.save(state, IterationHooks._fingerprint(problem))
+        if problem.callback is not None:
+            problem.callback(state)
+
+    @staticmethod
+    def finish(problem: OptimizationProblem, result: OptimizationResult) -> OptimizationResult:
+        """
+        Called by optimizers with the result of a completed run (not on cancellation or errors).
+        Removes the checkpoint, so running the same problem again starts from scratch.
+        Args:
+            problem (OptimizationProblem): Problem that was solved.
+            result (OptimizationResult): Result about to be returned.
+        Returns:
+            OptimizationResult: The same result.
+        """
+        if problem.checkpointer is not None:
+            problem.checkpointer.clear()
+        return result
\ No newline at end of file
@@ -0,0 +1,610 @@
+import ast
+import math
+import time
+import threading
+import numpy as np
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import replace
+from functools import lru_cache
+from types import CodeType
+from typing import Callable, Dict, List, Optional, Tuple, Union
+from .tracing import tracer, traced
+from .containers import (OptimizationProblem, LeastSquaresProblem, FiniteSumProblem, ProblemSpec,
+                         EvaluationCounts, ObjectiveTerms)
+from .shared_memory import SharedArray
+
+
+_evaluation_pool: Optional[ThreadPoolExecutor] = None
+_evaluation_pool_lock = threading.Lock()
+# guards EvaluationCounts: counted functions may be called from several threads at once
+_counts_lock = threading.Lock()
+
+
+def _get_evaluation_pool() -> ThreadPoolExecutor:
+    """Thread pool shared by all concurrent batch evaluations, created on first use"""
+    global _evaluation_pool
+    with _evaluation_pool_lock:
+        if _evaluation_pool is None:
+            _evaluation_pool = ThreadPoolExecutor(thread_name_prefix="objective")
+        return _evaluation_pool
+
+
+@lru_cache(maxsize=256)
+def _compile_expression(expression: str, name: str) -> CodeType:
+    """Compiled expression, shared by every problem built from the same string (e.g. a parameter sweep)"""
+    return compile(expression, f"<{name}>", "eval")
+
+
+def _split_sum(node: ast.expr) -> List[Tuple[int, ast.expr]]:
+    """Flatten a chain of top-level + and - into signed summands, in order of appearance"""
+    # explicit stack: a sum of k terms is a left-leaning tree of depth k
+    terms = []
+    stack = [(1, node)]
+    while stack:
+        sign, node = stack.pop()
+        if isinstance(node, ast.BinOp) and isinstance(node.op, (ast.Add, ast.Sub)):
+            stack.append((-sign if isinstance(node.op, ast.Sub) else sign, node.right))
+            stack.append((sign, node.left))
+        elif isinstance(node, ast.UnaryOp) and isinstance(node.op, (ast.UAdd, ast.USub)):
+            stack.append((-sign if isinstance(node.op, ast.USub) else sign, node.operand))
+        else:
+            terms.append((sign, node))
+    return terms
+
+
+def _term_indices(node: ast.expr, n: int) -> Optional[Tuple[int, ...]]:
+    """Coordinates x[i] (constant i) read by a term, None if x is used in any other way"""
+    indices = set()
+    uses = 0
+    for child in ast.walk(node):
+        if isinstance(child, ast.Name) and child.id == "x":
+            uses += 1
+        elif isinstance(child, ast.Subscript) and isinstance(child.value, ast.Name) and child.value.id == "x":
+            index = child.slice
+            if isinstance(index, ast.UnaryOp) and isinstance(index.op, ast.USub) \
+                    and isinstance(index.operand, ast.Constant):
+                value = -index.operand.value
+            else:
+                value = index.value if isinstance(index, ast.Constant) else None
+            if type(value) is int and -n <= value < n:
+                indices.add(value % n)
+            else:
+                return None
+    # every x is under a constant subscript (x[i], x[-1]): the term reads only those coordinates
+    subscripts = sum(1 for child in ast.walk(node) if isinstance(child, ast.Subscript)
+                     and isinstance(child.value, ast.Name) and child.value.id == "x")
+    return tuple(sorted(indices)) if uses == subscripts else None
+
+
+@lru_cache(maxsize=64)
+def _parse_terms(func_str: str, n: int) -> Tuple[Tuple[ast.expr, Optional[Tuple[int, ...]]], ...]:
+    """Signed summands of an expression with the coordinates each one reads (cached: nodes are never modified)"""
+    parsed = []
+    for sign, node in _split_sum(ast.parse(func_str, mode="eval").body):
+        indices = _term_indices(node, n)
+        if indices == ():
+            # constant: does not change where the minimum is
+            continue
+        if sign < 0:
+            # located like the term: every cached node is complete, so fix_missing_locations on a
+            # sum of terms only writes to the new nodes of that sum (cached nodes are shared by threads)
+            node = ast.copy_location(ast.UnaryOp(op=ast.USub(), operand=node), node)
+        parsed.append((node, indices))
+    return tuple(parsed)
+
+
+def _sum_nodes(nodes: List[ast.expr]) -> ast.expr:
+    """Balanced tree of additions, so thousands of terms do not exceed the compiler's recursion limit"""
+    if len(nodes) == 1:
+        return nodes[0]
+    middle = len(nodes) // 2
+    return ast.BinOp(left=_sum_nodes(nodes[:middle]), op=ast.Add(), right=_sum_nodes(nodes[middle:]))
+
+
+class ProblemFactory:
+    """Builds executable optimization problems from serializable specs"""
+    @staticmethod
+    def _namespace(params: Optional[Dict[str, float]] = None) -> dict:
+        """Evaluation namespace: math functions, np and the named parameters of the expression"""
+        # allow math funcs
+        safe_dict = {k: v for k, v in math.__dict__.items() if not k.startswith("__")}
+        safe_dict['np'] = np
+        for name, value in (params or {}).items():
+            if not name.isidentifier() or name in ("x", "np"):
+                raise ValueError(f"Invalid parameter name '{name}'")
+            safe_dict[name] = value
+        return safe_dict
+
+    @staticmethod
+    def _globals(params: Optional[Dict[str, float]] = None) -> dict:
+        """
+        Read-only globals of the compiled expressions. x (and d) are passed as per-call locals,
+        so one compiled function can be evaluated from several threads at once.
+        """
+        namespace = ProblemFactory._namespace(params)
+        namespace["__builtins__"] = {}
+        return namespace
+
+    @staticmethod
+    def parameter_names(func_str: str) -> List[str]:
+        """
+        Free names of an expression that are neither x, np nor math functions, i.e. its parameters.
+        Args:
+            func_str (str): Python expression, e.g. "a * (x[1] - x[0]**2)**2 + (1 - x[0])**2".
+        Returns:
+            List[str]: Parameter names in order of first appearance, e.g. ["a"].
+        """
+        known = ProblemFactory._namespace().keys() | {"x"}
+        names = []
+        for node in ast.walk(ast.parse(func_str, mode="eval")):
+            if isinstance(node, ast.Name) and node.id not in known and node.id not in names:
+                names.append(node.id)
+        return names
+
+    @staticmethod
+    def create_objective(func_str: str, params: Optional[Dict[str, float]] = None) -> Callable[[np.ndarray], float]:
+        """
+        Compile objective function expression f(x).
+        Args:
+            func_str (str): Python expression in terms of vector x, e.g. "x[0]**2 + x[1]**2".
+            params (Optional[Dict[str, float]]): Values of the named parameters used in the expression.
+        Returns:
+            Callable[[np.ndarray], float]: Objective function. Invalid values are mapped to +inf.
+        """
+        namespace = ProblemFactory._globals(params)
+        code = _compile_expression(func_str, "objective")
+
+        def objective_function(x: np.ndarray) -> float:
+            # hottest call of every run: inline check instead of a @traced wrapper frame
+            start = time.perf_counter_ns() if tracer.enabled else None
+            try:
+                with np.errstate(all="ignore"):
+                    val = eval(code, namespace, {"x": x})
+
+                    # invalid results?
+                    if val is None or isinstance(val, complex):
+                        return float("inf")
+                    if math.isnan(val) or math.isinf(val):
+                        return float("inf")
+
+                    return float(val)
+            except (ValueError, ZeroDivisionError, OverflowError):
+                return float("inf")
+            except Exception as e:
+                raise Exception(str(e))
+            finally:
+                if start is not None:
+                    tracer.record("objective", "objective", start, time.perf_counter_ns())
+        return objective_function
+
+    @staticmethod
+    def create_objective_terms(func_str: str, n: int,
+                               params: Optional[Dict[str, float]] = None) -> Optional[ObjectiveTerms]:
+        """
+        Split objective expression into its top-level summands and find the coordinates each one reads,
+        e.g. "(x[0] - 1)**2 + 100*(x[1] - x[0]**2)**2" gives terms reading {0} and {0, 1}.
+        Args:
+            func_str (str): Objective expression in terms of vector x.
+            n (int): Dimension of x (to resolve negative indices).
+            params (Optional[Dict[str, float]]): Values of the named parameters used in the expression.
+        Returns:
+            Optional[ObjectiveTerms]: Terms with a compiler for sums of selected terms,
+            None if the expression cannot be parsed or has no term depending on x.
+        """
+        try:
+            parsed = _parse_terms(func_str, n)
+        except (SyntaxError, ValueError, RecursionError):
+            return None
+        if not parsed:
+            return None
+        namespace = ProblemFactory._globals(params)
+
+        def combine(selected: List[int]) -> Callable[[np.ndarray], float]:
+            node = _sum_nodes([parsed[k][0] for k in selected]) if selected else ast.Constant(0.0)
+            code = compile(ast.fix_missing_locations(ast.Expression(body=node)), "<terms>", "eval")
+
+            def terms_sum(x: np.ndarray) -> float:
+                return eval(code, namespace, {"x": x})
+            return terms_sum
+
+        return ObjectiveTerms(
+            indices=[None if indices is None else np.array(indices, dtype=int) for _, indices in parsed],
+            combine=combine
+        )
+
+    @staticmethod
+    def objective_terms(problem: OptimizationProblem) -> Optional[ObjectiveTerms]:
+        """
+        Summands of a problem's objective: its terms, or else split from func_str on demand,
+        so only optimizers that work term by term pay for the analysis.
+        Args:
+            problem (OptimizationProblem): Problem to analyze.
+        Returns:
+            Optional[ObjectiveTerms]: Terms of f, None if the objective cannot be split.
+        """
+        if problem.terms is not None or problem.func_str is None:
+            return problem.terms
+        terms = ProblemFactory.create_objective_terms(problem.func_str, len(problem.x_0), problem.params)
+        if terms is None or problem.counts is None:
+            return terms
+        return ProblemFactory._counted_terms(terms, problem.counts)
+
+    @staticmethod
+    def _counted_terms(terms: ObjectiveTerms, counts: EvaluationCounts) -> ObjectiveTerms:
+        """Count every evaluation of a sum of selected terms as one evaluation of f"""
+        combine = terms.combine
+
+        def counted_combine(selected: List[int]) -> Callable[[np.ndarray], float]:
+            terms_sum = combine(selected)
+
+            def counted_sum(x: np.ndarray) -> float:
+                with _counts_lock:
+                    counts.func += 1
+                return terms_sum(x)
+            return counted_sum
+        return replace(terms, combine=counted_combine)
+
+    @staticmethod
+    def create_batch_objective(func_str: str, obj_func: Callable[[np.ndarray], float], x_0: np.ndarray,
+                               params: Optional[Dict[str, float]] = None
+                               ) -> Optional[Callable[[np.ndarray], np.ndarray]]:
+        """
+        Compile f(x) for an (n, k) array x whose columns are k points, if the expression allows it.
+        Expressions indexing coordinates (x[0], x[1:] - x[:-1]) broadcast over the columns as is;
+        reductions over the whole array (np.sum(x**2)) or math functions do not.
+        Args:
+            func_str (str): Objective expression in terms of vector x.
+            obj_func (Callable[[np.ndarray], float]): Compiled scalar objective used as reference.
+            x_0 (np.ndarray): Point around which the vectorized form is checked.
+            params (Optional[Dict[str, float]]): Values of the named parameters used in the expression.
+        Returns:
+            Optional[Callable[[np.ndarray], np.ndarray]]: Values of all k columns (invalid values are
+            +inf), or None if the expression does not vectorize.
+        """
+        namespace = ProblemFactory._globals(params)
+        code = _compile_expression(func_str, "objective")
+
+        def batch_objective(x: np.ndarray) -> np.ndarray:
+            with np.errstate(all="ignore"):
+                val = np.asarray(eval(code, namespace, {"x": x}), dtype=float)
+            if val.shape != (x.shape[1],):
+                raise ValueError(f"Expected {x.shape[1]} values, got shape {val.shape}")
+            return np.where(np.isfinite(val), val, np.inf)
+
+        # accept the vectorized form only if it agrees with the scalar objective column by column
+        x_0 = np.asarray(x_0)
+        probe = np.stack([x_0, x_0 + 0.5 * (1 + np.abs(x_0))], axis=1)
+        try:
+            batch_values = batch_objective(probe)
+            scalar_values = [obj_func(probe[:, j].copy()) for j in range(probe.shape[1])]
+        except Exception:
+            return None
+        if not np.allclose(batch_values, scalar_values, rtol=np.finfo(probe.dtype).eps ** 0.5,
+                           atol=0.0, equal_nan=True):
+            return None
+        return traced("batch_objective", "objective")(batch_objective)
+
+    @staticmethod
+    def batch_objective(problem: OptimizationProblem) -> Optional[Callable[[np.ndarray], np.ndarray]]:
+        """
+        Vectorized objective of a problem: its batch_obj_func, or else compiled from func_str on demand.
+        Checking the compiled form costs three evaluations of f, so only optimizers that evaluate
+        batches of points ask for it.
+        Args:
+            problem (OptimizationProblem): Problem to evaluate.
+        Returns:
+            Optional[Callable[[np.ndarray], np.ndarray]]: Values of all k columns of an (n, k) array,
+            None if the objective does not vectorize.
+        """
+        if problem.batch_obj_func is not None or problem.func_str is None:
+            return problem.batch_obj_func
+        batch_obj_func = ProblemFactory.create_batch_objective(problem.func_str, problem.obj_func,
+                                                               problem.x_0, problem.params)
+        if batch_obj_func is None or problem.counts is None:
+            return batch_obj_func
+        return ProblemFactory._counted_batch(batch_obj_func, problem.counts)
+
+    @staticmethod
+    def _counted_batch(batch_obj_func: Callable[[np.ndarray], np.ndarray],
+                       counts: EvaluationCounts) -> Callable[[np.ndarray], np.ndarray]:
+        """Count every column of a batch as one evaluation of f"""
+        def counted_batch(x: np.ndarray) -> np.ndarray:
+            with _counts_lock:
+                counts.func += x.shape[1]
+            return batch_obj_func(x)
+        return counted_batch
+
+    @staticmethod
+    def concurrent_batch(obj_func: Callable[[np.ndarray], float]) -> Callable[[np.ndarray], np.ndarray]:
+        """
+        Batch form of an objective that does not vectorize: the k columns are evaluated
+        concurrently on a shared thread pool. Pays off for expensive objectives that release
+        the GIL (large NumPy expressions, external solvers).
+        Args:
+            obj_func (Callable[[np.ndarray], float]): Scalar objective, must be thread-safe.
+        Returns:
+            Callable[[np.ndarray], np.ndarray]: Values of all k columns of an (n, k) array.
+        """
+        def batch_objective(x: np.ndarray) -> np.ndarray:
+            columns = [x[:, j] for j in range(x.shape[1])]
+            return np.fromiter(_get_evaluation_pool().map(obj_func, columns), dtype=float, count=len(columns))
+        return batch_objective
+
+    @staticmethod
+    def create_residuals(residual_str: str, name: str = "residuals") -> Callable[[np.ndarray, np.ndarray], np.ndarray]:
+        """
+        Compile residual vector expression r(x, d), vectorized over the rows of a data chunk.
+        Args:
+            residual_str (str): Python expression in terms of parameters x and data chunk d,
+                e.g. "d[:, 1] - x[0] * np.exp(x[1] * d[:, 0])".
+            name (str): Label of the compiled code and of its tracing span.
+        Returns:
+            Callable[[np.ndarray, np.ndarray], np.ndarray]: Residuals of all rows of the chunk.
+        """
+        namespace = ProblemFactory._globals()
+        code = compile(residual_str, f"<{name}>", "eval")
+
+        @traced(name, "objective")
+        def residual_function(x: np.ndarray, d: np.ndarray) -> np.ndarray:
+            with np.errstate(all="ignore"):
+                r = np.asarray(eval(code, namespace, {"x": x, "d": d}), dtype=float)
+            # a residual that does not depend on d is the same for every row
+            return np.broadcast_to(r, (len(d),)) if r.ndim == 0 else r.ravel()
+        return residual_function
+
+    @staticmethod
+    def create_losses(loss_str: str) -> Callable[[np.ndarray, np.ndarray], np.ndarray]:
+        """
+        Compile per-row loss expression l(x, d), vectorized over the rows of a batch.
+        Args:
+            loss_str (str): Python expression in terms of parameters x and batch d,
+                e.g. "np.log1p(np.exp(-d[:, 2] * (x[0] * d[:, 0] + x[1] * d[:, 1])))".
+        Returns:
+            Callable[[np.ndarray, np.ndarray], np.ndarray]: Losses of all rows of the batch.
+        """
+        # same compilation and broadcasting rules as residuals
+        return ProblemFactory.create_residuals(loss_str, name="losses")
+
+    @staticmethod
+    def create_batch_gradient(loss_func: Callable[[np.ndarray, np.ndarray], np.ndarray],
+                              h: float = 1e-6) -> Callable[[np.ndarray, np.ndarray], np.ndarray]:
+        """
+        Create numerical gradient of the mean batch loss by formula: (L(x + h) - L(x - h)) / 2*h.
+        Costs 2n vectorized loss evaluations on the batch only, never a pass over the dataset.
+        """
+        @traced("batch_gradient", "derivative")
+        def batch_gradient(x: np.ndarray, d: np.ndarray) -> np.ndarray:
+            step = ProblemFactory._difference_step(h, x.dtype, 3)
+            grad = np.zeros(len(x))
+            x_work = np.array(x, copy=True)
+            for i in range(len(x)):
+                x_i = x_work[i]
+                x_work[i] = x_i + step
+                f_plus = np.mean(loss_func(x_work, d))
+                x_work[i] = x_i - step
+                f_minus = np.mean(loss_func(x_work, d))
+                x_work[i] = x_i
+                grad[i] = (f_plus - f_minus) / (2 * step)
+            return grad
+        return batch_gradient
+
+    @staticmethod
+    def load_data(path: str) -> np.ndarray:
+        """Open .npy dataset memory-mapped, so rows are read from disk only when a chunk is used"""
+        return np.load(path, mmap_mode='r')
+
+    @staticmethod
+    def load_vector(path: str, dtype: str = "float64") -> np.ndarray:
+        """
+        Open a 1-D .npy vector memory-mapped (e.g. a start point with millions of entries).
+        Args:
+            path (str): Path to the .npy file.
+            dtype (str): Working precision; the file is copied only if its dtype differs.
+        Returns:
+            np.ndarray: Read-only memory-mapped vector or its converted copy.
+        """
+        vec = np.load(path, mmap_mode='r')
+        if vec.ndim != 1:
+            raise ValueError(f"Expected a 1-D vector in '{path}', got shape {vec.shape}")
+        return vec if vec.dtype == np.dtype(dtype) else vec.astype(dtype)
+
+    @staticmethod
+    def _difference_step(h: float, dtype: np.dtype, order: int) -> float:
+        """Keep the float64 step as is; for lower precisions use eps^(1/order) so x + h != x"""
+        if dtype == np.float64:
+            return h
+        return max(h, float(np.finfo(dtype).eps) ** (1 / order))
+
+    @staticmethod
+    def create_numerical_gradient(func: Callable, h: float = 1e-8) -> Callable:
+        """Create numerical gradient function by formula: (f(x + h) - f(x - h)) / 2*h"""
+        @traced("numerical_gradient", "derivative")
+        def gradient(x: np.ndarray) -> np.ndarray:
+            step = ProblemFactory._difference_step(h, x.dtype, 3)
+            grad = np.zeros_like(x)
+            # perturb one working copy in place: O(n) memory and no per-coordinate copies
+            x_work = np.array(x, copy=True)
+            for i in range(len(x)):
+                x_i = x_work[i]
+                x_work[i] = x_i + step
+                f_plus = func(x_work)
+                x_work[i] = x_i - step
+                f_minus = func(x_work)
+                x_work[i] = x_i
+                grad[i] = (f_plus - f_minus) / (2 * step)
+            return grad
+        return gradient
+
+    @staticmethod
+    def create_numerical_hessian(func: Callable, h: float = 1e-5) -> Callable:
+        """
+        Create numerical Hessian function by formula:
+        d2f/dxidxj = (f(x + h*ei + h*ej)
+                     - f(x + h*ei - h*ej)
+                     - f(x - h*ei + h*ej)
+                     + f(x - h*ei - h*ej) ) / (4*h^2)
+        """
+        @traced("numerical_hessian", "derivative")
+        def hessian(x: np.ndarray) -> np.ndarray:
+            h_step = ProblemFactory._difference_step(h, x.dtype, 4)
+            n = len(x)
+            H = np.zeros((n, n))
+            for i in range(n):
+                for j in range(n):
+                    x_pp = x.copy()
+                    x_pp[i] += h_step
+                    x_pp[j] += h_step
+
+                    x_pm = x.copy()
+                    x_pm[i] += h_step
+                    x_pm[j] -= h_step
+
+                    x_mp = x.copy()
+                    x_mp[i] -= h_step
+                    x_mp[j] += h_step
+
+                    x_mm = x.copy()
+                    x_mm[i] -= h_step
+                    x_mm[j] -= h_step
+
+                    H[i, j] = (func(x_pp) - func(x_pm) - func(x_mp) + func(x_mm)) / (4 * h_step * h_step)
+            return H
+        return hessian
+
+    @staticmethod
+    def build(spec: ProblemSpec) -> OptimizationProblem:
+        """
+        Compile a problem spec into an OptimizationProblem with numerical derivatives.
+        Args:
+            spec (ProblemSpec): Serializable problem description.
+        Returns:
+            OptimizationProblem: Problem ready to be passed to IOptimizer.optimize.
+        """
+        objective_function = ProblemFactory.create_objective(spec.func_str, spec.params)
+        # memory-mapped and shared start vectors are not copied here, optimizers copy x_0 once
+        x_0 = spec.x_0.attach() if isinstance(spec.x_0, SharedArray) else spec.x_0
+        x_0 = np.asarray(x_0, dtype=spec.dtype)
+        return OptimizationProblem(
+            obj_func=objective_function,
+            grad_func=ProblemFactory.create_numerical_gradient(objective_function),
+            hess_func=ProblemFactory.create_numerical_hessian(objective_function),
+            epsilon=spec.epsilon,
+            method_name=spec.method_name,
+            x_0=x_0,
+            max_iter=spec.max_iter,
+            store_trajectory=spec.store_trajectory,
+            func_str=spec.func_str,
+            params=dict(spec.params)
+        )
+
+    @staticmethod
+    def build_least_squares(residual_str: str, data: Union[str, np.ndarray, SharedArray], x_0: np.ndarray,
+                            epsilon: float, method_name: str, max_iter: int = 1000,
+                            chunk_size: int = 65536) -> LeastSquaresProblem:
+        """
+        Compile a residual expression into a LeastSquaresProblem.
+        Args:
+            residual_str (str): Residual vector expression in terms of x and data chunk d.
+            data (Union[str, np.ndarray, SharedArray]): Dataset array, path to a .npy file (memory-mapped)
+                or shared memory segment (mapped without copying).
+            x_0 (np.ndarray): Initial parameters.
+            epsilon (float): Required norm of the gradient of the sum of squares.
+            method_name (str): Name of the solver.
+            max_iter (int): Maximum number of iterations.
+            chunk_size (int): Number of data rows evaluated at once.
+        Returns:
+            LeastSquaresProblem: Problem ready to be passed to ILeastSquaresOptimizer.optimize.
+        """
+        if isinstance(data, str):
+            data = ProblemFactory.load_data(data)
+        elif isinstance(data, SharedArray):
+            data = data.attach()
+        return LeastSquaresProblem(
+            residual_func=ProblemFactory.create_residuals(residual_str),
+            data=data,
+            epsilon=epsilon,
+            method_name=method_name,
+            x_0=np.asarray(x_0, dtype=float),
+            max_iter=max_iter,
+            chunk_size=chunk_size
+        )
+
+    @staticmethod
+    def build_finite_sum(loss_str: str, data: Union[str, np.ndarray, SharedArray], x_0: np.ndarray,
+                         epsilon: float, method_name: str, max_epochs: int = 100, batch_size: int = 256,
+                         chunk_size: int = 65536, seed: int = 0) -> FiniteSumProblem:
+        """
+        Compile a per-row loss expression into a FiniteSumProblem.
+        Args:
+            loss_str (str): Per-row loss expression in terms of x and batch d.
+            data (Union[str, np.ndarray, SharedArray]): Dataset array, path to a .npy file (memory-mapped)
+                or shared memory segment.
+            x_0 (np.ndarray): Initial parameters.
+            epsilon (float): Required norm of the gradient of the mean loss.
+            method_name (str): Name of the solver.
+            max_epochs (int): Maximum number of passes over the data.
+            batch_size (int): Rows per mini-batch.
+            chunk_size (int): Rows read from the dataset at once.
+            seed (int): Seed of the shuffling random generator.
+        Returns:
+            FiniteSumProblem: Problem ready to be passed to IStochasticOptimizer.optimize.
+        """
+        if isinstance(data, str):
+            data = ProblemFactory.load_data(data)
+        elif isinstance(data, SharedArray):
+            data = data.attach()
+        loss_func = ProblemFactory.create_losses(loss_str)
+        return FiniteSumProblem(
+            loss_func=loss_func,
+            batch_grad_func=ProblemFactory.create_batch_gradient(loss_func),
+            data=data,
+            epsilon=epsilon,
+            method_name=method_name,
+            x_0=np.asarray(x_0, dtype=float),
+            max_epochs=max_epochs,
+            batch_size=batch_size,
+            chunk_size=chunk_size,
+            seed=seed
+        )
+
+    @staticmethod
+    def with_counters(problem: OptimizationProblem) -> Tuple[OptimizationProblem, EvaluationCounts]:
+        """
+        Wrap objective, gradient and hessian so that every call made by an optimizer is counted.
+        A batch counts one evaluation of f per point, a sum of selected terms counts as one evaluation.
+        Args:
+            problem (OptimizationProblem): Problem to instrument.
+        Returns:
+            Tuple: (Instrumented copy of the problem, EvaluationCounts updated in place)
+        """
+        counts = EvaluationCounts()
+        obj_func, grad_func, hess_func = problem.obj_func, problem.grad_func, problem.hess_func
+
+        def counted_obj(x: np.ndarray) -> float:
+            with _counts_lock:
+                counts.func += 1
+            return obj_func(x)
+
+        def counted_grad(x: np.ndarray) -> np.ndarray:
+            with _counts_lock:
+                counts.grad += 1
+            return grad_func(x)
+
+        def counted_hess(x: np.ndarray) -> np.ndarray:
+            with _counts_lock:
+                counts.hess += 1
+            return hess_func(x)
+
+        batch_obj_func = problem.batch_obj_func
+        counted = replace(
+            problem,
+            obj_func=counted_obj,
+            grad_func=counted_grad,
+            hess_func=counted_hess,
+            batch_obj_func=(ProblemFactory._counted_batch(batch_obj_func, counts)
+                            if batch_obj_func is not None else None),
+            terms=ProblemFactory._counted_terms(problem.terms, counts) if problem.terms is not None else None,
+            # forms of f compiled later (batch_objective, objective_terms) count into the same counters
+            counts=counts
+        )
+        return counted, counts
\ No newline at end of file
@@ -0,0 +1,318 @@
+import os
+import json
+import math
+import time
+import numpy as np
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Tuple
+from .constants import SolutionStatus
+from .containers import (OptimizationProblem, OptimizationResult, OptimizerState,
+                         ProblemSpec, EvaluationCounts)
+from .interfaces import IOptimizer
+from .problem_factory import ProblemFactory
+
+
+class ResultRecorder:
+    """
+    Streams a run to a directory while the optimizer proceeds:
+    meta.json with the problem spec, status, timings and evaluation counts,
+    and the iterates and gradient norms in numbered .npy chunks.
+    Every completed chunk is listed in meta.json, so a run that crashed can still be replayed up to its last chunk.
+    A problem with store_trajectory=False keeps only the gradient norms and the last iterate.
+    """
+    META_FILE = "meta.json"
+    FORMAT_VERSION = 1
+    # upper bound on the iterates buffered for one chunk, in bytes
+    MAX_CHUNK_BYTES = 64 * 2 ** 20
+
+    def __init__(self, path: str, spec: ProblemSpec, chunk_size: int = 1024) -> None:
+        """
+        Initialize ResultRecorder.
+        Args:
+            path (str): Directory of the run, created if missing.
+            spec (ProblemSpec): Problem being solved (stored without x₀, which is the first iterate).
+            chunk_size (int): Iterates (or gradient norms) per chunk; bounds the memory held by the recorder.
+                Chunks of large iterates hold fewer, at most MAX_CHUNK_BYTES.
+        """
+        if chunk_size < 1:
+            raise ValueError("Chunk size must be a positive number of iterates")
+        os.makedirs(path, exist_ok=True)
+        self.path = path
+        self.chunk_size = chunk_size
+        self._buffer: Optional[np.ndarray] = None
+        self._buffered = 0
+        # last iterate, kept instead of the buffer when the trajectory is not stored
+        self._x_last: Optional[np.ndarray] = None
+        self._grad_norms: List[float] = []
+        # list of the optimizer the norms are taken from, its entries already recorded, and the total recorded
+        self._grad_norms_source: Optional[List[float]] = None
+        self._grad_norms_seen = 0
+        self._grad_norms_recorded = 0
+        self._start: Optional[float] = None
+        self._previous_callback = None
+        self.meta: Dict[str, Any] = {
+            "format": self.FORMAT_VERSION,
+            "spec": {
+                "func_str": spec.func_str,
+                "n": int(spec.x_0.shape[0]),
+                "epsilon": spec.epsilon,
+                "method_name": spec.method_name,
+                "max_iter": spec.max_iter,
+                "dtype": spec.dtype,
+                "params": dict(spec.params),
+            },
+            "trajectory": True,
+            "status": "running",
+            "started": datetime.now().isoformat(timespec="seconds"),
+            "wall_time": None,
+            "points": 0,
+            "chunks": [],
+        }
+
+    def attach(self, problem: OptimizationProblem) -> OptimizationProblem:
+        """
+        Install the recorder as the progress callback of the problem (an existing callback is still called)
+        and record x₀ as the first iterate (only kept as the last iterate if the trajectory is not stored).
+        Args:
+            problem (OptimizationProblem): Problem about to be solved.
+        Returns:
+            OptimizationProblem: The same problem.
+        """
+        self._previous_callback = problem.callback
+        problem.callback = self
+        x_0 = np.asarray(problem.x_0)
+        self.meta["trajectory"] = bool(problem.store_trajectory)
+        if problem.store_trajectory:
+            rows = max(1, min(self.chunk_size, self.MAX_CHUNK_BYTES // max(x_0.nbytes, 1)))
+            self._buffer = np.empty((rows, len(x_0)), dtype=x_0.dtype)
+        else:
+            self._x_last = np.empty_like(x_0)
+        self._append(x_0)
+        self._start = time.perf_counter()
+        self._write_meta()
+        return problem
+
+    def __call__(self, state: OptimizerState) -> None:
+        """Record the iterate and the new gradient norms of a completed iteration"""
+        self._record_grad_norms(state.grad_norms)
+        self._append(state.x)
+        if self._previous_callback is not None:
+            self._previous_callback(state)
+
+    def _record_grad_norms(self, norms: List[float]) -> None:
+        """Record the new tail of the optimizer's gradient norms, so the run keeps one norm per iterate"""
+        if not norms:
+            # derivative-free method: no norm for this iterate (nor for x₀ on the first call)
+            new = [math.nan] * (2 if self._grad_norms_recorded == 0 else 1)
+        elif norms is not self._grad_norms_source:
+            # a fresh list, e.g. the next stage of an automatic run: its first entry belongs to
+            # the last recorded iterate and only fills in a norm that was not measured
+            self._grad_norms_source = norms
+            if self._grad_norms_recorded == 0:
+                new = list(norms)
+            else:
+                if self._grad_norms and math.isnan(self._grad_norms[-1]):
+                    self._grad_norms[-1] = norms[0]
+                new = list(norms[1:])
+        else:
+            # optimizers append to grad_norms; only the tail is new
+            new = list(norms[self._grad_norms_seen:])
+        self._grad_norms_seen = len(norms)
+        if not new:
+            # notified without a new norm
+            new = [math.nan]
+        self._grad_norms.extend(new)
+        self._grad_norms_recorded += len(new)
+
+    def _append(self, x: np.ndarray) -> None:
+        if self._buffer is None:
+            self._x_last[...] = x
+            if len(self._grad_norms) >= self.chunk_size:
+                self._flush()
+            return
+        self._buffer[self._buffered] = x
+        self._buffered += 1
+        if self._buffered == len(self._buffer):
+            self._flush()
+
+    def _flush(self) -> None:
+        """Write the buffered iterates and gradient norms as the next chunk and list it in meta.json"""
+        if self._buffered == 0 and not self._grad_norms:
+            return
+        index = len(self.meta["chunks"])
+        chunk = {
+            "grad_norms": f"grad_norms_{index:05d}.npy",
+            "points": self._buffered,
+        }
+        if self._buffer is not None:
+            chunk["trajectory"] = f"trajectory_{index:05d}.npy"
+            np.save(os.path.join(self.path, chunk["trajectory"]), self._buffer[:self._buffered])
+        else:
+            # a crashed run still has its last iterate
+            np.save(os.path.join(self.path, "x_last.npy"), self._x_last)
+        np.save(os.path.join(self.path, chunk["grad_norms"]), np.asarray(self._grad_norms, dtype=float))
+        self.meta["chunks"].append(chunk)
+        self.meta["points"] += self._buffered
+        self._buffered = 0
+        self._grad_norms = []
+        self._write_meta()
+
+    def _write_meta(self) -> None:
+        """Atomically replace meta.json, so readers never see a half-written header"""
+        meta_path = os.path.join(self.path, self.META_FILE)
+        tmp_path = meta_path + ".tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(self.meta, f, indent=2)
+        os.replace(tmp_path, meta_path)
+
+    def finish(self, result: OptimizationResult, counts: Optional[EvaluationCounts] = None) -> None:
+        """
+        Write the remaining iterates, the minimizer and the final status.
+        Args:
+            result (OptimizationResult): Result returned by the optimizer.
+            counts (Optional[EvaluationCounts]): Numbers of f, ∇f and ∇²f evaluations of the run.
+        """
+        self._flush()
+        if result.x_min is not None:
+            np.save(os.path.join(self.path, "x_min.npy"), np.asarray(result.x_min))
+        self.meta.update(
+            status=result.status,
+            value=None if result.value is None else float(result.value),
+            iterations=result.iterations,
+            final_epsilon=None if result.final_epsilon is None else float(result.final_epsilon),
+            message=result.message,
+            wall_time=None if self._start is None else time.perf_counter() - self._start,
+        )
+        if counts is not None:
+            self.meta["counts"] = {"func": counts.func, "grad": counts.grad, "hess": counts.hess}
+        self._write_meta()
+
+    def run(self, optimizer: IOptimizer, problem: OptimizationProblem) -> OptimizationResult:
+        """
+        Solve the problem while recording it; a run that raises is stored with the error status.
+        Args:
+            optimizer (IOptimizer): Optimizer to run.
+            problem (OptimizationProblem): Problem to solve.
+        Returns:
+            OptimizationResult: Result of the optimizer.
+        """
+        problem, counts = ProblemFactory.with_counters(problem)
+        self.attach(problem)
+        try:
+            result = optimizer.optimize(problem)
+        except BaseException as e:
+            self.finish(OptimizationResult(
+                x_min=None, value=None, iterations=None, final_epsilon=None, trajectory=None,
+                status=SolutionStatus.ERROR.value, message=str(e) or type(e).__name__
+            ), counts)
+            raise
+        self.finish(result, counts)
+        return result
+
+
+class StoredRun:
+    """
+    Read-only view of a run written by ResultRecorder.
+    Trajectory chunks are memory-mapped, so only the rows that are actually used are read from disk.
+    A run recorded without its trajectory has no points, only gradient norms and the minimizer.
+    """
+    def __init__(self, path: str) -> None:
+        """
+        Initialize StoredRun.
+        Args:
+            path (str): Directory of the run.
+        Raises:
+            FileNotFoundError: If the directory has no meta.json.
+        """
+        self.path = path
+        with open(os.path.join(path, ResultRecorder.META_FILE), encoding="utf-8") as f:
+            self.meta: Dict[str, Any] = json.load(f)
+        self._chunks = self.meta["chunks"]
+        # first global iterate index of every chunk
+        self._offsets = np.cumsum([0] + [chunk["points"] for chunk in self._chunks])
+
+    @property
+    def n_points(self) -> int:
+        return int(self._offsets[-1])
+
+    @property
+    def method_name(self) -> str:
+        return self.meta["spec"]["method_name"]
+
+    def _chunk(self, index: int) -> np.ndarray:
+        return np.load(os.path.join(self.path, self._chunks[index]["trajectory"]), mmap_mode='r')
+
+    @property
+    def x_min(self) -> Optional[np.ndarray]:
+        """Stored minimizer, or the last recorded iterate of an unfinished run"""
+        for name in ("x_min.npy", "x_last.npy"):
+            if os.path.exists(os.path.join(self.path, name)):
+                return np.load(os.path.join(self.path, name), mmap_mode='r')
+        if self.n_points == 0:
+            return None
+        return self.points([self.n_points - 1])[0]
+
+    def grad_norms(self) -> np.ndarray:
+        """Gradient norms of the whole run (one float per iterate, NaN where none was measured)"""
+        parts = [np.load(os.path.join(self.path, chunk["grad_norms"])) for chunk in self._chunks]
+        return np.concatenate(parts) if parts else np.empty(0)
+
+    def sample_indices(self, max_points: Optional[int] = None) -> np.ndarray:
+        """Evenly spaced iterate indices including the first and the last, all of them if max_points is None"""
+        if max_points is None or self.n_points <= max_points:
+            return np.arange(self.n_points)
+        return np.unique(np.linspace(0, self.n_points - 1, max(max_points, 2)).round().astype(int))
+
+    def points(self, indices: np.ndarray) -> np.ndarray:
+        """
+        Read the iterates with the given (sorted) indices.
+        Args:
+            indices (np.ndarray): Global iterate indices.
+        Returns:
+            np.ndarray: Array of shape (len(indices), n).
+        """
+        indices = np.asarray(indices, dtype=int)
+        parts = []
+        chunk_ids = np.searchsorted(self._offsets, indices, side="right") - 1
+        for chunk_id in np.unique(chunk_ids):
+            rows = indices[chunk_ids == chunk_id] - self._offsets[chunk_id]
+            parts.append(np.asarray(self._chunk(chunk_id)[rows]))
+        return np.concatenate(parts) if parts else np.empty((0, self.meta["spec"]["n"]))
+
+    def distances(self, x_ref: np.ndarray, max_points: Optional[int] = None) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Distances of (a decimated subset of) the iterates to a reference point, chunk by chunk.
+        Args:
+            x_ref (np.ndarray): Reference point, usually the minimizer.
+            max_points (Optional[int]): Upper bound on the number of returned samples.
+        Returns:
+            Tuple: (iteration numbers, distances)
+        """
+        indices = self.sample_indices(max_points)
+        x_ref = np.asarray(x_ref)
+        distances = np.empty(len(indices))
+        chunk_ids = np.searchsorted(self._offsets, indices, side="right") - 1
+        for chunk_id in np.unique(chunk_ids):
+            mask = chunk_ids == chunk_id
+            rows = indices[mask] - self._offsets[chunk_id]
+            distances[mask] = np.linalg.norm(self._chunk(chunk_id)[rows] - x_ref, axis=1)
+        return indices, distances
+
+    def to_result(self) -> OptimizationResult:
+        """Summary of the run as an OptimizationResult; the trajectory stays on disk"""
+        grad_norms = self.grad_norms()
+        final_epsilon = self.meta.get("final_epsilon")
+        if final_epsilon is None:
+            # interrupted run: last recorded gradient norm
+            final_epsilon = float(grad_norms[-1]) if len(grad_norms) else float("nan")
+        iterations = self.meta.get("iterations")
+        return OptimizationResult(
+            x_min=self.x_min,
+            value=self.meta.get("value"),
+            iterations=max(self.n_points, len(grad_norms), 1) - 1 if iterations is None else iterations,
+            final_epsilon=final_epsilon,
+            trajectory=None,
+            status=self.meta["status"],
+            grad_norms=grad_norms.tolist(),
+            message=self.meta.get("message")
+        )
\ No newline at end of file
@@ -0,0 +1,185 @@
+import os
+import secrets
+import threading
+import weakref
+import numpy as np
+from dataclasses import dataclass, replace, fields
+from multiprocessing import shared_memory
+from typing import List, Optional, Sequence, Tuple
+from .containers import OptimizationResult
+
+
+class _MappedSegment(shared_memory.SharedMemory):
+    """
+    Segment backing attached arrays. Closing it while arrays still use the mapping
+    (finalizers and __del__ at interpreter exit) leaves it mapped; the OS unmaps it with the process.
+    """
+    def close(self) -> None:
+        try:
+            super().close()
+        except BufferError:
+            pass
+
+
+@dataclass(frozen=True)
+class SharedArray:
+    """
+    Picklable descriptor of an array stored in a named shared memory segment.
+    Only the descriptor crosses process boundaries; both sides map the same memory.
+    """
+    name: str
+    shape: Tuple[int, ...]
+    dtype: str
+
+    @property
+    def nbytes(self) -> int:
+        return int(np.prod(self.shape, dtype=np.int64)) * np.dtype(self.dtype).itemsize
+
+    @staticmethod
+    def create(array: np.ndarray, name: Optional[str] = None) -> "SharedArray":
+        """
+        Copy an array into a new segment. The segment outlives this call until someone unlinks it.
+        Args:
+            array (np.ndarray): Data to share.
+            name (Optional[str]): Segment name, random if None.
+        Returns:
+            SharedArray: Descriptor of the new segment.
+        """
+        array = np.asarray(array)
+        # zero-size segments are not allowed
+        segment = shared_memory.SharedMemory(name=name, create=True, size=max(array.nbytes, 1))
+        try:
+            np.ndarray(array.shape, dtype=array.dtype, buffer=segment.buf)[...] = array
+        finally:
+            segment.close()
+        return SharedArray(segment.name, tuple(array.shape), array.dtype.str)
+
+    def attach(self, unlink: bool = False) -> np.ndarray:
+        """
+        Map the segment as an ndarray without copying.
+        The mapping is closed when the array and all views of it are garbage collected.
+        Args:
+            unlink (bool): Remove the segment name right away and take over the memory: it stays
+                valid through the returned array and is freed with it, so nothing can leak.
+        Returns:
+            np.ndarray: Array backed by the shared segment.
+        """
+        segment = _MappedSegment(name=self.name)
+        if unlink:
+            segment.unlink()
+        count = int(np.prod(self.shape, dtype=np.int64))
+        flat = np.frombuffer(segment.buf, dtype=np.dtype(self.dtype), count=count)
+        # the memoryview under `flat` is released only after the last view of the array is gone;
+        # closing the segment then (not earlier) can never unmap memory that is still in use
+        weakref.finalize(flat.base, segment.close)
+        return flat.reshape(self.shape)
+
+
+def _unlink_segments(names: List[str]) -> None:
+    for name in names:
+        try:
+            segment = shared_memory.SharedMemory(name=name)
+        except FileNotFoundError:
+            # already adopted by its reader or never created by the worker
+            continue
+        segment.close()
+        segment.unlink()
+    names.clear()
+
+
+class SharedArrayPool:
+    """
+    Owner of the shared segments of a batch of worker tasks.
+    Inputs are placed with `put`; workers write outputs into segments whose names the pool
+    reserved in advance, so every segment is known here even if its worker dies before reporting.
+    `close` (also called on exit of the `with` block, garbage collection or interpreter exit)
+    unlinks every segment that has not been adopted yet.
+    """
+    def __init__(self) -> None:
+        # short names: macOS limits them to 31 characters
+        self.prefix = f"mdo{os.getpid() % 100000}{secrets.token_hex(3)}"
+        self._names: List[str] = []
+        self._count = 0
+        self._lock = threading.Lock()
+        self._finalizer = weakref.finalize(self, _unlink_segments, self._names)
+
+    def _next_name(self) -> str:
+        with self._lock:
+            self._count += 1
+            name = f"{self.prefix}_{self._count}"
+            self._names.append(name)
+            return name
+
+    def put(self, array: np.ndarray) -> SharedArray:
+        """Copy an input array into a segment owned by the pool"""
+        return SharedArray.create(array, self._next_name())
+
+    def reserve(self, count: int) -> List[str]:
+        """Names for segments that a worker will create (see `export_result`)"""
+        return [self._next_name() for _ in range(count)]
+
+    def close(self) -> None:
+        self._finalizer()
+
+    def __enter__(self) -> "SharedArrayPool":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    # OptimizationResult arrays that may be large enough to be worth sharing
+    RESULT_FIELDS = ("x_min", "trajectory", "grad_norms")
+
+    @staticmethod
+    def export_result(result: OptimizationResult, names: Sequence[str]) -> OptimizationResult:
+        """
+        Worker side: move the arrays of a result into segments with reserved names,
+        leaving only their descriptors in the (then cheap to pickle) result.
+        Args:
+            result (OptimizationResult): Result produced in the worker.
+            names (Sequence[str]): One reserved name per entry of RESULT_FIELDS.
+        Returns:
+            OptimizationResult: Copy of the result with SharedArray descriptors.
+        """
+        shared = {}
+        for field_name, name in zip(SharedArrayPool.RESULT_FIELDS, names):
+            value = getattr(result, field_name)
+            if value is None:
+                continue
+            if isinstance(value, list):
+                # trajectory rows are written straight into the segment, no stacked temporary
+                if not value:
+                    continue
+                shape = (len(value),) + np.shape(value[0])
+                # rows may be upcast during the run (e.g. float32 start point, float64 steps)
+                dtype = np.result_type(value[0], value[-1])
+                segment = shared_memory.SharedMemory(
+                    name=name, create=True, size=max(int(np.prod(shape)) * dtype.itemsize, 1)
+                )
+                try:
+                    target = np.ndarray(shape, dtype=dtype, buffer=segment.buf)
+                    for i, row in enumerate(value):
+                        target[i] = row
+                finally:
+                    segment.close()
+                shared[field_name] = SharedArray(name, shape, dtype.str)
+            else:
+                shared[field_name] = SharedArray.create(np.asarray(value), name)
+        return replace(result, **shared)
+
+    @staticmethod
+    def import_result(result: OptimizationResult) -> OptimizationResult:
+        """
+        Parent side: map the shared arrays of an exported result and take ownership of them
+        (segments are unlinked at once and freed together with the arrays).
+        Args:
+            result (OptimizationResult): Result returned by `export_result`.
+        Returns:
+            OptimizationResult: Result with ordinary ndarrays backed by shared memory.
+        """
+        attached = {
+            item.name: getattr(result, item.name).attach(unlink=True)
+            for item in fields(result)
+            if isinstance(getattr(result, item.name), SharedArray)
+        }
+        return replace(result, **attached)
\ No newline at end of file
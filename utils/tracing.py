@@ -0,0 +1,179 @@
+import json
+import os
+import threading
+import time
+import functools
+from contextlib import contextmanager, nullcontext
+from dataclasses import dataclass
+from typing import Callable, Dict, Iterator, List
+
+
+@dataclass
+class Span:
+    name: str
+    category: str
+    start_ns: int
+    duration_ns: int
+    thread_id: int
+
+@dataclass
+class SpanStats:
+    count: int = 0
+    total_ns: int = 0
+    self_ns: int = 0
+    max_ns: int = 0
+
+
+_NULL_SPAN = nullcontext()
+
+
+class _ActiveSpan:
+    __slots__ = ("tracer", "name", "category", "start_ns")
+
+    def __init__(self, tracer: "Tracer", name: str, category: str) -> None:
+        self.tracer = tracer
+        self.name = name
+        self.category = category
+
+    def __enter__(self) -> "_ActiveSpan":
+        self.start_ns = time.perf_counter_ns()
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.tracer.record(self.name, self.category, self.start_ns, time.perf_counter_ns())
+
+
+class Tracer:
+    """
+    Opt-in span recorder. While disabled, `span` returns a shared no-op context manager
+    and `traced` functions only pay one attribute check.
+    """
+    def __init__(self) -> None:
+        self.enabled = False
+        self.spans: List[Span] = []
+        self._local = threading.local()
+
+    def enable(self) -> None:
+        self.enabled = True
+
+    def disable(self) -> None:
+        self.enabled = False
+
+    def clear(self) -> None:
+        self.spans = []
+
+    @contextmanager
+    def recording(self) -> Iterator["Tracer"]:
+        """Clear previous spans and record everything executed inside the block"""
+        self.clear()
+        self.enable()
+        try:
+            yield self
+        finally:
+            self.disable()
+
+    def span(self, name: str, category: str = "core"):
+        """Context manager measuring the enclosed block"""
+        if not self.enabled:
+            return _NULL_SPAN
+        return _ActiveSpan(self, name, category)
+
+    def record(self, name: str, category: str, start_ns: int, end_ns: int) -> None:
+        # list.append is atomic, spans from several threads can be recorded concurrently
+        self.spans.append(Span(name, category, start_ns, end_ns - start_ns, threading.get_ident()))
+
+    def start_iterations(self) -> None:
+        """Mark the beginning of the first iteration of an optimizer loop in this thread"""
+        if self.enabled:
+            self._local.iteration_start = time.perf_counter_ns()
+
+    def end_iteration(self, name: str) -> None:
+        """Record the iteration that just finished in this thread and start timing the next one"""
+        if not self.enabled:
+            return
+        now = time.perf_counter_ns()
+        start = getattr(self._local, "iteration_start", None)
+        if start is not None:
+            self.record(name, "iteration", start, now)
+        self._local.iteration_start = now
+
+    def export_chrome_trace(self, path: str) -> None:
+        """
+        Write recorded spans in Chrome trace-event format (chrome://tracing, Perfetto, speedscope).
+        Args:
+            path (str): Output .json file.
+        """
+        events = [
+            {
+                "name": span.name,
+                "cat": span.category,
+                "ph": "X",
+                "ts": span.start_ns / 1000,
+                "dur": span.duration_ns / 1000,
+                "pid": os.getpid(),
+                "tid": span.thread_id,
+            }
+            for span in self.spans
+        ]
+        with open(path, "w") as f:
+            json.dump({"traceEvents": events, "displayTimeUnit": "ms"}, f)
+
+    def summary(self) -> Dict[str, SpanStats]:
+        """
+        Aggregate spans per name.
+        Self time excludes the time of spans nested inside (per thread).
+        Returns:
+            Dict[str, SpanStats]: Statistics sorted by total time, descending.
+        """
+        stats: Dict[str, SpanStats] = {}
+        by_thread: Dict[int, List[Span]] = {}
+        for span in self.spans:
+            by_thread.setdefault(span.thread_id, []).append(span)
+
+        for spans in by_thread.values():
+            # parents start earlier, or at the same time and last longer
+            spans.sort(key=lambda s: (s.start_ns, -s.duration_ns))
+            stack: List[List] = []  # [span, children time]
+            for span in spans + [None]:
+                while stack and (span is None or
+                                 span.start_ns >= stack[-1][0].start_ns + stack[-1][0].duration_ns):
+                    done, children_ns = stack.pop()
+                    entry = stats.setdefault(done.name, SpanStats())
+                    entry.count += 1
+                    entry.total_ns += done.duration_ns
+                    entry.self_ns += done.duration_ns - children_ns
+                    entry.max_ns = max(entry.max_ns, done.duration_ns)
+                    if stack:
+                        stack[-1][1] += done.duration_ns
+                if span is not None:
+                    stack.append([span, 0])
+        return dict(sorted(stats.items(), key=lambda item: item[1].total_ns, reverse=True))
+
+    def format_summary(self) -> str:
+        """Per-function summary as a text table"""
+        lines = [f"{'span':<36}{'count':>10}{'total ms':>12}{'self ms':>12}{'mean us':>12}{'max us':>12}"]
+        for name, entry in self.summary().items():
+            lines.append(
+                f"{name:<36}{entry.count:>10}{entry.total_ns / 1e6:>12.3f}{entry.self_ns / 1e6:>12.3f}"
+                f"{entry.total_ns / entry.count / 1e3:>12.2f}{entry.max_ns / 1e3:>12.2f}"
+            )
+        return "\n".join(lines)
+
+
+tracer = Tracer()
+
+
+def traced(name: str, category: str = "core") -> Callable:
+    """Decorator recording a span for each call of the function while tracing is enabled"""
+    def decorator(func: Callable) -> Callable:
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if not tracer.enabled:
+                return func(*args, **kwargs)
+            start = time.perf_counter_ns()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                tracer.record(name, category, start, time.perf_counter_ns())
+        return wrapper
+    return decorator
\ No newline at end of file